@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+Benchmark get_transactions plus Python filtering against budget_queries.
+
+Seeds an in-memory budget with several accounts, then times loading one
+account's uncategorized transactions both ways.
+
+Usage:
+    python benchmarks/bench_account_query.py [ROWS]
+"""
+
+import sys
+import time
+import uuid
+from pathlib import Path
+
+from sqlalchemy import insert
+from sqlmodel import Session, SQLModel, create_engine
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from actual.database import Transactions, strong_reference_session  # noqa: E402
+from actual.queries import create_account, create_category, get_transactions  # noqa: E402
+
+from budget_queries import count_account_transactions, get_account_transactions  # noqa: E402
+
+DEFAULT_ROWS = 120000
+ACCOUNTS = 6
+
+
+def make_budget(count):
+    """Create an in-memory budget with count transactions spread over ACCOUNTS accounts."""
+    engine = create_engine("sqlite://")
+    SQLModel.metadata.create_all(engine)
+    session = strong_reference_session(Session(engine))
+    accounts = [create_account(session, f"account {i}") for i in range(ACCOUNTS)]
+    category = create_category(session, "General", "Usual Expenses")
+    session.commit()
+
+    # Core inserts skip the ORM, so seeding does not generate sync messages
+    rows = [
+        {
+            'id': str(uuid.uuid4()),
+            'acct': accounts[i % ACCOUNTS].id,
+            'category_id': None if i % 4 == 0 else category.id,
+            'amount': -1250,
+            'notes': f"Imported from bank statement | Row {i}",
+            'date': 20250801 + i % 28,
+            'sort_order': i,
+            'is_parent': 0,
+            'is_child': 0,
+            'tombstone': 0,
+            'cleared': 1,
+            'reconciled': 0,
+        }
+        for i in range(count)
+    ]
+    session.execute(insert(Transactions), rows)
+    session.commit()
+    return session, accounts[0]
+
+
+def full_scan(session, account):
+    """The previous approach: load every transaction and filter in Python."""
+    return [
+        t for t in get_transactions(session)
+        if hasattr(t, 'acct') and t.acct == account.id and t.category_id is None
+    ]
+
+
+def account_query(session, account):
+    return get_account_transactions(session, account.id, uncategorized=True)
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_ROWS
+    session, account = make_budget(count)
+    print(f"{count:,} transactions in {ACCOUNTS} accounts, "
+          f"{count_account_transactions(session, account.id):,} in the queried account\n")
+
+    print(f"{'Method':<34} {'Time':>10} {'Rows':>10}")
+    print("-" * 56)
+    for name, func in [("get_transactions + Python filter", full_scan),
+                       ("get_account_transactions", account_query)]:
+        session.expunge_all()
+        start = time.perf_counter()
+        result = func(session, account)
+        elapsed = time.perf_counter() - start
+        print(f"{name:<34} {elapsed:>9.2f}s {len(result):>10,}")
+
+    session.close()
+
+
+if __name__ == "__main__":
+    main()
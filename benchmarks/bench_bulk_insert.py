@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+Benchmark per-row create_transaction against bulk_create_transactions.
+
+Runs against an in-memory budget database, so no ActualBudget server is
+needed. Reports rows/second and the sync messages generated.
+
+Usage:
+    python benchmarks/bench_bulk_insert.py [ROWS]
+"""
+
+import datetime
+import decimal
+import sys
+import time
+from pathlib import Path
+
+from sqlmodel import Session, SQLModel, create_engine
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from actual.database import strong_reference_session  # noqa: E402
+from actual.queries import create_account, create_category, create_transaction  # noqa: E402
+
+from bulk_import import bulk_create_transactions  # noqa: E402
+
+DEFAULT_ROWS = 3000
+DISTINCT_PAYEES = 300
+
+
+def make_budget():
+    """Create an empty in-memory budget with one account and category."""
+    engine = create_engine("sqlite://")
+    SQLModel.metadata.create_all(engine)
+    session = strong_reference_session(Session(engine))
+    account = create_account(session, "icici")
+    category = create_category(session, "General", "Usual Expenses")
+    session.flush()
+    session.info["messages"] = []
+    return session, account, category
+
+
+def make_rows(count, category_id):
+    """Build import rows shaped like parsed statement transactions."""
+    return [
+        {
+            'date': datetime.date(2025, 8, 1) + datetime.timedelta(days=i % 30),
+            'payee': f"UPI MERCHANT {i % DISTINCT_PAYEES}",
+            'notes': f"Page {i // 30 + 1} | Balance: ₹{500000 - i * 12.5:,.2f}",
+            'amount': decimal.Decimal("-12.50"),
+            'category_id': category_id
+        }
+        for i in range(count)
+    ]
+
+
+def per_row(session, account, rows):
+    """The previous import loop: create_transaction then set the category."""
+    for row in rows:
+        txn = create_transaction(
+            session,
+            row['date'],
+            account,
+            row['payee'],
+            notes=row['notes'],
+            amount=row['amount']
+        )
+        txn.category_id = row['category_id']
+    session.flush()
+
+
+def bulk(session, account, rows):
+    bulk_create_transactions(session, account.id, rows)
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_ROWS
+
+    print(f"{count:,} transactions, {DISTINCT_PAYEES} distinct payees\n")
+    print(f"{'Method':<28} {'Time':>10} {'Rows/sec':>12} {'Messages':>10}")
+    print("-" * 64)
+    for name, func in [("create_transaction per row", per_row), ("bulk_create_transactions", bulk)]:
+        session, account, category = make_budget()
+        rows = make_rows(count, category.id)
+
+        start = time.perf_counter()
+        func(session, account, rows)
+        elapsed = time.perf_counter() - start
+
+        messages = len(session.info.get("messages", []))
+        print(f"{name:<28} {elapsed:>9.2f}s {count / elapsed:>12,.0f} {messages:>10,}")
+        session.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+Benchmark the compiled rule matcher against checking every rule in turn.
+
+Generates RULES keyword rules (plus a few regex, mode and amount rules) and
+DESCRIPTIONS UPI-style descriptions, then reports descriptions/second.
+
+Usage:
+    python benchmarks/bench_categorizer.py [RULES] [DESCRIPTIONS]
+"""
+
+import random
+import string
+import sys
+import time
+from decimal import Decimal
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from categorizer import _conditions_hold, categorize_all, compile_rules, transaction_mode  # noqa: E402
+
+DEFAULT_RULES = 3000
+DEFAULT_DESCRIPTIONS = 30000
+CATEGORIES = ["Food", "Transport", "Rent", "Shopping", "Bills", "Medical"]
+
+
+def random_word(rng, length):
+    return ''.join(rng.choice(string.ascii_lowercase) for _ in range(length))
+
+
+SPECIAL_RULES = [
+    {"category": "Transport", "regex": r"\bauto\b", "max_amount": 500},
+    {"category": "Bills", "mode": "ACH", "direction": "withdrawal"},
+    {"category": "Income", "mode": "NEFT", "direction": "deposit"},
+]
+
+
+def make_rules(rng, count):
+    """Keyword rules, with a regex, mode or amount rule every 100th rule."""
+    return [
+        SPECIAL_RULES[(i // 100) % len(SPECIAL_RULES)] if i % 100 == 0
+        else {"category": rng.choice(CATEGORIES), "contains": [random_word(rng, rng.randint(5, 9))]}
+        for i in range(count)
+    ]
+
+
+def make_descriptions(rng, count, rules):
+    keywords = [rule['contains'][0] for rule in rules if 'contains' in rule]
+    descriptions = []
+    for _ in range(count):
+        words = [random_word(rng, rng.randint(3, 10)) for _ in range(4)]
+        if rng.random() < 0.5:
+            words.insert(2, rng.choice(keywords))
+        mode = rng.choice(["UPI", "UPI", "UPI", "NEFT", "ACH"])
+        ref = ''.join(rng.choice(string.digits) for _ in range(12))
+        descriptions.append((f"{mode} {' '.join(words)} YES BANK {ref}", Decimal(-rng.randint(10, 5000))))
+    return descriptions
+
+
+def linear(rules, transactions):
+    """Check each rule in order with plain substring tests."""
+    matcher = compile_rules(rules)
+    keywords = [rule.get('contains', []) for rule in rules]
+    results = []
+    for description, amount in transactions:
+        text = description.lower()
+        mode = transaction_mode(description)
+        category = None
+        for rule, rule_keywords in zip(matcher['rules'], keywords):
+            if rule_keywords and not any(k in text for k in rule_keywords):
+                continue
+            if _conditions_hold(rule, description, mode, amount):
+                category = rule['category']
+                break
+        results.append(category)
+    return results
+
+
+def compiled(rules, transactions):
+    """Compile the rules and match the whole batch."""
+    return categorize_all(compile_rules(rules), transactions)
+
+
+def main():
+    rule_count = int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_RULES
+    description_count = int(sys.argv[2]) if len(sys.argv) > 2 else DEFAULT_DESCRIPTIONS
+    rng = random.Random(42)
+
+    rules = make_rules(rng, rule_count)
+    transactions = make_descriptions(rng, description_count, rules)
+
+    start = time.perf_counter()
+    compile_rules(rules)
+    compile_time = time.perf_counter() - start
+    print(f"{rule_count:,} rules compiled in {compile_time * 1000:.1f} ms, "
+          f"{description_count:,} descriptions\n")
+
+    print(f"{'Method':<24} {'Time':>10} {'Desc/sec':>12} {'Matched':>10}")
+    print("-" * 60)
+    results = {}
+    for name, func in [("rule by rule", linear), ("compiled matcher", compiled)]:
+        start = time.perf_counter()
+        results[name] = func(rules, transactions)
+        elapsed = time.perf_counter() - start
+        matched = sum(1 for category in results[name] if category)
+        print(f"{name:<24} {elapsed:>9.2f}s {description_count / elapsed:>12,.0f} {matched:>10,}")
+
+    if results["rule by rule"] != results["compiled matcher"]:
+        print("\n❌ Results differ!")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
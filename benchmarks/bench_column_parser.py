@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Benchmark the column-geometry parser against the page text pipeline.
+
+Times, per statement, the text pipeline (uncached page text extraction,
+the page total checks of process_bank_statement and balance-tracking
+parsing) against parse_statement_columns, which reads spans with their
+positions and checks each page against its Total: row. Also confirms both
+produce the same transactions.
+
+Usage:
+    python benchmarks/bench_column_parser.py pdfs/*.pdf
+"""
+
+import contextlib
+import io
+import os
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from import_detailed import parse_individual_transactions  # noqa: E402
+from pdf_reader_ocr import extract_text_from_pdf, process_bank_statement  # noqa: E402
+from statement_columns import parse_statement_columns  # noqa: E402
+
+PDF_PASSWORD = os.environ.get("PDF_PASSWORD", "guru2111")
+REPEATS = 5
+
+
+def text_pipeline(pdf_path):
+    pages_text = extract_text_from_pdf(pdf_path, PDF_PASSWORD, use_cache=False)
+    summary = process_bank_statement(pdf_path, PDF_PASSWORD, pages_text=pages_text)
+    return parse_individual_transactions(pages_text, summary['starting_balance'])
+
+
+def column_pipeline(pdf_path):
+    return parse_statement_columns(pdf_path, PDF_PASSWORD)['transactions']
+
+
+def best_time(func, pdf_path):
+    best = None
+    for _ in range(REPEATS):
+        with contextlib.redirect_stdout(io.StringIO()):
+            start = time.perf_counter()
+            result = func(pdf_path)
+            elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+
+def main():
+    pdf_paths = sys.argv[1:]
+    if not pdf_paths:
+        print("Usage: python benchmarks/bench_column_parser.py pdfs/*.pdf")
+        sys.exit(1)
+
+    print(f"Best of {REPEATS}\n")
+    print(f"{'Statement':<18} {'Rows':>5} {'Text':>9} {'Columns':>9} {'Same rows':>10}")
+    print("-" * 55)
+    text_total = column_total = 0
+    for pdf_path in pdf_paths:
+        text_time, text_rows = best_time(text_pipeline, pdf_path)
+        column_time, column_rows = best_time(column_pipeline, pdf_path)
+        text_total += text_time
+        column_total += column_time
+        print(f"{Path(pdf_path).name:<18} {len(text_rows):>5} {text_time * 1000:>7.1f}ms "
+              f"{column_time * 1000:>7.1f}ms {str(text_rows == column_rows):>10}")
+    print("-" * 55)
+    print(f"{'Total':<18} {'':>5} {text_total * 1000:>7.1f}ms {column_total * 1000:>7.1f}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+Benchmark the parse + convert stage of the money pipeline.
+
+Takes the amount strings of every dated row and turns them into the signed
+amounts handed to ActualBudget, three ways:
+
+    float:   float() per amount, float balance subtraction, then
+             Decimal(str(...)) per row (the previous pipeline)
+    Decimal: Decimal per amount and exact subtraction, nothing to convert
+             (the current pipeline)
+    paise:   integer paise per amount, converted to Decimal per row
+
+Also reports how many rows the float pipeline gets wrong by more than half
+a paisa before rounding, and whether its running totals still reconcile.
+
+Usage:
+    python benchmarks/bench_money.py              # synthetic statement pages
+    python benchmarks/bench_money.py pdfs/*.pdf   # real statements (PDF_PASSWORD)
+"""
+
+import sys
+import time
+from decimal import Decimal
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from bench_parser import REPEATS, pdf_pages, synthetic_pages  # noqa: E402
+from statement_parser import AMOUNT_PATTERN, DATE_PATTERN  # noqa: E402
+
+CENT = Decimal('0.01')
+
+
+def amount_rows(pages):
+    """Return the raw amount strings of each row as (transaction, balance) pairs."""
+    rows = []
+    for page in pages:
+        pending = []
+        for line in page.split('\n'):
+            if DATE_PATTERN.match(line.strip()):
+                pending = []
+            pending.extend(AMOUNT_PATTERN.findall(line))
+            if len(pending) == 2:
+                rows.append(tuple(pending))
+                pending = []
+    return rows
+
+
+def float_pipeline(rows):
+    amounts = []
+    balance = None
+    for _, balance_text in rows:
+        new_balance = float(balance_text.replace(',', ''))
+        if balance is not None:
+            amounts.append(Decimal(str(new_balance - balance)))
+        balance = new_balance
+    return amounts
+
+
+def decimal_pipeline(rows):
+    amounts = []
+    balance = None
+    for _, balance_text in rows:
+        new_balance = Decimal(balance_text.replace(',', ''))
+        if balance is not None:
+            amounts.append(new_balance - balance)
+        balance = new_balance
+    return amounts
+
+
+def paise_pipeline(rows):
+    amounts = []
+    balance = None
+    for _, balance_text in rows:
+        new_balance = int(balance_text.replace(',', '').replace('.', ''))
+        if balance is not None:
+            amounts.append(Decimal(new_balance - balance).scaleb(-2))
+        balance = new_balance
+    return amounts
+
+
+def time_call(func, rows):
+    best = None
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        result = func(rows)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+
+def main():
+    pages = pdf_pages(sys.argv[1:]) if len(sys.argv) > 1 else synthetic_pages()
+    rows = amount_rows(pages) * (1 if len(sys.argv) > 1 else 10)
+    print(f"{len(rows):,} rows, best of {REPEATS}\n")
+
+    print(f"{'Pipeline':<10} {'Time':>10} {'Rows/sec':>14}")
+    print("-" * 36)
+    results = {}
+    for name, func in [("float", float_pipeline), ("Decimal", decimal_pipeline), ("paise", paise_pipeline)]:
+        elapsed, results[name] = time_call(func, rows)
+        print(f"{name:<10} {elapsed * 1000:>8.1f}ms {len(rows) / elapsed:>14,.0f}")
+
+    exact = results["Decimal"]
+    assert exact == results["paise"]
+    inexact = sum(1 for f, d in zip(results["float"], exact) if f != d)
+    drift = sum(results["float"]) - sum(exact)
+    print(f"\nfloat amounts not exactly in paise: {inexact:,} of {len(exact):,}")
+    print(f"float running total drift: {drift.quantize(CENT) if abs(drift) >= CENT else drift}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Benchmark page text extraction of one long PDF across worker processes.
+
+Builds a consolidated statement by repeating the sample statements (or
+synthetic pages when none are given) up to the requested page count and
+times extract_text_from_pdf with 1, 2, 4, ... worker processes up to the
+CPU count.
+
+The consolidated file is written unencrypted: PyMuPDF's save-time
+encryption garbles copied statement pages. The per-worker cost of opening
+and authenticating an encrypted statement is timed on the given PDFs
+instead.
+
+Usage:
+    python benchmarks/bench_parallel_extraction.py [PAGES] [pdfs/*.pdf]
+"""
+
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import pymupdf
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from pdf_reader_ocr import extract_text_from_pdf, open_pdf  # noqa: E402
+
+DEFAULT_PAGES = 360
+PDF_PASSWORD = os.environ.get("PDF_PASSWORD", "guru2111")
+REPEATS = 3
+
+
+def build_statement(path, page_count, sources):
+    """Write a PDF of page_count pages copied from sources."""
+    doc = pymupdf.open()
+    source_docs = [open_pdf(source, PDF_PASSWORD) for source in sources]
+    while len(doc) < page_count:
+        if not source_docs:
+            page = doc.new_page()
+            page.insert_text((72, 72), "\n".join(f"01-08-2025  UPI/Shop {i}  {i},000.00" for i in range(40)))
+            continue
+        for source in source_docs:
+            doc.insert_pdf(source, to_page=min(len(source), page_count - len(doc)) - 1)
+            if len(doc) >= page_count:
+                break
+    for source in source_docs:
+        source.close()
+    doc.save(path)
+    doc.close()
+
+
+def time_open(sources):
+    """Best time to open and authenticate one of the source statements."""
+    best = None
+    for source in sources:
+        for _ in range(REPEATS):
+            start = time.perf_counter()
+            open_pdf(source, PDF_PASSWORD).close()
+            elapsed = time.perf_counter() - start
+            best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def main():
+    args = sys.argv[1:]
+    page_count = int(args.pop(0)) if args and args[0].isdigit() else DEFAULT_PAGES
+    cpus = os.cpu_count() or 1
+    worker_counts = sorted({1, 2, cpus} | {n for n in (4, 8, 16) if n <= cpus})
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "consolidated.pdf"
+        build_statement(path, page_count, args)
+        print(f"{page_count} pages, {cpus} CPU(s), best of {REPEATS}\n")
+
+        print(f"{'Workers':>7} {'Time':>10} {'Pages/sec':>11} {'Speedup':>9}")
+        print("-" * 40)
+        baseline = None
+        expected = None
+        for workers in worker_counts:
+            best = None
+            for _ in range(REPEATS):
+                start = time.perf_counter()
+                pages_text = extract_text_from_pdf(path, PDF_PASSWORD, use_cache=False, workers=workers)
+                elapsed = time.perf_counter() - start
+                best = elapsed if best is None else min(best, elapsed)
+            expected = expected or pages_text
+            assert pages_text == expected
+            baseline = baseline or best
+            print(f"{workers:>7} {best * 1000:>8.0f}ms {page_count / best:>11,.0f} {baseline / best:>8.2f}x")
+
+    if args:
+        print(f"\nOpen + authenticate per worker: {time_open(args) * 1000:.1f}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,329 @@
+#!/usr/bin/env python3
+"""
+Benchmark the single-pass statement parser against the previous look-ahead
+parsers it replaced.
+
+Usage:
+    python benchmarks/bench_parser.py              # synthetic statement pages
+    python benchmarks/bench_parser.py pdfs/*.pdf   # real statements (PDF_PASSWORD)
+"""
+
+import contextlib
+import io
+import re
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from import_detailed import parse_individual_transactions  # noqa: E402
+from pdf_reader_ocr import extract_transactions_from_page_text  # noqa: E402
+
+PDF_PASSWORD = "guru2111"
+SYNTHETIC_PAGES = 200
+ROWS_PER_PAGE = 30
+REPEATS = 5
+
+
+# ============================================================================
+# PREVIOUS IMPLEMENTATIONS (nested while loops with up-to-10-line look-ahead)
+# ============================================================================
+
+def legacy_parse_individual_transactions(pages_text, starting_balance):
+    """
+    Parse individual transactions from PDF text pages.
+    Uses balance tracking to determine deposit vs withdrawal.
+    """
+    all_transactions = []
+    date_pattern = re.compile(r'^(\d{2}-\d{2}-\d{4})')
+    
+    current_balance = starting_balance
+    
+    for page_num, page_text in enumerate(pages_text, 1):
+        lines = page_text.split('\n')
+        
+        i = 0
+        while i < len(lines):
+            line = lines[i].strip()
+            date_match = date_pattern.match(line)
+            
+            if date_match:
+                date_str = date_match.group(1)
+                
+                # Skip B/F and Total lines
+                if i + 1 < len(lines):
+                    next_line = lines[i + 1].strip()
+                    if next_line in ['B/F', 'C/F'] or 'Total:' in next_line:
+                        i += 2
+                        continue
+                
+                # Collect description (next 1-4 lines until we hit amounts)
+                description_parts = []
+                j = i + 1
+                amounts = []
+                
+                while j < len(lines) and j < i + 10:
+                    check_line = lines[j].strip()
+                    
+                    if date_pattern.match(check_line) or check_line in ['Total:', 'B/F', 'C/F']:
+                        break
+                    
+                    # Find amounts
+                    found_amounts = re.findall(r'([\d,]+\.\d{2})', check_line)
+                    if found_amounts:
+                        for amt in found_amounts:
+                            amounts.append(float(amt.replace(',', '')))
+                        if len(amounts) >= 2:
+                            break
+                    elif check_line and check_line not in ['/', '']:
+                        description_parts.append(check_line)
+                    
+                    j += 1
+                
+                # Parse transaction if we have amounts
+                if len(amounts) >= 2:
+                    # Last amount is new balance
+                    new_balance = amounts[-1]
+                    balance_change = new_balance - current_balance
+                    
+                    if balance_change > 0:
+                        deposit = balance_change
+                        withdrawal = 0.0
+                    else:
+                        deposit = 0.0
+                        withdrawal = abs(balance_change)
+                    
+                    description = ' '.join(description_parts[:3]).replace('/', ' ')[:100]
+                    
+                    all_transactions.append({
+                        'date': date_str,
+                        'description': description if description else 'Transaction',
+                        'deposit': deposit,
+                        'withdrawal': withdrawal,
+                        'balance': new_balance,
+                        'page': page_num
+                    })
+                    
+                    current_balance = new_balance
+                
+                i = j
+            else:
+                i += 1
+    
+    return all_transactions
+
+
+
+def legacy_extract_transactions_from_page_text(page_text, page_num):
+    """
+    Extract individual transactions from page text using regex patterns.
+    Bank statement format:
+    DATE | MODE | PARTICULARS | DEPOSITS | WITHDRAWALS | BALANCE
+    
+    Args:
+        page_text: Extracted text from PDF page
+        page_num: Page number (for reference)
+    
+    Returns:
+        List of transaction dictionaries
+    """
+    transactions = []
+    lines = page_text.split('\n')
+    
+    # Pattern: date at start of line (DD-MM-YYYY)
+    date_pattern = re.compile(r'^(\d{2}-\d{2}-\d{4})')
+    
+    i = 0
+    while i < len(lines):
+        line = lines[i].strip()
+        
+        # Check if line starts with a date
+        date_match = date_pattern.match(line)
+        if date_match:
+            date_str = date_match.group(1)
+            
+            # Skip B/F and Total lines
+            if i + 1 < len(lines):
+                next_line = lines[i + 1].strip()
+                if next_line in ['B/F', 'Total:', ''] or 'Total:' in next_line:
+                    i += 1
+                    continue
+            
+            # Collect description and amounts from this and next few lines
+            description_parts = []
+            amounts_found = []
+            
+            # Look ahead for description and amounts (typically in next 2-6 lines)
+            j = i + 1
+            while j < len(lines) and j < i + 10:
+                next_line = lines[j].strip()
+                
+                # Stop if we hit another date
+                if date_pattern.match(next_line):
+                    break
+                
+                # Stop if we hit Total or B/F or C/F
+                if next_line in ['Total:', 'B/F', 'C/F', ''] or 'Total:' in next_line:
+                    break
+                
+                # Check if line contains amounts (numbers with decimals)
+                amount_matches = re.findall(r'([\d,]+\.\d{2})', next_line)
+                if amount_matches:
+                    # Store amounts
+                    for amt in amount_matches:
+                        amounts_found.append(float(amt.replace(',', '')))
+                    # After finding amounts, description is complete
+                    if len(amounts_found) >= 2:  # Have transaction amount + balance
+                        break
+                else:
+                    # This is description text
+                    if next_line and not next_line.isdigit() and next_line not in ['/']:
+                        description_parts.append(next_line)
+                
+                j += 1
+            
+            # Parse amounts based on format
+            # Format is typically: [deposit OR withdrawal], balance
+            # Last amount is always balance
+            # If 2 amounts: one is transaction, one is balance
+            # If 3 amounts: could be deposit, withdrawal, balance OR description has number + transaction + balance
+            
+            deposit = 0.0
+            withdrawal = 0.0
+            balance = 0.0
+            
+            if len(amounts_found) >= 2:
+                # Last amount is balance
+                balance = amounts_found[-1]
+                
+                # Determine if previous transactions had balances to compare
+                prev_balance = transactions[-1]['balance'] if transactions else 0.0
+                if page_num == 1 and not transactions:
+                    # First transaction on first page - check for B/F balance
+                    for k in range(max(0, i-10), i):
+                        if 'B/F' in lines[k]:
+                            # Look for balance near B/F
+                            for m in range(k, min(k+5, len(lines))):
+                                bf_amounts = re.findall(r'([\d,]+\.\d{2})', lines[m])
+                                if bf_amounts:
+                                    prev_balance = float(bf_amounts[-1].replace(',', ''))
+                                    break
+                            break
+                
+                # Compare balance to determine deposit vs withdrawal
+                transaction_amount = amounts_found[0] if len(amounts_found) >= 2 else 0.0
+                
+                if prev_balance > 0:
+                    if balance > prev_balance:
+                        # Balance increased - deposit
+                        deposit = transaction_amount
+                    else:
+                        # Balance decreased - withdrawal
+                        withdrawal = transaction_amount
+                else:
+                    # First transaction or no previous balance - use balance change
+                    # Check all amounts to see if middle one makes sense
+                    if len(amounts_found) == 2:
+                        # Could be either - mark as deposit for now (will be corrected)
+                        deposit = transaction_amount
+            
+            # Build description
+            description = ' '.join(description_parts[:4])  # Limit to first 4 parts
+            description = description.replace('/', ' ')  # Clean up slashes
+            
+            if amounts_found:  # Only add if we found amounts
+                transactions.append({
+                    'date': date_str,
+                    'description': description[:100] if description else 'Transaction',
+                    'deposit': deposit,
+                    'withdrawal': withdrawal,
+                    'balance': balance
+                })
+            
+            i = j  # Jump to where we stopped looking ahead
+        else:
+            i += 1
+    
+    print(f"Page {page_num}: Extracted {len(transactions)} transactions")
+    return transactions
+
+
+
+# ============================================================================
+# BENCHMARK
+# ============================================================================
+
+def synthetic_pages(page_count=SYNTHETIC_PAGES, rows_per_page=ROWS_PER_PAGE):
+    """Build statement-like page texts in the layout PyMuPDF extracts."""
+    pages = []
+    balance = 500000.00
+    for page_num in range(1, page_count + 1):
+        lines = ["DATE", "MODE", "PARTICULARS", "DEPOSITS", "WITHDRAWALS", "BALANCE"]
+        if page_num == 1:
+            lines += ["01-08-2025 ", "B/F", " ", f"{balance:,.2f}"]
+        for row in range(rows_per_page):
+            amount = 100.00 + row * 7.25
+            balance += amount if row % 5 == 0 else -amount
+            lines += [
+                f"{(row % 28) + 1:02d}-08-2025 ",
+                f"UPI/MERCHANT {row}/paytmqr{row}@/dinner/YES BANK ",
+                f"L/5579902{row:05d}/ICI78ebc618100f42d198d26322370c26e2/",
+                f"{amount:,.2f}",
+                f"{balance:,.2f}",
+            ]
+        lines += ["Total:", "0.00", "0.00", f"{balance:,.2f}", f"Page {page_num} of {page_count}", ""]
+        pages.append('\n'.join(lines))
+    return pages
+
+
+def pdf_pages(pdf_paths):
+    """Extract page texts from real statements."""
+    from pdf_reader_ocr import extract_text_from_pdf
+
+    pages = []
+    for pdf_path in pdf_paths:
+        pages.extend(extract_text_from_pdf(pdf_path, PDF_PASSWORD))
+    return pages
+
+
+def time_call(func, repeats=REPEATS):
+    """Return the best wall-clock time of func() over repeats runs."""
+    best = None
+    for _ in range(repeats):
+        with contextlib.redirect_stdout(io.StringIO()):
+            start = time.perf_counter()
+            func()
+            elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def main():
+    pages = pdf_pages(sys.argv[1:]) if len(sys.argv) > 1 else synthetic_pages()
+    line_count = sum(page.count('\n') + 1 for page in pages)
+
+    def per_page(func):
+        return lambda: [func(page, i) for i, page in enumerate(pages, 1)]
+
+    cases = [
+        ("parse_individual_transactions (legacy)",
+         lambda: legacy_parse_individual_transactions(pages, 0.0)),
+        ("parse_individual_transactions",
+         lambda: parse_individual_transactions(pages, 0.0)),
+        ("extract_transactions_from_page_text (legacy)",
+         per_page(legacy_extract_transactions_from_page_text)),
+        ("extract_transactions_from_page_text",
+         per_page(extract_transactions_from_page_text)),
+    ]
+
+    print(f"{len(pages)} pages, {line_count:,} lines, best of {REPEATS}\n")
+    print(f"{'Parser':<48} {'Time':>10} {'Lines/sec':>14}")
+    print("-" * 74)
+    for name, func in cases:
+        elapsed = time_call(func)
+        print(f"{name:<48} {elapsed * 1000:>8.1f}ms {line_count / elapsed:>14,.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Benchmark NumPy span bucketing against the pure Python bisect version.
+
+Times both ways of assigning a page's spans to rows and columns on every
+statement page, then on synthetic pages built by stacking one page's table
+rows to find where the vectorized version starts to pay off (see
+NUMPY_MIN_SPANS). Also confirms both give the same buckets.
+
+Usage:
+    python benchmarks/bench_span_bucketing.py pdfs/*.pdf
+"""
+
+import os
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import statement_columns  # noqa: E402
+from pdf_reader_ocr import open_pdf  # noqa: E402
+from statement_columns import LINE_TOLERANCE, detect_columns, page_spans  # noqa: E402
+
+PDF_PASSWORD = os.environ.get("PDF_PASSWORD", "guru2111")
+REPEATS = 20
+STACKS = (1, 2, 4, 8, 16, 32)
+
+
+def per_call(func, spans, columns):
+    best = None
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        func(spans, columns)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def stacked_page(spans, columns, copies):
+    """Repeat a page's table rows below each other, keeping the header."""
+    top = columns['y'] + LINE_TOLERANCE
+    header = [span for span in spans if span[1] <= top]
+    table = []
+    for span in spans:
+        if span[1] <= top:
+            continue
+        if span[3] == 'Total:':
+            break
+        table.append(span)
+    height = table[-1][1] - table[0][1] + 10 * LINE_TOLERANCE
+    return header + [(x0, y + height * copy, x1, text)
+                     for copy in range(copies) for x0, y, x1, text in table]
+
+
+def main():
+    if statement_columns.np is None:
+        print("❌ NumPy is not installed")
+        sys.exit(1)
+    pdf_paths = sys.argv[1:]
+    if not pdf_paths:
+        print("Usage: python benchmarks/bench_span_bucketing.py pdfs/*.pdf")
+        sys.exit(1)
+
+    pages = []
+    for pdf_path in pdf_paths:
+        doc = open_pdf(pdf_path, PDF_PASSWORD)
+        for page in doc:
+            spans = page_spans(page)
+            columns = detect_columns(spans)
+            if columns is not None:
+                pages.append((spans, columns))
+        doc.close()
+
+    python_bucketing = statement_columns._bucket_spans_python
+    numpy_bucketing = statement_columns._bucket_spans_numpy
+    same = all(python_bucketing(spans, columns) == numpy_bucketing(spans, columns) for spans, columns in pages)
+    python_total = sum(per_call(python_bucketing, spans, columns) for spans, columns in pages)
+    numpy_total = sum(per_call(numpy_bucketing, spans, columns) for spans, columns in pages)
+    average_spans = sum(len(spans) for spans, _ in pages) / len(pages)
+
+    print(f"Best of {REPEATS}\n")
+    print(f"Statement pages: {len(pages)} (avg {average_spans:.0f} spans), same buckets: {same}")
+    print(f"  Python: {python_total / len(pages) * 1e6:7.1f} µs/page")
+    print(f"  NumPy:  {numpy_total / len(pages) * 1e6:7.1f} µs/page\n")
+
+    spans, columns = max(pages, key=lambda page: len(page[0]))
+    print(f"{'Spans':>6} {'Python':>10} {'NumPy':>10} {'Speedup':>8}")
+    print("-" * 37)
+    for copies in STACKS:
+        big = stacked_page(spans, columns, copies)
+        python_time = per_call(python_bucketing, big, columns)
+        numpy_time = per_call(numpy_bucketing, big, columns)
+        print(f"{len(big):>6} {python_time * 1e6:>8.0f}µs {numpy_time * 1e6:>8.0f}µs "
+              f"{python_time / numpy_time:>7.2f}x")
+    print(f"\nNUMPY_MIN_SPANS = {statement_columns.NUMPY_MIN_SPANS}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+Benchmark per-row dicts against the slotted Transaction record.
+
+Builds a multi-year history of parsed transactions both ways and reports
+the memory they hold (tracemalloc) and the time to build them and to sum
+their deposits and withdrawals the way the verifier does.
+
+Usage:
+    python benchmarks/bench_transaction_record.py [ROWS]
+"""
+
+import sys
+import time
+import tracemalloc
+from decimal import Decimal
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from statement_parser import ZERO, Transaction  # noqa: E402
+
+DEFAULT_ROWS = 200000
+REPEATS = 5
+
+
+def make_dict(i, amount, balance):
+    return {
+        'date': '01-08-2025',
+        'description': 'UPI Saravanan breakfast',
+        'payee': 'Saravanan',
+        'deposit': ZERO,
+        'withdrawal': amount,
+        'balance': balance,
+        'page': i // 40 + 1
+    }
+
+
+def make_record(i, amount, balance):
+    return Transaction(
+        date='01-08-2025',
+        description='UPI Saravanan breakfast',
+        withdrawal=amount,
+        balance=balance,
+        page=i // 40 + 1,
+        payee='Saravanan'
+    )
+
+
+def build(factory, amounts):
+    return [factory(i, amount, balance) for i, (amount, balance) in enumerate(amounts)]
+
+
+def measure(factory, amounts):
+    """Return (bytes held, best build seconds) for a history built with factory."""
+    tracemalloc.start()
+    rows = build(factory, amounts)
+    held = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del rows
+
+    best = None
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        build(factory, amounts)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return held, best
+
+
+def time_sums(rows, total):
+    best = None
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        total(rows)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_ROWS
+    # Shared amount objects, as the parser hands the same Decimals to every row
+    amounts = [(Decimal(f"{i % 500 + 1}.00"), Decimal(f"{100000 + i}.05")) for i in range(count)]
+    print(f"{count:,} transactions, best of {REPEATS}\n")
+
+    dict_bytes, dict_build = measure(make_dict, amounts)
+    record_bytes, record_build = measure(make_record, amounts)
+
+    dict_sum = time_sums(build(make_dict, amounts),
+                         lambda rows: (sum(t['deposit'] for t in rows), sum(t['withdrawal'] for t in rows)))
+    record_sum = time_sums(build(make_record, amounts),
+                           lambda rows: (sum(t.deposit for t in rows), sum(t.withdrawal for t in rows)))
+
+    print(f"{'Row type':<12} {'Memory':>10} {'Per row':>9} {'Build':>10} {'Sum':>10}")
+    print("-" * 55)
+    for name, held, build_time, sum_time in [("dict", dict_bytes, dict_build, dict_sum),
+                                             ("Transaction", record_bytes, record_build, record_sum)]:
+        print(f"{name:<12} {held / 2**20:>8.1f}MB {held / count:>7.0f}B "
+              f"{build_time * 1000:>8.1f}ms {sum_time * 1000:>8.1f}ms")
+    print(f"\nMemory saved: {1 - record_bytes / dict_bytes:.0%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,175 @@
+"""
+Account-scoped transaction queries for ActualBudget.
+
+actualpy's get_transactions returns every transaction in the budget with
+its account, category and payee eagerly loaded. The helpers here push the
+account, category and notes filters into the SQL query and load only the
+matching transaction rows.
+
+get_name_ids keeps name -> id maps of accounts, categories and payees in
+the session, so scripts resolve names with a dict lookup instead of a query
+and a linear scan each time.
+"""
+
+import sqlalchemy
+from sqlmodel import select
+
+from actual.database import Accounts, Categories, Payees, Transactions
+from actual.protobuf_models import Message
+from actual.utils.conversions import date_to_int
+
+DELETE_BATCH_SIZE = 500
+
+
+def account_transactions_query(account_id: str = None, uncategorized: bool = False, notes_contains: str = None,
+                               start_date=None, end_date=None, columns=None, include_parents: bool = False):
+    """
+    Build a query for the live (non-deleted, non-split-parent) transactions.
+
+    Args:
+        account_id: Only transactions in this account (None for all accounts)
+        uncategorized: Only transactions without a category
+        notes_contains: Only transactions whose notes contain this text
+            (case-insensitive)
+        start_date: Only transactions on or after this date
+        end_date: Only transactions before this date
+        columns: Optional columns to select instead of full Transactions rows
+        include_parents: Also match split parent transactions
+
+    Returns:
+        SQLModel select statement
+    """
+    query = select(*columns) if columns else select(Transactions)
+    query = query.where(sqlalchemy.func.coalesce(Transactions.tombstone, 0) == 0)
+    if not include_parents:
+        query = query.where(sqlalchemy.func.coalesce(Transactions.is_parent, 0) == 0)
+    if account_id is not None:
+        query = query.where(Transactions.acct == account_id)
+    if uncategorized:
+        query = query.where(Transactions.category_id.is_(None))
+    if notes_contains:
+        escaped = notes_contains.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
+        query = query.where(Transactions.notes.ilike(f"%{escaped}%", escape='\\'))
+    if start_date is not None:
+        query = query.where(Transactions.date >= date_to_int(start_date))
+    if end_date is not None:
+        query = query.where(Transactions.date < date_to_int(end_date))
+    return query
+
+
+def get_account_transactions(session, account_id: str = None, **filters) -> list:
+    """
+    Load the transactions matching the filters of account_transactions_query.
+
+    Related account, category and payee rows are not loaded.
+    """
+    return list(session.exec(account_transactions_query(account_id, **filters)))
+
+
+def count_account_transactions(session, account_id: str = None, **filters) -> int:
+    """Count the transactions matching the filters without loading them."""
+    query = account_transactions_query(account_id, columns=[sqlalchemy.func.count(Transactions.id)], **filters)
+    return session.exec(query).one()
+
+
+def tombstone_account_transactions(session, account_id: str, start_date=None, end_date=None,
+                                   batch_size: int = DELETE_BATCH_SIZE) -> int:
+    """
+    Delete an account's transactions with set-based updates.
+
+    Actual never hard deletes rows, it sets their tombstone. Only the ids are
+    selected; each batch is tombstoned with one UPDATE and gets a tombstone
+    sync message in session.info["messages"], the same place the session's
+    before_flush hook puts them, so actual.commit() sends the deletes to the
+    server. Split parents and their children are both removed.
+
+    Args:
+        session: Session from the Actual local database (actual.session)
+        account_id: Id of the account to clear
+        start_date: Only transactions on or after this date
+        end_date: Only transactions before this date
+        batch_size: Number of transactions tombstoned per statement
+
+    Returns:
+        Number of transactions deleted. Nothing is committed.
+    """
+    # Write out pending changes so they are not lost when the session is expired below
+    session.flush()
+    query = account_transactions_query(account_id, start_date=start_date, end_date=end_date,
+                                       columns=[Transactions.id], include_parents=True)
+    ids = list(session.exec(query))
+
+    messages = session.info.setdefault("messages", [])
+    for start in range(0, len(ids), batch_size):
+        batch = ids[start:start + batch_size]
+        session.execute(
+            sqlalchemy.update(Transactions)
+            .where(Transactions.id.in_(batch))
+            .values(tombstone=1)
+            .execution_options(synchronize_session=False)
+        )
+        for transaction_id in batch:
+            message = Message(dict(dataset="transactions", row=transaction_id, column="tombstone"))
+            message.set_value(1)
+            messages.append(message)
+
+    # Loaded rows would otherwise still show tombstone 0
+    session.expire_all()
+    return len(ids)
+
+
+def _name_ids_query(table: str):
+    if table == 'accounts':
+        return select(Accounts.name, Accounts.id).where(sqlalchemy.func.coalesce(Accounts.tombstone, 0) == 0)
+    if table == 'categories':
+        return select(Categories.name, Categories.id).where(sqlalchemy.func.coalesce(Categories.tombstone, 0) == 0)
+    if table == 'payees':
+        # Transfer payees are named after accounts and never matched by name
+        return select(Payees.name, Payees.id).where(
+            sqlalchemy.func.coalesce(Payees.tombstone, 0) == 0,
+            Payees.transfer_acct.is_(None)
+        )
+    raise ValueError(f"Unknown table for name lookups: {table}")
+
+
+def load_name_ids(session, table: str) -> dict:
+    """
+    Load a name -> id map of 'accounts', 'categories' or 'payees' with one query.
+
+    Only the two columns are selected, so no related rows are loaded. When
+    names repeat the first row wins.
+    """
+    name_ids = {}
+    for name, row_id in session.exec(_name_ids_query(table)):
+        if name and name not in name_ids:
+            name_ids[name] = row_id
+    return name_ids
+
+
+def _clear_name_ids(session, *args):
+    session.info.pop("name_ids", None)
+
+
+def get_name_ids(session, table: str) -> dict:
+    """
+    Return the session's cached name -> id map of a table.
+
+    The map is loaded on first use and dropped when the session commits or
+    rolls back. Callers that create an account, category or payee should add
+    it to the returned dict so later lookups in the same session see it.
+    """
+    cache = session.info.get("name_ids")
+    if cache is None:
+        if not session.info.get("name_ids_listening"):
+            sqlalchemy.event.listen(session, "after_commit", _clear_name_ids)
+            sqlalchemy.event.listen(session, "after_soft_rollback", _clear_name_ids)
+            session.info["name_ids_listening"] = True
+        cache = session.info["name_ids"] = {}
+    if table not in cache:
+        cache[table] = load_name_ids(session, table)
+    return cache[table]
+
+
+def lookup_id(session, table: str, name: str):
+    """Return the id of the account, category or payee with this name, or None."""
+    return get_name_ids(session, table).get(name)
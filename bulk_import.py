@@ -0,0 +1,131 @@
+"""
+Bulk transaction inserts for ActualBudget.
+
+actualpy's create_transaction looks up the account and payee with a query
+per call, and every query autoflushes the rows added so far. Here the
+account, payee and category ids are resolved up front, rows are added
+with autoflush disabled and the session is flushed once per batch, which
+is also when actualpy turns the new rows into sync messages.
+
+Rows may carry an 'imported_id' (stored as the transaction's financial id).
+Ids already present in the account are skipped, which makes re-importing
+the same statement a no-op.
+"""
+
+import sqlalchemy
+from sqlmodel import select
+
+from actual.database import Transactions
+from actual.queries import create_payee, create_transaction_from_ids
+from actual.utils.conversions import cents_to_decimal, int_to_date
+
+from budget_queries import get_name_ids
+
+BATCH_SIZE = 500
+
+
+def _clear_imported_ids(session, *args):
+    session.info.pop("imported_ids", None)
+
+
+def load_imported_ids(session, account_id: str) -> set:
+    """
+    Return the set of imported ids already in an account.
+
+    The set is loaded with a single query the first time and kept in
+    session.info, so every statement imported through the same session
+    shares it. bulk_create_transactions adds the ids it inserts before they
+    are committed, so the set is dropped when the session rolls back.
+    """
+    if not session.info.get("imported_ids_listening"):
+        sqlalchemy.event.listen(session, "after_soft_rollback", _clear_imported_ids)
+        session.info["imported_ids_listening"] = True
+    cache = session.info.setdefault("imported_ids", {})
+    if account_id not in cache:
+        query = select(Transactions.financial_id).where(
+            Transactions.acct == account_id,
+            sqlalchemy.func.coalesce(Transactions.tombstone, 0) == 0,
+            Transactions.financial_id.is_not(None)
+        )
+        cache[account_id] = set(session.exec(query))
+    return cache[account_id]
+
+
+def get_account_checkpoint(session, account_id: str):
+    """
+    Return the date of an account's latest transaction and its balance.
+
+    Both come from one aggregate query. Split parents are excluded since
+    their children already carry the amounts.
+
+    Returns:
+        Tuple of (datetime.date, decimal.Decimal), or None for an empty account
+    """
+    query = select(sqlalchemy.func.max(Transactions.date), sqlalchemy.func.sum(Transactions.amount)).where(
+        Transactions.acct == account_id,
+        sqlalchemy.func.coalesce(Transactions.tombstone, 0) == 0,
+        sqlalchemy.func.coalesce(Transactions.is_parent, 0) == 0
+    )
+    last_date, balance_cents = session.exec(query).one()
+    if last_date is None:
+        return None
+    return int_to_date(last_date), cents_to_decimal(balance_cents or 0)
+
+
+def bulk_create_transactions(session, account_id: str, rows, batch_size: int = BATCH_SIZE,
+                             payee_ids: dict = None, skip_imported: bool = True) -> int:
+    """
+    Add many transactions to an open budget session.
+
+    Args:
+        session: Session from the Actual local database (actual.session)
+        account_id: Id of the account the transactions belong to
+        rows: Iterable of dicts with 'date' (datetime.date), 'payee' (str),
+            'notes' (str), 'amount' (decimal.Decimal) and optional
+            'category_id' and 'imported_id'
+        batch_size: Number of rows added between flushes
+        payee_ids: Optional name -> id map, e.g. from budget_queries.load_name_ids
+            (default: the session's cached map from get_name_ids). Payees
+            created here are added to it so it can be reused across calls.
+        skip_imported: Skip rows whose imported_id is already in the account
+
+    Returns:
+        Number of transactions created. Nothing is committed.
+    """
+    if payee_ids is None:
+        payee_ids = get_name_ids(session, 'payees')
+    imported_ids = load_imported_ids(session, account_id) if skip_imported else set()
+
+    created = 0
+    with session.no_autoflush:
+        for row in rows:
+            imported_id = row.get('imported_id')
+            if imported_id is not None:
+                if imported_id in imported_ids:
+                    continue
+                imported_ids.add(imported_id)
+
+            payee_name = row['payee']
+            payee_id = payee_ids.get(payee_name)
+            if payee_id is None:
+                payee_id = create_payee(session, payee_name).id
+                payee_ids[payee_name] = payee_id
+
+            create_transaction_from_ids(
+                session,
+                row['date'],
+                account_id,
+                payee_id,
+                row['notes'],
+                category_id=row.get('category_id'),
+                amount=row['amount'],
+                imported_id=imported_id,
+                process_payee=False
+            )
+            created += 1
+
+            if created % batch_size == 0:
+                session.flush()
+
+    session.flush()
+    return created
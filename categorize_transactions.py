@@ -4,7 +4,8 @@ Categorize all transactions in ActualBudget account as Food.
 """
 
 from actual import Actual
-from actual.queries import get_transactions, get_account, get_categories
+
+from budget_queries import count_account_transactions, get_account_transactions, get_name_ids, lookup_id
 
 ACTUAL_SERVER_URL = "http://localhost:5006"
 ACTUAL_PASSWORD = "guru123"
@@ -26,59 +27,44 @@ def categorize_all_as_food():
             file=ACTUAL_FILE
         ) as actual:
             # Get the account
-            account = get_account(actual.session, ACTUAL_ACCOUNT_NAME)
-            if not account:
+            account_id = lookup_id(actual.session, 'accounts', ACTUAL_ACCOUNT_NAME)
+            if not account_id:
                 print(f"❌ Account '{ACTUAL_ACCOUNT_NAME}' not found!")
                 return
             
-            print(f"✓ Found account: {ACTUAL_ACCOUNT_NAME} (ID: {account.id})")
+            print(f"✓ Found account: {ACTUAL_ACCOUNT_NAME} (ID: {account_id})")
             
             # Get Food category
-            categories = get_categories(actual.session)
-            food_category = None
-            for cat in categories:
-                if cat.name == CATEGORY_NAME:
-                    food_category = cat
-                    break
+            category_ids = get_name_ids(actual.session, 'categories')
+            food_category_id = category_ids.get(CATEGORY_NAME)
             
-            if not food_category:
+            if not food_category_id:
                 print(f"❌ Category '{CATEGORY_NAME}' not found!")
                 print("Available categories:")
-                for cat in categories:
-                    print(f"  - {cat.name}")
+                for name in category_ids:
+                    print(f"  - {name}")
                 return
             
-            print(f"✓ Found category: {CATEGORY_NAME} (ID: {food_category.id})")
-            
-            # Get all transactions for this account
-            all_transactions = get_transactions(actual.session)
+            print(f"✓ Found category: {CATEGORY_NAME} (ID: {food_category_id})")
             
-            # Filter by account - try both 'acct' and 'account'
-            account_transactions = []
-            for t in all_transactions:
-                if hasattr(t, 'acct') and t.acct == account.id:
-                    account_transactions.append(t)
-                elif hasattr(t, 'account') and t.account == account.id:
-                    account_transactions.append(t)
+            # Count this account's transactions without loading them
+            total_count = count_account_transactions(actual.session, account_id)
             
-            if not account_transactions:
+            if not total_count:
                 print(f"✓ No transactions found for account {ACTUAL_ACCOUNT_NAME}")
                 return
             
-            print(f"✓ Found {len(account_transactions)} transaction(s)")
+            print(f"✓ Found {total_count} transaction(s)")
+            
+            # Load only the uncategorized ones
+            uncategorized = get_account_transactions(actual.session, account_id, uncategorized=True)
             
-            # Update category for all uncategorized transactions (skip income)
+            # Update category for all uncategorized transactions
             print(f"\n📝 Updating categories...")
             updated_count = 0
-            skipped_count = 0
-            for txn in account_transactions:
-                # Skip if already has a category
-                if hasattr(txn, 'category_id') and txn.category_id is not None:
-                    skipped_count += 1
-                    continue
-                
-                # Set category_id for uncategorized transactions
-                txn.category_id = food_category.id
+            skipped_count = total_count - len(uncategorized)
+            for txn in uncategorized:
+                txn.category_id = food_category_id
                 updated_count += 1
             
             # Commit changes
@@ -0,0 +1,237 @@
+"""
+Rule-based transaction categorization.
+
+Rules are plain dicts, checked in order; the first rule whose conditions
+all hold gives the category:
+
+    {"category": "Food", "contains": ["breakfast", "lunch", "dinner"]}
+    {"category": "Transport", "regex": "\\bauto\\b", "max_amount": 500}
+    {"category": "Rent", "contains": "rent", "min_amount": 1000, "direction": "withdrawal"}
+    {"category": "Salary", "mode": "NEFT", "direction": "deposit"}
+
+Conditions:
+    contains: Substring (or list of substrings, any of them) of the
+        description, case-insensitive
+    regex: Regular expression searched in the description, case-insensitive
+    mode: Transaction mode (or list of modes) such as UPI, NEFT or ACH, the
+        first field of the particulars (see transaction_mode)
+    min_amount / max_amount: Inclusive bounds on the absolute amount
+    direction: "deposit" or "withdrawal"
+
+compile_rules turns the substrings of every rule into one Aho-Corasick
+automaton, so a description is scanned once no matter how many rules there
+are. Only the rules it hits, plus the rules without substrings, are then
+checked in order.
+"""
+
+import heapq
+import json
+import re
+from decimal import Decimal
+from pathlib import Path
+
+from payees import split_fields
+
+RULES_PATH = Path(__file__).parent / "categorization_rules.json"
+
+RULE_KEYS = {'category', 'contains', 'regex', 'mode', 'min_amount', 'max_amount', 'direction'}
+DIRECTIONS = ('deposit', 'withdrawal')
+
+
+def load_rules(path=RULES_PATH):
+    """
+    Load rules from a JSON file holding a list of rule dicts.
+
+    Returns:
+        List of rules, empty if the file does not exist
+    """
+    path = Path(path)
+    if not path.exists():
+        return []
+    with open(path, encoding='utf-8') as f:
+        return json.load(f)
+
+
+def _as_list(value):
+    if value is None:
+        return []
+    return [value] if isinstance(value, str) else list(value)
+
+
+def _build_automaton(keywords):
+    """
+    Build an Aho-Corasick automaton.
+
+    Args:
+        keywords: Iterable of (lowercase keyword, rule index) pairs
+
+    Returns:
+        Tuple of (goto, fail, output) lists indexed by state: goto maps a
+        character to the next state, fail is the failure link and output
+        the rule indices whose keywords end in that state
+    """
+    goto = [{}]
+    output = [set()]
+    for keyword, rule_index in keywords:
+        state = 0
+        for ch in keyword:
+            next_state = goto[state].get(ch)
+            if next_state is None:
+                next_state = len(goto)
+                goto[state][ch] = next_state
+                goto.append({})
+                output.append(set())
+            state = next_state
+        output[state].add(rule_index)
+
+    # Breadth-first pass to set failure links; each state also reports the
+    # keywords of the states its failure chain reaches
+    fail = [0] * len(goto)
+    queue = list(goto[0].values())
+    for state in queue:
+        for ch, next_state in goto[state].items():
+            queue.append(next_state)
+            fallback = fail[state]
+            while fallback and ch not in goto[fallback]:
+                fallback = fail[fallback]
+            fail[next_state] = goto[fallback].get(ch, 0)
+            output[next_state] |= output[fail[next_state]]
+
+    return goto, fail, [tuple(sorted(rule_indices)) for rule_indices in output]
+
+
+def compile_rules(rules):
+    """
+    Validate rules and compile them into a matcher for match_rule.
+
+    Args:
+        rules: List of rule dicts (see module docstring)
+
+    Returns:
+        Matcher dict
+
+    Raises:
+        ValueError: If a rule has no category, an unknown key or an invalid
+            direction or regex
+    """
+    compiled = []
+    keywords = []
+    unkeyed = []
+
+    for index, rule in enumerate(rules):
+        unknown = set(rule) - RULE_KEYS
+        if unknown:
+            raise ValueError(f"Rule {index}: unknown key(s) {', '.join(sorted(unknown))}")
+        if not rule.get('category'):
+            raise ValueError(f"Rule {index}: missing 'category'")
+        direction = rule.get('direction')
+        if direction is not None and direction not in DIRECTIONS:
+            raise ValueError(f"Rule {index}: direction must be 'deposit' or 'withdrawal'")
+        try:
+            regex = re.compile(rule['regex'], re.IGNORECASE) if rule.get('regex') else None
+        except re.error as e:
+            raise ValueError(f"Rule {index}: invalid regex: {e}") from e
+
+        contains = [s.lower() for s in _as_list(rule.get('contains')) if s]
+        compiled.append({
+            'category': rule['category'],
+            'regex': regex,
+            'modes': {m.upper() for m in _as_list(rule.get('mode'))},
+            'min_amount': Decimal(str(rule['min_amount'])) if rule.get('min_amount') is not None else None,
+            'max_amount': Decimal(str(rule['max_amount'])) if rule.get('max_amount') is not None else None,
+            'direction': direction
+        })
+        if contains:
+            keywords.extend((keyword, index) for keyword in contains)
+        else:
+            unkeyed.append(index)
+
+    goto, fail, output = _build_automaton(keywords)
+    return {'rules': compiled, 'goto': goto, 'fail': fail, 'output': output, 'unkeyed': unkeyed}
+
+
+def _keyword_hits(matcher, text):
+    """Return the indices of the rules with a substring in text, in one pass."""
+    goto = matcher['goto']
+    fail = matcher['fail']
+    output = matcher['output']
+    hits = set()
+    state = 0
+    for ch in text:
+        while state and ch not in goto[state]:
+            state = fail[state]
+        state = goto[state].get(ch, 0)
+        if output[state]:
+            hits.update(output[state])
+    return hits
+
+
+def transaction_mode(description):
+    """
+    Return the transaction mode of a description (e.g. UPI, NEFT or IMPS).
+
+    The mode is the first token of the particulars, split on slashes,
+    whitespace and the hyphens of NEFT-UTR-NAME rows. MMT IMPS transfers
+    count as IMPS.
+    """
+    words = ' '.join(split_fields(description)[:2]).upper().split()
+    if not words:
+        return ''
+    if words[0] == 'MMT' and len(words) > 1 and words[1] == 'IMPS':
+        return 'IMPS'
+    return words[0]
+
+
+def _conditions_hold(rule, description, mode, amount):
+    if rule['regex'] is not None and not rule['regex'].search(description):
+        return False
+    if rule['modes'] and mode not in rule['modes']:
+        return False
+    if rule['direction'] == 'deposit' and amount <= 0:
+        return False
+    if rule['direction'] == 'withdrawal' and amount >= 0:
+        return False
+    magnitude = abs(amount)
+    if rule['min_amount'] is not None and magnitude < rule['min_amount']:
+        return False
+    if rule['max_amount'] is not None and magnitude > rule['max_amount']:
+        return False
+    return True
+
+
+def match_rule(matcher, description, amount):
+    """
+    Find the category of the first rule matching a transaction.
+
+    Args:
+        matcher: Matcher from compile_rules
+        description: Transaction description or payee name
+        amount: Signed amount, positive for deposits
+
+    Returns:
+        Category name, or None if no rule matches
+    """
+    description = description or ''
+    amount = Decimal(str(amount))
+    mode = transaction_mode(description)
+    hits = sorted(_keyword_hits(matcher, description.lower()))
+
+    for index in heapq.merge(hits, matcher['unkeyed']):
+        rule = matcher['rules'][index]
+        if _conditions_hold(rule, description, mode, amount):
+            return rule['category']
+    return None
+
+
+def categorize_all(matcher, transactions):
+    """
+    Match a batch of transactions.
+
+    Args:
+        matcher: Matcher from compile_rules
+        transactions: Iterable of (description, amount) pairs
+
+    Returns:
+        List of category names (None where no rule matches)
+    """
+    return [match_rule(matcher, description, amount) for description, amount in transactions]
@@ -4,8 +4,12 @@ Import all bank statement PDFs to ActualBudget in chronological order.
 """
 
 import sys
+import argparse
+import contextlib
+import io
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from import_detailed import import_detailed_transactions
+from import_detailed import import_detailed_transactions, open_actual, parse_statement
 
 PDF_PASSWORD = "guru2111"
 PDFS_DIR = "pdfs"
@@ -20,8 +24,27 @@ PDF_ORDER = [
     "Nov_2025.pdf"
 ]
 
-def import_all_pdfs():
-    """Import all PDFs in chronological order."""
+def parse_statement_captured(pdf_path, password):
+    """
+    Parse a statement in a worker process.
+
+    Returns:
+        Tuple of (parse_statement result, the progress output it printed),
+        so the parent can show page total warnings in statement order
+    """
+    output = io.StringIO()
+    with contextlib.redirect_stdout(output):
+        parsed = parse_statement(pdf_path, password)
+    return parsed, output.getvalue()
+
+
+def import_all_pdfs(jobs: int = 1):
+    """
+    Import all PDFs in chronological order.
+    
+    With jobs > 1, statements are parsed concurrently in a process pool while
+    the ActualBudget writes still happen one statement at a time, in order.
+    """
     
     print("=" * 100)
     print("   IMPORTING ALL BANK STATEMENTS TO ACTUALBUDGET")
@@ -49,25 +72,53 @@ def import_all_pdfs():
         print("❌ Cancelled")
         return
     
+    # Parse every statement up front in worker processes
+    pool = None
+    futures = {}
+    if jobs > 1:
+        print(f"\n⚙️  Parsing {len(PDF_ORDER)} statements with {jobs} workers...")
+        pool = ProcessPoolExecutor(max_workers=jobs)
+    
     # Import each PDF
     success_count = 0
-    for i, filename in enumerate(PDF_ORDER, 1):
-        pdf_path = pdfs_path / filename
-        print(f"\n{'='*100}")
-        print(f"[{i}/{len(PDF_ORDER)}] Processing {filename}...")
-        print('='*100)
+    try:
+        if pool is not None:
+            futures = {
+                filename: pool.submit(parse_statement_captured, str(pdfs_path / filename), PDF_PASSWORD)
+                for filename in PDF_ORDER
+            }
         
-        try:
-            import_detailed_transactions(str(pdf_path), password=PDF_PASSWORD, dry_run=False)
-            success_count += 1
-        except Exception as e:
-            print(f"❌ Error importing {filename}: {e}")
-            import traceback
-            traceback.print_exc()
+        # Open the budget once and reuse the session for every statement
+        with open_actual() as actual:
+            for i, filename in enumerate(PDF_ORDER, 1):
+                pdf_path = pdfs_path / filename
+                print(f"\n{'='*100}")
+                print(f"[{i}/{len(PDF_ORDER)}] Processing {filename}...")
+                print('='*100)
             
-            response = input("\nContinue with remaining PDFs? (yes/no): ")
-            if response.lower() != 'yes':
-                break
+                try:
+                    parsed = None
+                    if filename in futures:
+                        parsed, output = futures[filename].result()
+                        print(output, end='')
+                    imported = import_detailed_transactions(str(pdf_path), password=PDF_PASSWORD, dry_run=False,
+                                                            parsed=parsed, actual=actual)
+                except Exception as e:
+                    print(f"❌ Error importing {filename}: {e}")
+                    import traceback
+                    traceback.print_exc()
+                    imported = False
+                
+                if imported:
+                    success_count += 1
+                else:
+                    response = input("\nContinue with remaining PDFs? (yes/no): ")
+                    if response.lower() != 'yes':
+                        break
+    finally:
+        # Also on errors and Ctrl-C, so queued parses don't keep the interpreter alive
+        if pool is not None:
+            pool.shutdown(cancel_futures=True)
     
     # Summary
     print("\n" + "=" * 100)
@@ -81,5 +132,14 @@ def import_all_pdfs():
         print(f"\n⚠️  {len(PDF_ORDER) - success_count} PDF(s) failed to import")
 
 
+def main():
+    parser = argparse.ArgumentParser(description='Import all bank statements to ActualBudget in chronological order')
+    parser.add_argument('--jobs', '-j', type=int, default=1,
+                        help='Parse statements in this many worker processes (default: 1, sequential)')
+    
+    args = parser.parse_args()
+    import_all_pdfs(jobs=args.jobs)
+
+
 if __name__ == "__main__":
-    import_all_pdfs()
+    main()
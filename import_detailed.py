@@ -8,13 +8,20 @@ import sys
 import argparse
 import decimal
 import datetime
-import re
+import hashlib
 from pathlib import Path
 
 from actual import Actual
-from actual.queries import create_transaction, get_account, create_account, get_categories
+from actual.queries import create_account
 
+from budget_queries import get_name_ids
+from bulk_import import bulk_create_transactions, get_account_checkpoint
+from categorizer import compile_rules, load_rules, match_rule
+from page_cache import file_sha256
+from payees import build_payee_index, canonical_payee, normalize_payee
 from pdf_reader_ocr import extract_text_from_pdf, process_bank_statement
+from statement_columns import parse_statement_columns
+from statement_parser import ZERO, Transaction, parse_rows, row_description, to_amount
 
 # Configuration
 ACTUAL_SERVER_URL = "http://localhost:5006"
@@ -24,88 +31,109 @@ ACTUAL_ACCOUNT_NAME = "icici"
 PDF_PASSWORD = "guru2111"
 
 
-def parse_individual_transactions(pages_text, starting_balance):
+def iter_transactions(pages_text, starting_balance=None):
     """
-    Parse individual transactions from PDF text pages.
+    Yield individual transactions page by page as the text is parsed.
+    
+    The running balance is carried across pages, so pages_text may be any
+    iterable of page texts, such as iter_pages(), and transactions are
+    available before later pages have been decoded.
     Uses balance tracking to determine deposit vs withdrawal.
-    """
-    all_transactions = []
-    date_pattern = re.compile(r'^(\d{2}-\d{2}-\d{4})')
     
-    current_balance = starting_balance
+    To stream several statements, chain one iter_transactions per statement
+    (e.g. with itertools.chain.from_iterable) so each starts from its own
+    B/F balance and a missing month does not skew its first transaction.
+    
+    Args:
+        pages_text: Iterable of page text strings
+        starting_balance: Opening balance, or None to take it from the
+            first B/F row
+    
+    Yields:
+        Transaction records; amounts are exact Decimals
+    """
+    current_balance = to_amount(starting_balance) if starting_balance is not None else None
     
     for page_num, page_text in enumerate(pages_text, 1):
-        lines = page_text.split('\n')
-        
-        i = 0
-        while i < len(lines):
-            line = lines[i].strip()
-            date_match = date_pattern.match(line)
+        for row in parse_rows(page_text):
+            amounts = row['amounts']
+            if row['marker'] == 'B/F' and current_balance is None:
+                current_balance = amounts[-1]
+            if row['marker'] or len(amounts) < 2:
+                continue
+            
+            # Last amount is new balance
+            new_balance = amounts[-1]
+            balance_change = new_balance - (current_balance or ZERO)
             
-            if date_match:
-                date_str = date_match.group(1)
-                
-                # Skip B/F and Total lines
-                if i + 1 < len(lines):
-                    next_line = lines[i + 1].strip()
-                    if next_line in ['B/F', 'C/F'] or 'Total:' in next_line:
-                        i += 2
-                        continue
-                
-                # Collect description (next 1-4 lines until we hit amounts)
-                description_parts = []
-                j = i + 1
-                amounts = []
-                
-                while j < len(lines) and j < i + 10:
-                    check_line = lines[j].strip()
-                    
-                    if date_pattern.match(check_line) or check_line in ['Total:', 'B/F', 'C/F']:
-                        break
-                    
-                    # Find amounts
-                    found_amounts = re.findall(r'([\d,]+\.\d{2})', check_line)
-                    if found_amounts:
-                        for amt in found_amounts:
-                            amounts.append(float(amt.replace(',', '')))
-                        if len(amounts) >= 2:
-                            break
-                    elif check_line and check_line not in ['/', '']:
-                        description_parts.append(check_line)
-                    
-                    j += 1
-                
-                # Parse transaction if we have amounts
-                if len(amounts) >= 2:
-                    # Last amount is new balance
-                    new_balance = amounts[-1]
-                    balance_change = new_balance - current_balance
-                    
-                    if balance_change > 0:
-                        deposit = balance_change
-                        withdrawal = 0.0
-                    else:
-                        deposit = 0.0
-                        withdrawal = abs(balance_change)
-                    
-                    description = ' '.join(description_parts[:3]).replace('/', ' ')[:100]
-                    
-                    all_transactions.append({
-                        'date': date_str,
-                        'description': description if description else 'Transaction',
-                        'deposit': deposit,
-                        'withdrawal': withdrawal,
-                        'balance': new_balance,
-                        'page': page_num
-                    })
-                    
-                    current_balance = new_balance
-                
-                i = j
+            if balance_change > 0:
+                deposit = balance_change
+                withdrawal = ZERO
             else:
-                i += 1
+                deposit = ZERO
+                withdrawal = abs(balance_change)
+            
+            yield Transaction(
+                date=row['date'],
+                description=row_description(row['description_parts']),
+                deposit=deposit,
+                withdrawal=withdrawal,
+                balance=new_balance,
+                page=page_num,
+                payee=normalize_payee(' '.join(row['description_parts']))
+            )
+            
+            current_balance = new_balance
+
+
+def parse_individual_transactions(pages_text, starting_balance):
+    """
+    Parse individual transactions from PDF text pages.
+    Uses balance tracking to determine deposit vs withdrawal.
+    """
+    return list(iter_transactions(pages_text, starting_balance))
+
+
+def import_fingerprint(statement_hash: str, *parts) -> str:
+    """
+    Build the imported id that identifies a statement row in ActualBudget.
     
-    return all_transactions
+    Descriptions are normalized (case and whitespace) so cosmetic parser
+    changes do not defeat de-duplication.
+    """
+    normalized = [' '.join(str(part).lower().split()) for part in parts]
+    raw = '|'.join([statement_hash] + normalized)
+    return "pdf:" + hashlib.sha256(raw.encode('utf-8')).hexdigest()[:32]
+
+
+def transaction_fingerprint(txn_data: Transaction, statement_hash: str) -> str:
+    """Imported id of a parsed transaction (date, amount, balance, description)."""
+    return import_fingerprint(statement_hash, txn_data.date, f"{txn_data.amount:.2f}",
+                              f"{txn_data.balance:.2f}", txn_data.description)
+
+
+def transactions_after_checkpoint(transactions: list, last_date: datetime.date, balance,
+                                  starting_balance: decimal.Decimal = None) -> list:
+    """
+    Return the transactions that follow an import checkpoint.
+    
+    The checkpoint is the last row dated on or before last_date whose
+    running balance equals balance. A statement that starts at exactly that
+    balance (the next month's statement) follows the checkpoint entirely.
+    
+    Returns:
+        The remaining transactions, or None if no row matches the checkpoint
+    """
+    balance = to_amount(balance)
+    for i in range(len(transactions) - 1, -1, -1):
+        txn = transactions[i]
+        if parse_date(txn.date) <= last_date and txn.balance == balance:
+            return transactions[i + 1:]
+    
+    if (starting_balance is not None and starting_balance == balance
+            and (not transactions or parse_date(transactions[0].date) >= last_date)):
+        return transactions
+    return None
 
 
 def parse_date(date_str: str) -> datetime.date:
@@ -117,24 +145,81 @@ def parse_date(date_str: str) -> datetime.date:
         return datetime.date.today()
 
 
-def import_detailed_transactions(pdf_path: str, password: str = None, dry_run: bool = False):
-    """Import individual transactions from PDF to ActualBudget."""
+def parse_statement(pdf_path: str, password: str = None, workers: int = 1, columns: bool = False) -> dict:
+    """
+    Extract and parse a statement without touching ActualBudget.
     
-    print("=" * 80)
-    print(f"   IMPORTING DETAILED TRANSACTIONS: {Path(pdf_path).name}")
-    print("=" * 80)
+    Returns a plain dict so it can be computed in a worker process and
+    handed back to import_detailed_transactions. With workers > 1, the page
+    text of a long statement is extracted in that many processes. With
+    columns, the statement is read by column geometry instead (see
+    statement_columns), which needs neither the LLM nor balance tracking.
+    If any page's rows don't add up to its Total: row, the column result is
+    dropped and the statement is parsed from its page text as usual.
+    
+    Returns:
+        Dictionary with 'summary' (from process_bank_statement),
+        'transactions' (from parse_individual_transactions) and
+        'statement_hash' (SHA-256 of the PDF, used for import fingerprints)
+    """
+    if columns:
+        print("\nReading transactions by column...")
+        parsed = parse_statement_columns(pdf_path, password)
+        if not parsed['mismatched_pages']:
+            return {'summary': parsed['summary'], 'transactions': parsed['transactions'],
+                    'statement_hash': file_sha256(pdf_path)}
+        pages = ', '.join(str(page_num) for page_num in parsed['mismatched_pages'])
+        print(f"   ⚠️  Page(s) {pages} don't add up to their Total: row, parsing the page text instead")
+    
+    # Extract page text once and share it between both steps
+    print("\nExtracting text from PDF...")
+    pages_text = extract_text_from_pdf(pdf_path, password, workers=workers)
     
     # Get verified summary first
     print("\n1. Getting verified summary...")
-    summary = process_bank_statement(pdf_path, password)
+    summary = process_bank_statement(pdf_path, password, pages_text=pages_text)
     
     print(f"\n2. Parsing individual transactions...")
-    pages_text = extract_text_from_pdf(pdf_path, password)
     transactions = parse_individual_transactions(pages_text, summary['starting_balance'])
     
+    return {'summary': summary, 'transactions': transactions, 'statement_hash': file_sha256(pdf_path)}
+
+
+def import_detailed_transactions(pdf_path: str, password: str = None, dry_run: bool = False, parsed: dict = None,
+                                 actual: Actual = None, commit: bool = True, incremental: bool = False,
+                                 rules: dict = None, workers: int = 1, columns: bool = False):
+    """
+    Import individual transactions from PDF to ActualBudget.
+    
+    Pass the result of parse_statement as parsed to skip parsing here, and an
+    open Actual session as actual to reuse it instead of opening the budget.
+    With incremental, only transactions after the account's last imported
+    balance are posted (see post_transactions). rules is a compiled
+    categorization matcher (see categorizer). workers and columns choose how
+    the statement is parsed (see parse_statement).
+    
+    If posting fails, the session is rolled back so none of the statement's
+    rows or sync messages go out with a later commit. On a shared session
+    this also discards earlier statements that were not committed yet.
+    
+    Returns:
+        True if the statement was imported (or previewed with dry_run),
+        False if posting it failed
+    """
+    
+    print("=" * 80)
+    print(f"   IMPORTING DETAILED TRANSACTIONS: {Path(pdf_path).name}")
+    print("=" * 80)
+    
+    if parsed is None:
+        parsed = parse_statement(pdf_path, password, workers, columns)
+    summary = parsed['summary']
+    transactions = parsed['transactions']
+    statement_hash = parsed.get('statement_hash')
+    
     # Calculate totals
-    calc_deposits = sum(t['deposit'] for t in transactions)
-    calc_withdrawals = sum(t['withdrawal'] for t in transactions)
+    calc_deposits = sum(t.deposit for t in transactions)
+    calc_withdrawals = sum(t.withdrawal for t in transactions)
     
     print(f"\n📊 Summary:")
     print(f"   Starting Balance: ₹{summary['starting_balance']:,.2f}")
@@ -147,7 +232,8 @@ def import_detailed_transactions(pdf_path: str, password: str = None, dry_run: b
     calc_final = summary['starting_balance'] + calc_deposits - calc_withdrawals
     print(f"\n   Verification: ₹{summary['starting_balance']:,.2f} + ₹{calc_deposits:,.2f} - ₹{calc_withdrawals:,.2f} = ₹{calc_final:,.2f}")
     
-    if abs(calc_final - summary['final_balance']) > 1.0:
+    # Amounts are exact Decimals, so any difference is a real discrepancy
+    if calc_final != summary['final_balance']:
         print(f"   ⚠️  Warning: Calculated balance doesn't match statement (diff: ₹{abs(calc_final - summary['final_balance']):.2f})")
     else:
         print(f"   ✅ Balance verification passed!")
@@ -156,103 +242,236 @@ def import_detailed_transactions(pdf_path: str, password: str = None, dry_run: b
         print("\n🔍 DRY RUN - Not posting to ActualBudget")
         print("\nFirst 10 transactions:")
         for i, txn in enumerate(transactions[:10], 1):
-            amount = txn['deposit'] if txn['deposit'] > 0 else -txn['withdrawal']
-            print(f"  {i:2d}. {txn['date']} | {txn['description'][:45]:45s} | ₹{amount:10,.2f}")
-        return
+            print(f"  {i:2d}. {txn.date} | {txn.description[:45]:45s} | ₹{txn.amount:10,.2f}")
+        return True
     
     # Import to ActualBudget
+    if actual is not None:
+        try:
+            post_transactions(actual, summary, transactions, commit=commit,
+                              statement_hash=statement_hash, incremental=incremental, rules=rules)
+            return True
+        except Exception as e:
+            # Discard the statement's staged rows so the next commit doesn't send them
+            actual.session.rollback()
+            print(f"❌ Error: {e}")
+            import traceback
+            traceback.print_exc()
+            return False
+    
     try:
-        with Actual(
-            base_url=ACTUAL_SERVER_URL,
-            password=ACTUAL_PASSWORD,
-            file=ACTUAL_FILE
-        ) as actual:
-            account = get_account(actual.session, ACTUAL_ACCOUNT_NAME)
-            if not account:
-                print(f"\n✓ Creating account: {ACTUAL_ACCOUNT_NAME}")
-                account = create_account(actual.session, ACTUAL_ACCOUNT_NAME)
+        with open_actual() as actual:
+            post_transactions(actual, summary, transactions, commit=commit,
+                              statement_hash=statement_hash, incremental=incremental, rules=rules)
+        return True
+    except Exception as e:
+        print(f"❌ Error: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
+def open_actual() -> Actual:
+    """Open the configured ActualBudget budget file (use as a context manager)."""
+    return Actual(
+        base_url=ACTUAL_SERVER_URL,
+        password=ACTUAL_PASSWORD,
+        file=ACTUAL_FILE
+    )
+
+
+def post_transactions(actual: Actual, summary: dict, transactions: list, commit: bool = True,
+                      statement_hash: str = None, incremental: bool = False, rules: dict = None) -> int:
+    """
+    Create the opening balance and individual transactions in an open budget.
+    
+    With statement_hash, every row gets an import fingerprint and rows
+    already imported into the account are skipped, so re-running an import
+    only adds new transactions.
+    
+    With incremental, the account's latest date and balance are read from
+    ActualBudget and only the transactions after the matching point in the
+    statement are posted, without a new opening balance. An empty account
+    gets the whole statement.
+    
+    Transactions are categorized by the first matching rule (see
+    categorizer). Deposits no rule matches go to Income, withdrawals to
+    General.
+    
+    Args:
+        actual: Open Actual session
+        summary: Statement summary from process_bank_statement
+        transactions: Parsed transactions from parse_individual_transactions
+        commit: Commit to the server once the statement has been added
+        statement_hash: SHA-256 of the statement PDF
+        incremental: Only post transactions after the account's checkpoint
+        rules: Matcher from categorizer.compile_rules (default: the rules in
+            categorization_rules.json)
+    
+    Returns:
+        Number of transactions created (0 if required categories are missing)
+    
+    Raises:
+        RuntimeError: With incremental, if the account already has
+            transactions and no parsed row matches its checkpoint. Posting
+            the whole statement and a new opening balance would count the
+            account's balance twice.
+    """
+    # Names are resolved through the session's lookup cache
+    account_ids = get_name_ids(actual.session, 'accounts')
+    account_id = account_ids.get(ACTUAL_ACCOUNT_NAME)
+    if account_id is None:
+        print(f"\n✓ Creating account: {ACTUAL_ACCOUNT_NAME}")
+        account_id = account_ids[ACTUAL_ACCOUNT_NAME] = create_account(actual.session, ACTUAL_ACCOUNT_NAME).id
+    else:
+        print(f"\n✓ Using existing account: {ACTUAL_ACCOUNT_NAME}")
+    
+    # Get categories
+    category_ids = get_name_ids(actual.session, 'categories')
+    income_category_id = category_ids.get("Income")
+    general_category_id = category_ids.get("General")
+    
+    if not income_category_id:
+        print("❌ 'Income' category not found! Please create it in ActualBudget.")
+        return 0
+    if not general_category_id:
+        print("❌ 'General' category not found! Please create it in ActualBudget.")
+        return 0
+    
+    if rules is None:
+        rules = compile_rules(load_rules())
+    missing_categories = set()
+    
+    # Spellings of a payee already in the budget win over new ones
+    payee_index = build_payee_index(get_name_ids(actual.session, 'payees'))
+    
+    tail = None
+    if incremental:
+        checkpoint = get_account_checkpoint(actual.session, account_id)
+        if checkpoint:
+            last_date, balance = checkpoint
+            tail = transactions_after_checkpoint(transactions, last_date, balance, summary['starting_balance'])
+            if tail is None:
+                raise RuntimeError(f"No transaction matches the account balance ₹{balance:,.2f} on {last_date}; "
+                                   f"import the statements in between first or import without --incremental")
             else:
-                print(f"\n✓ Using existing account: {ACTUAL_ACCOUNT_NAME}")
-            
-            # Get categories
-            categories = get_categories(actual.session)
-            income_category = None
-            general_category = None
-            for cat in categories:
-                if cat.name == "Income":
-                    income_category = cat
-                elif cat.name == "General":
-                    general_category = cat
-            
-            if not income_category:
-                print("❌ 'Income' category not found! Please create it in ActualBudget.")
-                return
-            if not general_category:
-                print("❌ 'General' category not found! Please create it in ActualBudget.")
-                return
-            
-            transactions_created = 0
-            
-            # Create opening balance - NO CATEGORY (it's not income, it's just starting balance)
-            first_date = parse_date(transactions[0]['date']) if transactions else datetime.date.today()
-            txn = create_transaction(
-                actual.session,
-                first_date,
-                account,
-                "Opening Balance",
-                notes="Starting balance from bank statement",
-                amount=decimal.Decimal(str(summary['starting_balance']))
-            )
-            # Don't set category for starting balance
-            transactions_created += 1
-            print(f"   ✓ Opening balance: ₹{summary['starting_balance']:,.2f}")
-            
-            # Create all individual transactions
-            print(f"\n   Importing {len(transactions)} transactions...")
-            for txn_data in transactions:
-                txn_date = parse_date(txn_data['date'])
-                description = txn_data['description'] or "Transaction"
-                
-                if txn_data['deposit'] > 0:
-                    # Deposit - categorize as income
-                    amount = decimal.Decimal(str(txn_data['deposit']))
-                    txn = create_transaction(
-                        actual.session,
-                        txn_date,
-                        account,
-                        description,
-                        notes=f"Page {txn_data['page']} | Balance: ₹{txn_data['balance']:,.2f}",
-                        amount=amount
-                    )
-                    # Set as income
-                    if income_category:
-                        txn.category_id = income_category.id
-                    
-                elif txn_data['withdrawal'] > 0:
-                    # Withdrawal - categorize as General
-                    amount = decimal.Decimal(str(-txn_data['withdrawal']))
-                    txn = create_transaction(
-                        actual.session,
-                        txn_date,
-                        account,
-                        description,
-                        notes=f"Page {txn_data['page']} | Balance: ₹{txn_data['balance']:,.2f}",
-                        amount=amount
-                    )
-                    # Set as General
-                    if general_category:
-                        txn.category_id = general_category.id
-                else:
+                print(f"   ✓ Resuming after {last_date} (balance ₹{balance:,.2f}): "
+                      f"{len(transactions) - len(tail)} already imported")
+    
+    rows = []
+    if tail is not None:
+        transactions = tail
+    else:
+        # Create opening balance - NO CATEGORY (it's not income, it's just starting balance)
+        first_date = parse_date(transactions[0].date) if transactions else datetime.date.today()
+        rows.append({
+            'date': first_date,
+            'payee': "Opening Balance",
+            'notes': "Starting balance from bank statement",
+            'amount': summary['starting_balance'],
+            'category_id': None,
+            'imported_id': import_fingerprint(statement_hash, "opening balance") if statement_hash else None
+        })
+        print(f"   ✓ Opening balance: ₹{summary['starting_balance']:,.2f}")
+    
+    # Create all individual transactions
+    print(f"\n   Importing {len(transactions)} transactions...")
+    ruled_count = 0
+    for txn_data in transactions:
+        if txn_data.deposit > 0:
+            # Deposit - categorize as income unless a rule matches
+            amount = txn_data.deposit
+            category_id = income_category_id
+        elif txn_data.withdrawal > 0:
+            # Withdrawal - categorize as General unless a rule matches
+            amount = -txn_data.withdrawal
+            category_id = general_category_id
+        else:
+            continue
+        
+        category_name = match_rule(rules, txn_data.description, amount)
+        if category_name in category_ids:
+            category_id = category_ids[category_name]
+            ruled_count += 1
+        elif category_name is not None:
+            missing_categories.add(category_name)
+        
+        rows.append({
+            'date': parse_date(txn_data.date),
+            'payee': canonical_payee(payee_index, txn_data.payee or "Transaction"),
+            'notes': f"{txn_data.description} | Page {txn_data.page} | Balance: ₹{txn_data.balance:,.2f}",
+            'amount': amount,
+            'category_id': category_id,
+            'imported_id': transaction_fingerprint(txn_data, statement_hash) if statement_hash else None
+        })
+    
+    if missing_categories:
+        print(f"   ⚠️  Rule categories not found in ActualBudget: {', '.join(sorted(missing_categories))}")
+    if rules['rules']:
+        print(f"   ✓ {ruled_count} transaction(s) categorized by rules")
+    
+    transactions_created = bulk_create_transactions(actual.session, account_id, rows)
+    skipped = len(rows) - transactions_created
+    if skipped:
+        print(f"   ↩️  Skipped {skipped} already imported transaction(s)")
+    
+    if commit:
+        actual.commit()
+        print(f"\n✅ Successfully imported {transactions_created} transactions")
+    else:
+        print(f"\n✅ Staged {transactions_created} transactions (committed with the batch)")
+    if tail is None:
+        print(f"   ({len(rows) - 1} individual + 1 opening balance in statement)")
+    print(f"\n💡 Note: Deposits without a matching rule are categorized as Income")
+    print(f"   Expenses without a matching rule are categorized as General")
+    return transactions_created
+
+
+def import_statements(pdf_paths: list, password: str = None, dry_run: bool = False, commit_each: bool = True,
+                      incremental: bool = False, rules: dict = None, workers: int = 1,
+                      columns: bool = False):
+    """
+    Import several statements through a single ActualBudget session.
+    
+    The budget is downloaded once for the whole batch instead of once per
+    statement.
+    
+    Args:
+        pdf_paths: PDF paths in chronological order
+        password: Optional PDF password
+        dry_run: Parse and verify only, don't post to ActualBudget
+        commit_each: Commit after every statement (a checkpoint) rather than
+            once at the end of the batch
+        incremental: Only post transactions after the account's checkpoint
+        rules: Compiled categorization matcher (see categorizer)
+        workers: Page text extraction processes per statement
+        columns: Parse statements by column geometry
+    """
+    if dry_run:
+        for pdf_path in pdf_paths:
+            import_detailed_transactions(str(pdf_path), password=password, dry_run=True, workers=workers,
+                                         columns=columns)
+        return
+    
+    try:
+        with open_actual() as actual:
+            failed = []
+            for pdf_path in pdf_paths:
+                imported = import_detailed_transactions(str(pdf_path), password=password, actual=actual,
+                                                        commit=commit_each, incremental=incremental,
+                                                        rules=rules, workers=workers, columns=columns)
+                if imported:
                     continue
-                
-                transactions_created += 1
-            
-            actual.commit()
-            print(f"\n✅ Successfully imported {transactions_created} transactions")
-            print(f"   ({len(transactions)} individual + 1 opening balance)")
-            print(f"\n💡 Note: Deposits are categorized as Income")
-            print(f"   Expenses are categorized as General")
-            
+                failed.append(Path(pdf_path).name)
+                if not commit_each:
+                    # The rollback discarded the whole uncommitted batch
+                    print(f"\n❌ {Path(pdf_path).name} failed, nothing was committed")
+                    return
+            if not commit_each:
+                actual.commit()
+                print(f"\n✅ Committed {len(pdf_paths)} statements")
+            elif failed:
+                print(f"\n⚠️  {len(failed)} statement(s) failed to import: {', '.join(failed)}")
     except Exception as e:
         print(f"❌ Error: {e}")
         import traceback
@@ -261,17 +480,42 @@ def import_detailed_transactions(pdf_path: str, password: str = None, dry_run: b
 
 def main():
     parser = argparse.ArgumentParser(description='Import detailed bank statement transactions to ActualBudget')
-    parser.add_argument('pdf_file', help='Path to PDF bank statement')
+    parser.add_argument('pdf_files', nargs='+', help='Path(s) to PDF bank statements, in chronological order')
     parser.add_argument('--password', '-p', default=PDF_PASSWORD, help='PDF password')
     parser.add_argument('--dry-run', '-d', action='store_true', help="Preview without importing")
+    parser.add_argument('--single-commit', action='store_true',
+                        help="Commit once after all statements instead of after each one")
+    parser.add_argument('--incremental', '-i', action='store_true',
+                        help="Only import transactions after the account's last imported balance")
+    parser.add_argument('--rules', '-r', default=None,
+                        help='Categorization rules JSON file (default: categorization_rules.json if present)')
+    parser.add_argument('--workers', '-w', type=int, default=1,
+                        help='Extract page text in this many processes (for long statements, default: 1)')
+    parser.add_argument('--columns', '-c', action='store_true',
+                        help="Read transactions by column position instead of parsing page text")
     
     args = parser.parse_args()
     
-    if not Path(args.pdf_file).exists():
-        print(f"❌ File not found: {args.pdf_file}")
-        sys.exit(1)
+    for pdf_file in args.pdf_files:
+        if not Path(pdf_file).exists():
+            print(f"❌ File not found: {pdf_file}")
+            sys.exit(1)
+    
+    rules = None
+    if args.rules:
+        if not Path(args.rules).exists():
+            print(f"❌ Rules file not found: {args.rules}")
+            sys.exit(1)
+        rules = compile_rules(load_rules(args.rules))
     
-    import_detailed_transactions(args.pdf_file, password=args.password, dry_run=args.dry_run)
+    if len(args.pdf_files) == 1:
+        import_detailed_transactions(args.pdf_files[0], password=args.password, dry_run=args.dry_run,
+                                     incremental=args.incremental, rules=rules, workers=args.workers,
+                                     columns=args.columns)
+    else:
+        import_statements(args.pdf_files, password=args.password, dry_run=args.dry_run,
+                          commit_each=not args.single_commit, incremental=args.incremental, rules=rules,
+                          workers=args.workers, columns=args.columns)
 
 
 if __name__ == "__main__":
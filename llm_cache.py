@@ -0,0 +1,115 @@
+"""
+Persistent SQLite cache of Ollama responses.
+
+The totals prompt sent for a page only depends on the model, the prompt
+template and the page text, so a parsed response can be reused whenever all
+three are unchanged. Entries expire after CACHE_TTL_SECONDS and the least
+recently used ones are evicted beyond CACHE_MAX_ENTRIES.
+"""
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+
+CACHE_PATH = Path(__file__).parent / ".cache" / "llm_responses.sqlite"
+CACHE_TTL_SECONDS = 90 * 24 * 60 * 60
+CACHE_MAX_ENTRIES = 10000
+
+stats = {"hits": 0, "misses": 0}
+
+_lock = threading.Lock()
+_connections = {}
+
+
+def _connect(path):
+    """Return a shared connection for path, creating the table on first use."""
+    path = Path(path)
+    conn = _connections.get(path)
+    if conn is None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(str(path), check_same_thread=False)
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            " key TEXT PRIMARY KEY,"
+            " value TEXT NOT NULL,"
+            " created_at REAL NOT NULL,"
+            " last_used REAL NOT NULL)"
+        )
+        conn.execute("CREATE INDEX IF NOT EXISTS responses_last_used ON responses(last_used)")
+        conn.commit()
+        _connections[path] = conn
+    return conn
+
+
+def make_key(model, prompt_version, page_text):
+    """Build the cache key for a model/prompt/page combination."""
+    text_hash = hashlib.sha256(page_text.encode('utf-8')).hexdigest()
+    return f"{model}:{prompt_version}:{text_hash}"
+
+
+def get(key, path=CACHE_PATH, ttl=CACHE_TTL_SECONDS):
+    """
+    Look up a cached response.
+
+    Returns:
+        The cached value, or None on a miss or expired entry
+    """
+    now = time.time()
+    with _lock:
+        conn = _connect(path)
+        row = conn.execute(
+            "SELECT value, created_at FROM responses WHERE key = ?", (key,)
+        ).fetchone()
+
+        if row is None or now - row[1] > ttl:
+            if row is not None:
+                conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+                conn.commit()
+            stats["misses"] += 1
+            return None
+
+        conn.execute("UPDATE responses SET last_used = ? WHERE key = ?", (now, key))
+        conn.commit()
+        stats["hits"] += 1
+    return json.loads(row[0])
+
+
+def put(key, value, path=CACHE_PATH, max_entries=CACHE_MAX_ENTRIES):
+    """Store a JSON-serialisable value and evict least recently used entries."""
+    now = time.time()
+    with _lock:
+        conn = _connect(path)
+        conn.execute(
+            "INSERT OR REPLACE INTO responses (key, value, created_at, last_used) VALUES (?, ?, ?, ?)",
+            (key, json.dumps(value), now, now)
+        )
+        conn.execute(
+            "DELETE FROM responses WHERE key IN ("
+            " SELECT key FROM responses ORDER BY last_used DESC LIMIT -1 OFFSET ?)",
+            (max_entries,)
+        )
+        conn.commit()
+
+
+def clear(path=CACHE_PATH):
+    """Remove every cached response."""
+    with _lock:
+        conn = _connect(path)
+        conn.execute("DELETE FROM responses")
+        conn.commit()
+
+
+def get_stats():
+    """Return hit/miss counters for this process."""
+    total = stats["hits"] + stats["misses"]
+    hit_rate = stats["hits"] / total if total else 0.0
+    return {"hits": stats["hits"], "misses": stats["misses"], "hit_rate": hit_rate}
+
+
+def reset_stats():
+    """Reset hit/miss counters."""
+    stats["hits"] = 0
+    stats["misses"] = 0
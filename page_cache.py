@@ -0,0 +1,118 @@
+"""
+On-disk cache of extracted PDF page text.
+
+Statements never change after download, so the text PyMuPDF extracts from
+them can be reused across runs. Entries are keyed by the SHA-256 of the PDF
+bytes, a fingerprint of the password and the extractor version, and stored
+as zlib-compressed JSON. The least recently used entries are evicted once
+the cache grows past CACHE_MAX_BYTES.
+
+The cached text is the decrypted content of password-protected statements,
+so the cache directory is kept private to the current user (0700) and every
+entry is written owner-only (0600).
+"""
+
+import hashlib
+import json
+import os
+import zlib
+from pathlib import Path
+
+CACHE_DIR = Path(__file__).parent / ".cache" / "page_text"
+CACHE_MAX_BYTES = 50 * 1024 * 1024
+CACHE_SUFFIX = ".json.z"
+CACHE_DIR_MODE = 0o700
+CACHE_FILE_MODE = 0o600
+
+
+def file_sha256(pdf_path):
+    """Return the hex SHA-256 digest of a file's contents."""
+    digest = hashlib.sha256()
+    with open(pdf_path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def cache_key(pdf_path, password=None, version=1):
+    """
+    Build the cache key for a PDF.
+
+    Args:
+        pdf_path: Path to the PDF file
+        password: Password used to open the PDF (only a hash is kept)
+        version: Extractor version, bumped when extraction output changes
+
+    Returns:
+        Hex string identifying the extracted text
+    """
+    password_fp = hashlib.sha256((password or '').encode('utf-8')).hexdigest()[:16]
+    raw = f"{file_sha256(pdf_path)}:{password_fp}:v{version}"
+    return hashlib.sha256(raw.encode('utf-8')).hexdigest()
+
+
+def load_pages(key, cache_dir=CACHE_DIR):
+    """
+    Load cached page texts.
+
+    Returns:
+        List of page text strings, or None on a cache miss
+    """
+    path = Path(cache_dir) / f"{key}{CACHE_SUFFIX}"
+    try:
+        data = path.read_bytes()
+        pages_text = json.loads(zlib.decompress(data).decode('utf-8'))
+    except (OSError, zlib.error, ValueError):
+        return None
+
+    # Touch the entry so eviction drops the least recently used files first
+    try:
+        os.utime(path)
+    except OSError:
+        pass
+    return pages_text
+
+
+def store_pages(key, pages_text, cache_dir=CACHE_DIR, max_bytes=CACHE_MAX_BYTES):
+    """Store page texts under key and evict old entries beyond max_bytes."""
+    cache_dir = Path(cache_dir)
+    cache_dir.mkdir(mode=CACHE_DIR_MODE, parents=True, exist_ok=True)
+    # Also tighten directories created before entries were kept private
+    os.chmod(cache_dir, CACHE_DIR_MODE)
+
+    data = zlib.compress(json.dumps(pages_text, ensure_ascii=False).encode('utf-8'), 6)
+    path = cache_dir / f"{key}{CACHE_SUFFIX}"
+    tmp_path = path.with_name(path.name + '.tmp')
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, CACHE_FILE_MODE)
+    with os.fdopen(fd, 'wb') as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+
+    evict(cache_dir, max_bytes)
+
+
+def evict(cache_dir=CACHE_DIR, max_bytes=CACHE_MAX_BYTES):
+    """Delete least recently used entries until the cache fits in max_bytes."""
+    entries = []
+    for path in Path(cache_dir).glob(f"*{CACHE_SUFFIX}"):
+        try:
+            stat = path.stat()
+        except OSError:
+            continue
+        entries.append((stat.st_mtime, stat.st_size, path))
+
+    total = sum(size for _, size, _ in entries)
+    for _, size, path in sorted(entries):
+        if total <= max_bytes:
+            break
+        try:
+            path.unlink()
+            total -= size
+        except OSError:
+            pass
+
+
+def clear(cache_dir=CACHE_DIR):
+    """Remove every cached entry."""
+    for path in Path(cache_dir).glob(f"*{CACHE_SUFFIX}"):
+        path.unlink(missing_ok=True)
@@ -0,0 +1,119 @@
+"""
+Payee normalization for imported statement rows.
+
+ICICI particulars are slash-separated fields, e.g.
+
+    UPI/Saravanan/paytmqr6b1nv5@/breakfast/YES BANK L/557990293283/ICI78eb.../
+
+normalize_payee keeps the counterparty name (or, for payments to a bare
+VPA, the VPA without its @bank handle) and drops the mode, reference
+numbers and transaction ids, so every payment to the
+same merchant gets the same payee. A payee index maps names
+case-insensitively to the first spelling seen (or the one already in the
+budget), so "MADURA CAF" and "Madura Caf" end up as one payee.
+"""
+
+import functools
+import re
+
+# Transaction modes that start the particulars
+MODES = {'UPI', 'ACH', 'NEFT', 'IMPS', 'RTGS', 'BIL', 'MMT', 'ATM', 'NFS', 'INF', 'INFT', 'CLG'}
+
+MAX_PAYEE_LENGTH = 50
+MAX_FALLBACK_WORDS = 4
+
+# Modes whose particulars put the remark before the name
+# (INF/INFT/REF/REMARK/NAME, MMT/IMPS/REF/REMARK/NAME/IFSC)
+NAME_LAST_MODES = {'INF', 'MMT'}
+
+# A VPA handle, a run of digits, a date or a token mixing letters and digits
+# (paytmqr6b1nv5, gpay-112505162, ICIC7030808246000361)
+REFERENCE_PATTERN = re.compile(
+    r'^(?:\S*@\S*|\d{4,}|\d{2}-\d{2}-\d{4}|(?=\S*\d)(?=\S*[A-Za-z])\S{6,})$'
+)
+# NEFT-UTR-NAME-... particulars separate their fields with hyphens
+HYPHEN_FIELDS_PATTERN = re.compile(r'^(?:NEFT|RTGS|IMPS)-', re.IGNORECASE)
+INTEREST_PATTERN = re.compile(r':Int\.Pd:', re.IGNORECASE)
+
+
+def is_reference(field):
+    """Return True if a particulars field is a handle, reference or id rather than a name."""
+    return bool(REFERENCE_PATTERN.match(field))
+
+
+def _tidy(name):
+    return name.strip(' -.:')[:MAX_PAYEE_LENGTH] or 'Transaction'
+
+
+def split_fields(particulars):
+    """Split particulars into their slash (or, for NEFT-style rows, hyphen) separated fields."""
+    fields = [' '.join(field.split()) for field in particulars.split('/')]
+    fields = [field for field in fields if field]
+    if fields and HYPHEN_FIELDS_PATTERN.match(fields[0]):
+        fields = [field.strip() for field in fields[0].split('-') if field.strip()] + fields[1:]
+    return fields
+
+
+@functools.lru_cache(maxsize=4096)
+def normalize_payee(particulars):
+    """
+    Extract the payee name from a statement's particulars.
+
+    Args:
+        particulars: Particulars text, either slash-separated as printed or
+            with the slashes already replaced by spaces
+
+    Returns:
+        Payee name, or 'Transaction' if nothing name-like is left
+    """
+    if INTEREST_PATTERN.search(particulars):
+        return 'Interest'
+
+    fields = split_fields(particulars)
+    if len(fields) > 1:
+        mode = fields[0].upper()
+        if mode == 'UPI':
+            # UPI/NAME/VPA/... or, paying a bare VPA, UPI/VPA/...; either way
+            # the second field names the payee (without the @bank handle)
+            return _tidy(fields[1].split('@')[0])
+        if mode in MODES:
+            fields = fields[1:]
+        names = [field for field in fields if field.upper() not in MODES and not is_reference(field)]
+        if not names:
+            return 'Transaction'
+        return _tidy(names[-1] if mode in NAME_LAST_MODES else names[0])
+
+    # No field structure left: drop the mode and reference tokens word by word
+    words = fields[0].split() if fields else []
+    if words and words[0].upper() in MODES:
+        words = words[1:]
+    words = [word for word in words if not is_reference(word)]
+    return _tidy(' '.join(words[:MAX_FALLBACK_WORDS]))
+
+
+def payee_key(name):
+    """Key payee names compare by: case-insensitive, whitespace collapsed."""
+    return ' '.join(name.split()).casefold()
+
+
+def build_payee_index(names=()):
+    """
+    Build a payee index from existing payee names.
+
+    Returns:
+        Dict of payee_key -> canonical name
+    """
+    index = {}
+    for name in names:
+        index.setdefault(payee_key(name), name)
+    return index
+
+
+def canonical_payee(index, name):
+    """
+    Return the canonical spelling of a payee name.
+
+    Names not in the index yet are added, so later spellings map to the
+    first one.
+    """
+    return index.setdefault(payee_key(name), name)
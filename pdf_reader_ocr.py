@@ -1,47 +1,340 @@
 import json
 import re
+import sqlite3
+import threading
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
 import pymupdf
 import requests
+from requests.adapters import HTTPAdapter
+
+import llm_cache
+import page_cache
+from statement_parser import AMOUNT_PATTERN, ZERO, Transaction, parse_amount, parse_rows, to_amount
+
+# Bump when extract_text_from_pdf output changes so cached page text is refreshed
+EXTRACTOR_VERSION = 1
+
+OLLAMA_URL = 'http://localhost:11434/api/generate'
+OLLAMA_MODEL = 'qwen2.5:7b'
+# Bump when the totals prompt changes so cached LLM responses are refreshed
+PROMPT_VERSION = 1
+# Concurrent Ollama requests per statement (set OLLAMA_NUM_PARALLEL to match)
+LLM_MAX_WORKERS = 4
+# Smallest page range worth handing to an extraction worker process
+MIN_PAGES_PER_WORKER = 8
+# Decoded pages a StatementDocument keeps in memory
+PAGE_LRU_SIZE = 8
+
+_http_session = None
+_http_session_lock = threading.Lock()
+
 
+def get_http_session():
+    """Return the shared keep-alive HTTP session used for Ollama requests."""
+    global _http_session
+    # Page total workers call this concurrently; build the session only once
+    with _http_session_lock:
+        if _http_session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=1, pool_maxsize=LLM_MAX_WORKERS)
+            session.mount('http://', adapter)
+            session.mount('https://', adapter)
+            _http_session = session
+    return _http_session
 
-def extract_text_from_pdf(pdf_path, password=None):
+
+def open_pdf(pdf_path, password=None):
     """
-    Extract text from PDF pages.
+    Open a PDF with PyMuPDF, authenticating it if it is encrypted.
+    
+    Raises:
+        RuntimeError: If the PDF is encrypted and the password is missing or wrong
+    """
+    doc = pymupdf.open(pdf_path)
+    if doc.is_encrypted:
+        if not password or not doc.authenticate(password):
+            doc.close()
+            raise RuntimeError("PDF is encrypted and requires authentication")
+    return doc
+
+
+def iter_pages(pdf_path, password=None, use_cache=True):
+    """
+    Yield the text of each PDF page as it is decoded.
     
     Args:
         pdf_path: Path to the PDF file
         password: Optional password for encrypted PDFs
+        use_cache: Reuse page text cached on disk for this exact file, and
+            cache it once every page has been decoded
+    
+    Yields:
+        Text string of each page, in order
+    """
+    key = None
+    if use_cache:
+        key = page_cache.cache_key(pdf_path, password, EXTRACTOR_VERSION)
+        pages_text = page_cache.load_pages(key)
+        if pages_text is not None:
+            yield from pages_text
+            return
+    
+    doc = open_pdf(pdf_path, password)
+    try:
+        pages_text = []
+        for page_num in range(len(doc)):
+            text = doc[page_num].get_text()
+            if key is not None:
+                pages_text.append(text)
+            yield text
+    finally:
+        doc.close()
+    
+    if key is not None:
+        page_cache.store_pages(key, pages_text)
+
+
+class StatementDocument:
+    """
+    Lazily decoded page texts of a statement PDF.
+    
+    Behaves like the list extract_text_from_pdf returns (len, indexing,
+    iteration), but only decodes a page when it is asked for and keeps the
+    last PAGE_LRU_SIZE decoded pages, so a B/F or header probe touches page
+    1 only. When the whole text is already in the page cache it is used
+    instead of opening the PDF; a full in-order iteration fills the cache
+    and releases the PDF handle.
+    
+    Use as a context manager, or call close(), to release the handle after
+    reading only some pages.
+    """
+    
+    def __init__(self, pdf_path, password=None, use_cache=True, cache_size=PAGE_LRU_SIZE):
+        self.pdf_path = pdf_path
+        self.password = password
+        self.cache_size = cache_size
+        self._key = page_cache.cache_key(pdf_path, password, EXTRACTOR_VERSION) if use_cache else None
+        self._cached = page_cache.load_pages(self._key) if self._key else None
+        self._doc = None
+        self._pages = OrderedDict()
+        self.pages_decoded = 0
+    
+    def _open(self):
+        if self._doc is None:
+            self._doc = open_pdf(self.pdf_path, self.password)
+        return self._doc
+    
+    def __len__(self):
+        if self._cached is not None:
+            return len(self._cached)
+        return len(self._open())
+    
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        if self._cached is not None:
+            return self._cached[index]
+        
+        page_count = len(self)
+        if index < 0:
+            index += page_count
+        if not 0 <= index < page_count:
+            raise IndexError("page index out of range")
+        
+        text = self._pages.get(index)
+        if text is not None:
+            self._pages.move_to_end(index)
+            return text
+        text = self._open()[index].get_text()
+        self.pages_decoded += 1
+        self._pages[index] = text
+        if len(self._pages) > self.cache_size:
+            self._pages.popitem(last=False)
+        return text
+    
+    def __iter__(self):
+        if self._cached is not None:
+            yield from self._cached
+            return
+        pages_text = []
+        for index in range(len(self)):
+            text = self[index]
+            if self._key is not None:
+                pages_text.append(text)
+            yield text
+        # A full pass is usually the last use; pages read later reopen the PDF
+        self.close()
+        if self._key is not None:
+            page_cache.store_pages(self._key, pages_text)
+            self._cached = pages_text
+    
+    def close(self):
+        """Close the PDF handle; pages already decoded stay readable."""
+        if self._doc is not None:
+            self._doc.close()
+            self._doc = None
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def find_starting_balance(page_text, min_balance=ZERO):
+    """
+    Find the brought-forward (B/F) balance on a statement's first page.
+    
+    Args:
+        page_text: Text of the first page
+        min_balance: Ignore amounts near B/F that are not above this
+    
+    Returns:
+        The B/F balance, or ZERO if none is found
+    """
+    lines = page_text.split('\n')
+    for idx, line in enumerate(lines):
+        if line.strip() == 'B/F' and idx + 1 < len(lines):
+            # Next line or nearby should have the balance
+            for j in range(1, 5):
+                if idx + j < len(lines):
+                    # Indian digit grouping (6,49,739.05), as the parser reads it
+                    balance_match = AMOUNT_PATTERN.search(lines[idx + j])
+                    if balance_match:
+                        potential_balance = parse_amount(balance_match.group())
+                        if potential_balance > min_balance:
+                            return potential_balance
+    return ZERO
+
+
+def probe_starting_balance(pdf_path, password=None, min_balance=ZERO):
+    """
+    Read a statement's B/F balance, decoding only its first page.
+    
+    Returns:
+        The B/F balance, or ZERO if the PDF has no pages or no B/F row
+    """
+    with StatementDocument(pdf_path, password) as document:
+        return find_starting_balance(document[0], min_balance) if len(document) else ZERO
+
+
+def extract_page_range(pdf_path, password, start, stop):
+    """
+    Extract the text of pages start..stop-1 on a handle of its own.
+    
+    Runs in extraction worker processes: PyMuPDF documents cannot be shared
+    between processes, so every worker opens and authenticates the PDF itself.
     
     Returns:
         List of text strings, one per page
     """
-    doc = pymupdf.open(pdf_path)
+    doc = open_pdf(pdf_path, password)
+    try:
+        return [doc[page_num].get_text() for page_num in range(start, stop)]
+    finally:
+        doc.close()
+
+
+def page_ranges(page_count, workers):
+    """Split page_count pages into at most workers contiguous (start, stop) ranges."""
+    chunks = max(1, min(workers, page_count // MIN_PAGES_PER_WORKER))
+    size, extra = divmod(page_count, chunks)
+    ranges = []
+    start = 0
+    for i in range(chunks):
+        stop = start + size + (1 if i < extra else 0)
+        ranges.append((start, stop))
+        start = stop
+    return ranges
 
-    if doc.is_encrypted:
-        if not password or not doc.authenticate(password):
-            raise RuntimeError("PDF is encrypted and requires authentication")
 
-    pages_text = []
-    for page_num in range(len(doc)):
-        page = doc[page_num]
-        text = page.get_text()
-        pages_text.append(text)
+def extract_text_parallel(pdf_path, password=None, workers=2):
+    """
+    Extract every page's text with the page range split across processes.
+    
+    Meant for consolidated statements with hundreds of pages; documents
+    shorter than MIN_PAGES_PER_WORKER pages per worker use fewer workers,
+    down to plain sequential extraction in this process.
+    
+    Args:
+        pdf_path: Path to the PDF file
+        password: Optional password for encrypted PDFs
+        workers: Maximum number of worker processes
     
+    Returns:
+        List of text strings, one per page, in page order
+    """
+    doc = open_pdf(pdf_path, password)
+    page_count = len(doc)
     doc.close()
+    
+    ranges = page_ranges(page_count, workers)
+    if len(ranges) == 1:
+        return extract_page_range(pdf_path, password, 0, page_count)
+    
+    pdf_path = str(pdf_path)
+    with ProcessPoolExecutor(max_workers=len(ranges)) as pool:
+        chunks = pool.map(extract_page_range, [pdf_path] * len(ranges), [password] * len(ranges),
+                          [start for start, _ in ranges], [stop for _, stop in ranges])
+        return [text for chunk in chunks for text in chunk]
+
+
+def extract_text_from_pdf(pdf_path, password=None, use_cache=True, workers=1):
+    """
+    Extract text from PDF pages.
+    
+    Args:
+        pdf_path: Path to the PDF file
+        password: Optional password for encrypted PDFs
+        use_cache: Reuse page text cached on disk for this exact file
+        workers: Split the pages across this many processes when the text
+            is not cached (see extract_text_parallel)
+    
+    Returns:
+        List of text strings, one per page
+    """
+    if workers <= 1:
+        return list(iter_pages(pdf_path, password, use_cache))
+    
+    key = None
+    if use_cache:
+        key = page_cache.cache_key(pdf_path, password, EXTRACTOR_VERSION)
+        pages_text = page_cache.load_pages(key)
+        if pages_text is not None:
+            return pages_text
+    
+    pages_text = extract_text_parallel(pdf_path, password, workers)
+    if key is not None:
+        page_cache.store_pages(key, pages_text)
     return pages_text
 
 
-def extract_transactions_with_llm(page_text, page_num):
+def extract_transactions_with_llm(page_text, page_num, use_cache=True):
     """
     Use Ollama qwen2.5 model to extract transaction totals from page text.
     
     Args:
         page_text: Extracted text from PDF page
         page_num: Page number (for reference)
+        use_cache: Reuse a cached response for identical page text
     
     Returns:
         Dictionary with deposits, withdrawals, and balance
     """
+    cache_key = None
+    if use_cache:
+        cache_key = llm_cache.make_key(OLLAMA_MODEL, PROMPT_VERSION, page_text)
+        try:
+            cached = llm_cache.get(cache_key)
+        except sqlite3.Error as e:
+            # The cache is best-effort, a locked or corrupt file only costs a request
+            print(f"Page {page_num}: LLM cache unavailable ({e})")
+            cached = None
+        if cached is not None:
+            return {name: to_amount(value) for name, value in cached.items()}
+    
     prompt = f"""You are analyzing a bank statement page. Extract the transaction summary from this page.
 
 Look for a line that starts with "Total:" followed by three numbers:
@@ -59,10 +352,10 @@ If no Total: line exists, respond with all zeros.
 Remove commas from numbers. Example: "6,104.00" becomes 6104.00"""
 
     try:
-        response = requests.post(
-            'http://localhost:11434/api/generate',
+        response = get_http_session().post(
+            OLLAMA_URL,
             json={
-                'model': 'qwen2.5:7b',
+                'model': OLLAMA_MODEL,
                 'prompt': prompt,
                 'stream': False,
                 'format': 'json'
@@ -76,28 +369,164 @@ Remove commas from numbers. Example: "6,104.00" becomes 6104.00"""
             
             try:
                 data = json.loads(response_text)
-                deposits = float(data.get('deposits', 0))
-                withdrawals = float(data.get('withdrawals', 0))
-                balance = float(data.get('balance', 0))
+                deposits = to_amount(data.get('deposits', 0))
+                withdrawals = to_amount(data.get('withdrawals', 0))
+                balance = to_amount(data.get('balance', 0))
                 
                 if deposits > 0 or withdrawals > 0:
                     print(f"Page {page_num}: Deposits={deposits:,.2f}, Withdrawals={withdrawals:,.2f}")
                 
-                return {
+                totals = {
                     "deposits": deposits,
                     "withdrawals": withdrawals,
                     "balance": balance
                 }
-            except json.JSONDecodeError:
+                if cache_key is not None:
+                    try:
+                        # Stored as strings, JSON has no exact decimal type
+                        llm_cache.put(cache_key, {name: str(value) for name, value in totals.items()})
+                    except sqlite3.Error as e:
+                        print(f"Page {page_num}: Could not cache LLM response ({e})")
+                return totals
+            except (json.JSONDecodeError, ArithmeticError):
                 print(f"Page {page_num}: JSON parse error")
-                return {"deposits": 0.0, "withdrawals": 0.0, "balance": 0.0}
+                return {"deposits": ZERO, "withdrawals": ZERO, "balance": ZERO}
         else:
             print(f"Page {page_num}: API error {response.status_code}")
-            return {"deposits": 0.0, "withdrawals": 0.0, "balance": 0.0}
+            return {"deposits": ZERO, "withdrawals": ZERO, "balance": ZERO}
             
     except Exception as e:
         print(f"Page {page_num}: Error - {e}")
-        return {"deposits": 0.0, "withdrawals": 0.0, "balance": 0.0}
+        return {"deposits": ZERO, "withdrawals": ZERO, "balance": ZERO}
+
+
+def parse_page_totals(page_text):
+    """
+    Parse the deposits, withdrawals and balance from a page's "Total:" row.
+    
+    The row is extracted as "Total:" followed by the three amounts, either on
+    the same line or on the lines right after it.
+    
+    Args:
+        page_text: Extracted text from PDF page
+    
+    Returns:
+        Dictionary with deposits, withdrawals, and balance, or None if the
+        row is missing or incomplete
+    """
+    lines = page_text.split('\n')
+    for idx, line in enumerate(lines):
+        if 'Total:' not in line:
+            continue
+        
+        amounts = re.findall(r'([\d,]+\.\d{2})', line.split('Total:', 1)[1])
+        for next_line in lines[idx + 1:idx + 6]:
+            if len(amounts) >= 3:
+                break
+            amounts.extend(re.findall(r'([\d,]+\.\d{2})', next_line))
+        
+        if len(amounts) < 3:
+            return None
+        
+        deposits, withdrawals, balance = (parse_amount(amt) for amt in amounts[:3])
+        return {
+            "deposits": deposits,
+            "withdrawals": withdrawals,
+            "balance": balance
+        }
+    return None
+
+
+def _check_page_totals(page_text, page_num, prev_balance=None):
+    """
+    Parse a page's totals and decide whether the LLM has to be asked.
+    
+    Returns:
+        Tuple of (totals or None, needs_llm)
+    """
+    if 'Total:' not in page_text:
+        return {"deposits": ZERO, "withdrawals": ZERO, "balance": ZERO}, False
+    
+    totals = parse_page_totals(page_text)
+    if totals is None:
+        print(f"Page {page_num}: Could not parse Total: row, asking LLM")
+        return None, True
+    
+    if prev_balance is not None:
+        expected = to_amount(prev_balance) + totals['deposits'] - totals['withdrawals']
+        if expected != totals['balance']:
+            print(f"Page {page_num}: Total: row does not match running balance, asking LLM")
+            return totals, True
+    
+    if totals['deposits'] > 0 or totals['withdrawals'] > 0:
+        print(f"Page {page_num}: Deposits={totals['deposits']:,.2f}, Withdrawals={totals['withdrawals']:,.2f}")
+    return totals, False
+
+
+def extract_page_totals(page_text, page_num, prev_balance=None):
+    """
+    Get a page's transaction totals, using the LLM only when needed.
+    
+    The "Total:" row is parsed directly. The LLM is only asked when the row
+    cannot be parsed, or when prev_balance is known and the parsed totals do
+    not reconcile with it (prev_balance + deposits - withdrawals != balance).
+    
+    Args:
+        page_text: Extracted text from PDF page
+        page_num: Page number (for reference)
+        prev_balance: Running balance carried into this page, if known
+    
+    Returns:
+        Dictionary with deposits, withdrawals, and balance
+    """
+    totals, needs_llm = _check_page_totals(page_text, page_num, prev_balance)
+    if needs_llm:
+        return extract_transactions_with_llm(page_text, page_num)
+    return totals
+
+
+def extract_all_page_totals(pages_text, starting_balance=None, max_workers=LLM_MAX_WORKERS):
+    """
+    Get the totals of every page, sending LLM fallbacks concurrently.
+    
+    Pages are parsed in order first so each one can be checked against the
+    balance carried in from the page before. Pages that still need the LLM
+    are then requested in parallel on the shared HTTP session, and the
+    results are put back in page order.
+    
+    Args:
+        pages_text: List of page text strings
+        starting_balance: Opening balance of the statement, if known
+        max_workers: Maximum number of concurrent LLM requests
+    
+    Returns:
+        List of totals dictionaries, one per page
+    """
+    results = [None] * len(pages_text)
+    llm_pages = []
+    prev_balance = starting_balance or None
+    
+    for idx, page_text in enumerate(pages_text):
+        totals, needs_llm = _check_page_totals(page_text, idx + 1, prev_balance)
+        if needs_llm:
+            llm_pages.append(idx)
+        else:
+            results[idx] = totals
+        
+        if totals is not None and totals['balance'] > 0:
+            prev_balance = totals['balance']
+    
+    if llm_pages:
+        workers = max(1, min(max_workers, len(llm_pages)))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            futures = {
+                idx: pool.submit(extract_transactions_with_llm, pages_text[idx], idx + 1)
+                for idx in llm_pages
+            }
+        for idx, future in futures.items():
+            results[idx] = future.result()
+    
+    return results
 
 
 def extract_transactions_from_page_text(page_text, page_num):
@@ -111,163 +540,101 @@ def extract_transactions_from_page_text(page_text, page_num):
         page_num: Page number (for reference)
     
     Returns:
-        List of transaction dictionaries
+        List of Transaction records
     """
     transactions = []
-    lines = page_text.split('\n')
-    
-    # Pattern: date at start of line (DD-MM-YYYY)
-    date_pattern = re.compile(r'^(\d{2}-\d{2}-\d{4})')
+    bf_balance = ZERO
     
-    i = 0
-    while i < len(lines):
-        line = lines[i].strip()
+    for row in parse_rows(page_text):
+        amounts_found = row['amounts']
+        if row['marker'] == 'B/F':
+            bf_balance = amounts_found[-1]
+            continue
         
-        # Check if line starts with a date
-        date_match = date_pattern.match(line)
-        if date_match:
-            date_str = date_match.group(1)
-            
-            # Skip B/F and Total lines
-            if i + 1 < len(lines):
-                next_line = lines[i + 1].strip()
-                if next_line in ['B/F', 'Total:', ''] or 'Total:' in next_line:
-                    i += 1
-                    continue
-            
-            # Collect description and amounts from this and next few lines
-            description_parts = []
-            amounts_found = []
-            
-            # Look ahead for description and amounts (typically in next 2-6 lines)
-            j = i + 1
-            while j < len(lines) and j < i + 10:
-                next_line = lines[j].strip()
-                
-                # Stop if we hit another date
-                if date_pattern.match(next_line):
-                    break
-                
-                # Stop if we hit Total or B/F or C/F
-                if next_line in ['Total:', 'B/F', 'C/F', ''] or 'Total:' in next_line:
-                    break
-                
-                # Check if line contains amounts (numbers with decimals)
-                amount_matches = re.findall(r'([\d,]+\.\d{2})', next_line)
-                if amount_matches:
-                    # Store amounts
-                    for amt in amount_matches:
-                        amounts_found.append(float(amt.replace(',', '')))
-                    # After finding amounts, description is complete
-                    if len(amounts_found) >= 2:  # Have transaction amount + balance
-                        break
-                else:
-                    # This is description text
-                    if next_line and not next_line.isdigit() and next_line not in ['/']:
-                        description_parts.append(next_line)
-                
-                j += 1
+        # Parse amounts based on format
+        # Format is typically: [deposit OR withdrawal], balance
+        # Last amount is always balance
+        # If 2 amounts: one is transaction, one is balance
+        # If 3 amounts: could be deposit, withdrawal, balance OR description has number + transaction + balance
+        
+        deposit = ZERO
+        withdrawal = ZERO
+        balance = ZERO
+        
+        if len(amounts_found) >= 2:
+            # Last amount is balance
+            balance = amounts_found[-1]
             
-            # Parse amounts based on format
-            # Format is typically: [deposit OR withdrawal], balance
-            # Last amount is always balance
-            # If 2 amounts: one is transaction, one is balance
-            # If 3 amounts: could be deposit, withdrawal, balance OR description has number + transaction + balance
+            # Determine if previous transactions had balances to compare
+            prev_balance = transactions[-1].balance if transactions else ZERO
+            if page_num == 1 and not transactions:
+                # First transaction on first page - use B/F balance
+                prev_balance = bf_balance
             
-            deposit = 0.0
-            withdrawal = 0.0
-            balance = 0.0
+            # Compare balance to determine deposit vs withdrawal
+            transaction_amount = amounts_found[0]
             
-            if len(amounts_found) >= 2:
-                # Last amount is balance
-                balance = amounts_found[-1]
-                
-                # Determine if previous transactions had balances to compare
-                prev_balance = transactions[-1]['balance'] if transactions else 0.0
-                if page_num == 1 and not transactions:
-                    # First transaction on first page - check for B/F balance
-                    for k in range(max(0, i-10), i):
-                        if 'B/F' in lines[k]:
-                            # Look for balance near B/F
-                            for m in range(k, min(k+5, len(lines))):
-                                bf_amounts = re.findall(r'([\d,]+\.\d{2})', lines[m])
-                                if bf_amounts:
-                                    prev_balance = float(bf_amounts[-1].replace(',', ''))
-                                    break
-                            break
-                
-                # Compare balance to determine deposit vs withdrawal
-                transaction_amount = amounts_found[0] if len(amounts_found) >= 2 else 0.0
-                
-                if prev_balance > 0:
-                    if balance > prev_balance:
-                        # Balance increased - deposit
-                        deposit = transaction_amount
-                    else:
-                        # Balance decreased - withdrawal
-                        withdrawal = transaction_amount
+            if prev_balance > 0:
+                if balance > prev_balance:
+                    # Balance increased - deposit
+                    deposit = transaction_amount
                 else:
-                    # First transaction or no previous balance - use balance change
-                    # Check all amounts to see if middle one makes sense
-                    if len(amounts_found) == 2:
-                        # Could be either - mark as deposit for now (will be corrected)
-                        deposit = transaction_amount
-            
-            # Build description
-            description = ' '.join(description_parts[:4])  # Limit to first 4 parts
-            description = description.replace('/', ' ')  # Clean up slashes
-            
-            if amounts_found:  # Only add if we found amounts
-                transactions.append({
-                    'date': date_str,
-                    'description': description[:100] if description else 'Transaction',
-                    'deposit': deposit,
-                    'withdrawal': withdrawal,
-                    'balance': balance
-                })
-            
-            i = j  # Jump to where we stopped looking ahead
-        else:
-            i += 1
+                    # Balance decreased - withdrawal
+                    withdrawal = transaction_amount
+            else:
+                # First transaction or no previous balance - use balance change
+                # Check all amounts to see if middle one makes sense
+                if len(amounts_found) == 2:
+                    # Could be either - mark as deposit for now (will be corrected)
+                    deposit = transaction_amount
+        
+        # Build description
+        description_parts = [part for part in row['description_parts'] if not part.isdigit()]
+        description = ' '.join(description_parts[:4])  # Limit to first 4 parts
+        description = description.replace('/', ' ')  # Clean up slashes
+        
+        transactions.append(Transaction(
+            date=row['date'],
+            description=description[:100] if description else 'Transaction',
+            deposit=deposit,
+            withdrawal=withdrawal,
+            balance=balance,
+            page=page_num
+        ))
     
     print(f"Page {page_num}: Extracted {len(transactions)} transactions")
     return transactions
 
 
-def extract_all_transactions_from_pdf(pdf_path, password=None):
+def extract_all_transactions_from_pdf(pdf_path, password=None, pages_text=None, verify=False):
     """
     Extract ALL individual transactions from bank statement PDF using fast regex parsing.
     
     Args:
         pdf_path: Path to the bank statement PDF
         password: Optional PDF password
+        pages_text: Optional page texts already extracted from pdf_path.
+            When given, the PDF is not opened again.
+        verify: Cross-check each page's parsed transactions against its
+            Total: row (may call the LLM when the row cannot be parsed)
     
     Returns:
-        Dictionary with transactions list and summary statistics
+        Dictionary with transactions list and summary statistics. With
+        verify, also "mismatched_pages": page numbers that failed the check.
     """
-    print("Extracting text from PDF...")
-    pages_text = extract_text_from_pdf(pdf_path, password)
+    if pages_text is None:
+        print("Extracting text from PDF...")
+        pages_text = StatementDocument(pdf_path, password)
     
     print(f"Processing {len(pages_text)} pages...\n")
     
     # Extract starting balance from first page FIRST
-    starting_balance = 0.0
-    lines = pages_text[0].split('\n')
-    for idx, line in enumerate(lines):
-        if line.strip() == 'B/F' and idx + 1 < len(lines):
-            for j in range(1, 5):
-                if idx + j < len(lines):
-                    balance_match = re.search(r'(\d{1,3}(?:,\d{3})+\.\d{2})', lines[idx + j])
-                    if balance_match:
-                        potential_balance = float(balance_match.group(1).replace(',', ''))
-                        if potential_balance > 10000:  # Reasonable starting balance
-                            starting_balance = potential_balance
-                            print(f"Starting balance (B/F): ₹{starting_balance:,.2f}\n")
-                            break
-            if starting_balance > 0:
-                break
+    starting_balance = find_starting_balance(pages_text[0], min_balance=10000)  # Reasonable starting balance
+    if starting_balance > 0:
+        print(f"Starting balance (B/F): ₹{starting_balance:,.2f}\n")
     
     all_transactions = []
+    page_sums = []
     
     for i, page_text in enumerate(pages_text, 1):
         # Use fast regex-based extraction with starting balance context
@@ -275,96 +642,120 @@ def extract_all_transactions_from_pdf(pdf_path, password=None):
         
         # Update previous balance for each transaction
         for txn in transactions:
-            prev_balance = all_transactions[-1]['balance'] if all_transactions else starting_balance
+            prev_balance = all_transactions[-1].balance if all_transactions else starting_balance
             
             # Recalculate deposit/withdrawal based on balance change
-            if prev_balance > 0 and txn['balance'] > 0:
-                balance_change = txn['balance'] - prev_balance
+            if prev_balance > 0 and txn.balance > 0:
+                balance_change = txn.balance - prev_balance
                 
                 if balance_change > 0:
                     # Balance increased - deposit
-                    txn['deposit'] = balance_change
-                    txn['withdrawal'] = 0.0
+                    txn.deposit = balance_change
+                    txn.withdrawal = ZERO
                 else:
                     # Balance decreased - withdrawal
-                    txn['deposit'] = 0.0
-                    txn['withdrawal'] = abs(balance_change)
+                    txn.deposit = ZERO
+                    txn.withdrawal = abs(balance_change)
             
             all_transactions.append(txn)
         
-        # Get page totals using LLM (fast, only extracts Total: line)
-        page_summary = extract_transactions_with_llm(page_text, i)
+        page_sums.append((
+            sum(t.deposit for t in transactions),
+            sum(t.withdrawal for t in transactions)
+        ))
     
     # Calculate totals
-    total_deposits = sum(t['deposit'] for t in all_transactions)
-    total_withdrawals = sum(t['withdrawal'] for t in all_transactions)
-    final_balance = all_transactions[-1]['balance'] if all_transactions else 0.0
+    total_deposits = sum(t.deposit for t in all_transactions)
+    total_withdrawals = sum(t.withdrawal for t in all_transactions)
+    final_balance = all_transactions[-1].balance if all_transactions else ZERO
     
     print(f"\n✓ Extracted {len(all_transactions)} individual transactions")
     print(f"  Total Deposits: ₹{total_deposits:,.2f}")
     print(f"  Total Withdrawals: ₹{total_withdrawals:,.2f}")
     
-    return {
+    result = {
         "transactions": all_transactions,
         "starting_balance": starting_balance,
         "total_deposits": total_deposits,
         "total_withdrawals": total_withdrawals,
         "final_balance": final_balance
     }
+    
+    if verify:
+        result["mismatched_pages"] = verify_page_sums(pages_text, page_sums)
+    
+    return result
+
+
+def verify_page_sums(pages_text, page_sums):
+    """
+    Cross-check parsed per-page deposit/withdrawal sums against Total: rows.
+    
+    Args:
+        pages_text: List of page text strings
+        page_sums: List of (deposits, withdrawals) parsed from each page
+    
+    Returns:
+        List of page numbers whose parsed sums do not match the page totals
+    """
+    print("\n=== VERIFYING PAGE TOTALS ===")
+    mismatched_pages = []
+    page_totals = extract_all_page_totals(pages_text)
+    
+    for i, (totals, (deposits, withdrawals)) in enumerate(zip(page_totals, page_sums), 1):
+        if totals['balance'] == 0 and deposits == 0 and withdrawals == 0:
+            continue
+        
+        if totals['deposits'] != deposits or totals['withdrawals'] != withdrawals:
+            mismatched_pages.append(i)
+            print(f"Page {i}: ⚠️  Parsed deposits ₹{deposits:,.2f} / withdrawals ₹{withdrawals:,.2f}, "
+                  f"Total: row says ₹{totals['deposits']:,.2f} / ₹{totals['withdrawals']:,.2f}")
+    
+    if not mismatched_pages:
+        print("✅ All page totals match parsed transactions")
+    return mismatched_pages
 
 
-def process_bank_statement(pdf_path, password=None):
+def process_bank_statement(pdf_path, password=None, pages_text=None, max_workers=LLM_MAX_WORKERS):
     """
     Process bank statement PDF using OCR + LLM.
     
     Args:
         pdf_path: Path to the bank statement PDF
         password: Optional PDF password
+        pages_text: Optional page texts already extracted from pdf_path.
+            When given, the PDF is not opened again.
+        max_workers: Maximum number of concurrent LLM requests
     
     Returns:
         Dictionary with summary statistics
     """
-    print("Extracting text from PDF...")
-    pages_text = extract_text_from_pdf(pdf_path, password)
+    if pages_text is None:
+        print("Extracting text from PDF...")
+        pages_text = StatementDocument(pdf_path, password)
     
-    print(f"Processing {len(pages_text)} pages with Ollama qwen2.5...\n")
+    print(f"Processing {len(pages_text)} pages...\n")
     print("=== PAGE-BY-PAGE SUMMARY ===")
     
-    total_deposits = 0.0
-    total_withdrawals = 0.0
-    final_balance = 0.0
-    starting_balance = 0.0
+    total_deposits = ZERO
+    total_withdrawals = ZERO
+    final_balance = ZERO
+    starting_balance = ZERO
     
-    for i, page_text in enumerate(pages_text, 1):
-        result = extract_transactions_with_llm(page_text, i)
-        total_deposits += result.get('deposits', 0.0)
-        total_withdrawals += result.get('withdrawals', 0.0)
-        
-        if result.get('balance', 0.0) > 0:
-            final_balance = result.get('balance', 0.0)
+    # Extract starting balance from first page (B/F line)
+    if len(pages_text):
+        # Starting balance should be reasonably large
+        starting_balance = find_starting_balance(pages_text[0], min_balance=100000)
+    
+    for result in extract_all_page_totals(pages_text, starting_balance, max_workers):
+        total_deposits += result.get('deposits', ZERO)
+        total_withdrawals += result.get('withdrawals', ZERO)
         
-        # Extract starting balance from first page (B/F line)
-        if i == 1 and starting_balance == 0.0:
-            # Look for B/F (brought forward) pattern - balance usually follows
-            lines = page_text.split('\n')
-            for idx, line in enumerate(lines):
-                if line.strip() == 'B/F' and idx + 1 < len(lines):
-                    # Next line or nearby should have the balance
-                    for j in range(1, 5):
-                        if idx + j < len(lines):
-                            # Match larger balances first (6+ digits with commas)
-                            balance_match = re.search(r'(\d{1,3}(?:,\d{3})+\.\d{2})', lines[idx + j])
-                            if balance_match:
-                                potential_balance = float(balance_match.group(1).replace(',', ''))
-                                # Starting balance should be reasonably large
-                                if potential_balance > 100000:
-                                    starting_balance = potential_balance
-                                    break
-                    if starting_balance > 0:
-                        break
+        if result.get('balance', ZERO) > 0:
+            final_balance = result.get('balance', ZERO)
     
     # Calculate starting balance from final balance and transactions
-    if starting_balance == 0.0 and final_balance > 0:
+    if starting_balance == 0 and final_balance > 0:
         starting_balance = final_balance - total_deposits + total_withdrawals
     
     return {
@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+"""
+Recategorize account transactions with the categorization rules.
+
+Usage:
+    python recategorize.py [--rules FILE] [--all] [--dry-run]
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+from actual import Actual
+from actual.utils.conversions import cents_to_decimal
+
+from budget_queries import get_account_transactions, get_name_ids, lookup_id
+from categorizer import RULES_PATH, categorize_all, compile_rules, load_rules
+
+ACTUAL_SERVER_URL = "http://localhost:5006"
+ACTUAL_PASSWORD = "guru123"
+ACTUAL_FILE = "My Finances"
+ACTUAL_ACCOUNT_NAME = "icici"
+
+
+def transaction_description(payee_name, notes):
+    """
+    Text the rules are matched against.
+
+    Imported transactions keep the statement particulars at the start of
+    their notes ("<particulars> | Page N | Balance: ..."); older imports and
+    manual entries fall back to the payee name.
+    """
+    if notes and ' | Page ' in notes:
+        return notes.split(' | Page ', 1)[0]
+    return payee_name or ''
+
+
+def recategorize_transactions(rules_path=RULES_PATH, include_categorized: bool = False, dry_run: bool = False):
+    """
+    Apply the categorization rules to the account's transactions.
+
+    The rules are matched against each transaction's statement particulars
+    (or payee name) in one batch.
+    Transactions no rule matches are left unchanged.
+
+    Args:
+        rules_path: Categorization rules JSON file
+        include_categorized: Also recategorize transactions that already
+            have a category
+        dry_run: Report the changes without committing them
+    """
+
+    print("=" * 60)
+    print("   RECATEGORIZING TRANSACTIONS WITH RULES")
+    print("=" * 60)
+
+    rules = load_rules(rules_path)
+    if not rules:
+        print(f"❌ No rules found in {rules_path}")
+        return
+    matcher = compile_rules(rules)
+    print(f"✓ Loaded {len(rules)} rule(s) from {rules_path}")
+
+    try:
+        with Actual(
+            base_url=ACTUAL_SERVER_URL,
+            password=ACTUAL_PASSWORD,
+            file=ACTUAL_FILE
+        ) as actual:
+            # Get the account
+            account_id = lookup_id(actual.session, 'accounts', ACTUAL_ACCOUNT_NAME)
+            if not account_id:
+                print(f"❌ Account '{ACTUAL_ACCOUNT_NAME}' not found!")
+                return
+
+            print(f"✓ Found account: {ACTUAL_ACCOUNT_NAME} (ID: {account_id})")
+
+            category_ids = get_name_ids(actual.session, 'categories')
+            payee_names = {payee_id: name for name, payee_id in get_name_ids(actual.session, 'payees').items()}
+
+            transactions = get_account_transactions(
+                actual.session, account_id, uncategorized=not include_categorized
+            )
+            print(f"✓ Found {len(transactions)} transaction(s) to check")
+
+            # Match every transaction in one pass
+            categories = categorize_all(matcher, [
+                (transaction_description(payee_names.get(txn.payee_id), txn.notes), cents_to_decimal(txn.amount or 0))
+                for txn in transactions
+            ])
+
+            print(f"\n📝 Updating categories...")
+            updated_count = 0
+            unmatched_count = 0
+            missing_categories = set()
+            for txn, category_name in zip(transactions, categories):
+                if category_name is None:
+                    unmatched_count += 1
+                    continue
+                category_id = category_ids.get(category_name)
+                if category_id is None:
+                    missing_categories.add(category_name)
+                    continue
+                if txn.category_id != category_id:
+                    txn.category_id = category_id
+                    updated_count += 1
+
+            if missing_categories:
+                print(f"⚠️  Rule categories not found in ActualBudget: {', '.join(sorted(missing_categories))}")
+
+            if dry_run:
+                print(f"\n🔍 DRY RUN - {updated_count} transaction(s) would be recategorized")
+                return
+
+            # Commit changes
+            actual.commit()
+            print(f"✅ Successfully recategorized {updated_count} transaction(s)")
+            print(f"   {unmatched_count} transaction(s) matched no rule")
+            print("=" * 60)
+
+    except Exception as e:
+        print(f"❌ Error: {e}")
+        import traceback
+        traceback.print_exc()
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Recategorize ActualBudget transactions with categorization rules')
+    parser.add_argument('--rules', '-r', default=str(RULES_PATH), help='Categorization rules JSON file')
+    parser.add_argument('--all', '-a', action='store_true',
+                        help='Also recategorize transactions that already have a category')
+    parser.add_argument('--dry-run', '-d', action='store_true', help="Preview without committing")
+
+    args = parser.parse_args()
+
+    if not Path(args.rules).exists():
+        print(f"❌ Rules file not found: {args.rules}")
+        sys.exit(1)
+
+    recategorize_transactions(args.rules, include_categorized=args.all, dry_run=args.dry_run)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,424 @@
+"""
+Column-geometry parser for ICICI statement pages.
+
+Instead of guessing from the order of text lines, this reads every span of
+a page with its position (PyMuPDF's get_text('dict')) and puts it in a
+column by where it sits on the page. Deposits and withdrawals are read from
+their own columns, so no balance reconstruction is needed, and each page's
+Total: row can be checked against the rows above it.
+
+Column boundaries are calibrated from the header row
+(DATE | MODE | PARTICULARS | DEPOSITS | WITHDRAWALS | BALANCE): a column
+runs from its header's left edge to the next header's left edge. Spans are
+placed by their right edge, since amounts are right-aligned under their
+header. Calibrated layouts are cached by a fingerprint of the header, so
+later pages and statements of the same template only need to find the
+header at its known position.
+
+Rows are anchored on the date spans. Particulars wrap over several lines
+above and below the date, so every other span belongs to the row whose date
+is nearest vertically.
+"""
+
+import hashlib
+from bisect import bisect_left, bisect_right
+
+try:
+    import numpy as np
+except ImportError:  # optional "fast" extra; bucketing falls back to a bisect per span
+    np = None
+
+from payees import normalize_payee
+from pdf_reader_ocr import open_pdf
+from statement_parser import AMOUNT_PATTERN, DATE_PATTERN, ZERO, Transaction, parse_amount, row_description
+
+HEADER_NAMES = ('DATE', 'MODE', 'PARTICULARS', 'DEPOSITS', 'WITHDRAWALS', 'BALANCE')
+REQUIRED_COLUMNS = {'DATE', 'PARTICULARS', 'DEPOSITS', 'WITHDRAWALS', 'BALANCE'}
+# Row field each column fills
+COLUMN_FIELDS = {'PARTICULARS': 'description_parts', 'DEPOSITS': 'deposit', 'WITHDRAWALS': 'withdrawal',
+                 'BALANCE': 'balance'}
+TOTAL_KEYS = {'deposit': 'deposits', 'withdrawal': 'withdrawals', 'balance': 'balance'}
+
+# Spans whose vertical centres are this close (in points) share a line
+LINE_TOLERANCE = 2.0
+# Header positions are fingerprinted and matched to within this many points
+LAYOUT_PRECISION = 1.0
+# Pages with fewer spans are bucketed in pure Python. Building the NumPy
+# arrays costs about as much as the vectorized lookups save until pages are
+# this large (benchmarks/bench_span_bucketing.py); statement pages have ~160
+NUMPY_MIN_SPANS = 1500
+
+# Calibrated layouts by fingerprint, reused by every page and statement
+# parsed in this process
+_layouts = {}
+
+
+def page_spans(page):
+    """
+    Return the non-blank text spans of a PyMuPDF page.
+
+    Returns:
+        List of (x0, y, x1, text) tuples sorted top to bottom, y being the
+        span's vertical centre
+    """
+    spans = []
+    for block in page.get_text('dict')['blocks']:
+        for line in block.get('lines', ()):
+            for span in line['spans']:
+                text = span['text'].strip()
+                if text:
+                    x0, y0, x1, y1 = span['bbox']
+                    spans.append((x0, (y0 + y1) / 2, x1, text))
+    spans.sort(key=lambda span: (span[1], span[0]))
+    return spans
+
+
+def layout_fingerprint(header_row):
+    """
+    Return the hash identifying a statement template.
+
+    Args:
+        header_row: Header spans, left to right
+
+    Returns:
+        Hex digest of the header names and their left edges, rounded to
+        LAYOUT_PRECISION points
+    """
+    raw = '|'.join(f"{text}@{round(x0 / LAYOUT_PRECISION)}" for x0, _, _, text in header_row)
+    return hashlib.sha256(raw.encode('utf-8')).hexdigest()[:16]
+
+
+def calibrate(header_row):
+    """
+    Derive the column boundaries of a template from its header spans.
+
+    Returns:
+        Layout dict with 'fingerprint', 'names' and 'lefts' (column names
+        and left edges, left to right), 'date_end' (where the DATE column
+        ends) and 'fields' (the row field each column fills, None for
+        columns that are not read)
+    """
+    names = [text for _, _, _, text in header_row]
+    lefts = [x0 for x0, _, _, _ in header_row]
+    return {
+        'fingerprint': layout_fingerprint(header_row),
+        'names': names,
+        'lefts': lefts,
+        'date_end': lefts[names.index('DATE') + 1],
+        'fields': [COLUMN_FIELDS.get(name) for name in names]
+    }
+
+
+def find_header(spans, layout):
+    """
+    Look for a calibrated layout's header row on a page.
+
+    Every header name must be on one line at its calibrated left edge, so a
+    template that reorders the middle columns is not mistaken for this one.
+
+    Returns:
+        The header line's centre, or None if the page does not match
+    """
+    names, lefts = layout['names'], layout['lefts']
+    for x0, y, _, text in spans:
+        if text != names[0] or abs(x0 - lefts[0]) > LAYOUT_PRECISION:
+            continue
+        line = [span for span in spans if abs(span[1] - y) <= LINE_TOLERANCE and span[3] in HEADER_NAMES]
+        if all(any(text == name and abs(x0 - left) <= LAYOUT_PRECISION for x0, _, _, text in line)
+               for name, left in zip(names[1:], lefts[1:])):
+            return y
+    return None
+
+
+def detect_columns(spans):
+    """
+    Find the table header and the column boundaries of a page.
+
+    Layouts calibrated earlier in this process are tried first, so pages
+    and statements of a known template skip calibration. Otherwise the
+    header row is found among all spans, fingerprinted and calibrated once
+    per fingerprint.
+
+    Args:
+        spans: Spans from page_spans
+
+    Returns:
+        Layout dict (see calibrate) plus 'y', the header line's centre, or
+        None if the page has no transaction table
+    """
+    for layout in _layouts.values():
+        y = find_header(spans, layout)
+        if y is not None:
+            return dict(layout, y=y)
+
+    headers = [span for span in spans if span[3] in HEADER_NAMES]
+    for x0, y, x1, text in headers:
+        row = sorted(span for span in headers if abs(span[1] - y) <= LINE_TOLERANCE)
+        names = [span[3] for span in row]
+        if REQUIRED_COLUMNS <= set(names) and len(set(names)) == len(names):
+            fingerprint = layout_fingerprint(row)
+            layout = _layouts.get(fingerprint)
+            if layout is None:
+                layout = _layouts[fingerprint] = calibrate(row)
+            return dict(layout, y=y)
+    return None
+
+
+def _bucket_spans_python(spans, columns):
+    """Reference bucketing with a bisect per span; see bucket_spans."""
+    top = columns['y'] + LINE_TOLERANCE
+    lefts = columns['lefts']
+    fields = columns['fields']
+    date_end = columns['date_end']
+
+    dates = []
+    anchors = []
+    cells = []
+    total_y = None
+    for x0, y, x1, text in spans:
+        if y <= top:
+            continue
+        if text == 'Total:':
+            total_y = y
+            break
+        if x0 < date_end:
+            date_match = DATE_PATTERN.match(text)
+            if date_match:
+                dates.append(date_match.group(1))
+                anchors.append(y)
+            continue
+        field = fields[bisect_right(lefts, x1) - 1]
+        if field is not None:
+            cells.append((y, field, text))
+
+    assignments = []
+    if anchors:
+        for y, field, text in cells:
+            if total_y is not None and y >= total_y - LINE_TOLERANCE:
+                break
+            # Nearest date anchor vertically
+            index = bisect_left(anchors, y)
+            if index == len(anchors) or (index > 0 and y - anchors[index - 1] <= anchors[index] - y):
+                index -= 1
+            assignments.append((index, field, text))
+
+    total_cells = None
+    if total_y is not None:
+        total_cells = [
+            (fields[bisect_right(lefts, x1) - 1], text) for x0, y, x1, text in spans
+            if abs(y - total_y) <= LINE_TOLERANCE and x0 >= date_end
+        ]
+    return dates, assignments, total_cells
+
+
+def _bucket_spans_numpy(spans, columns):
+    """Vectorized bucketing with searchsorted over the page's coordinates; see bucket_spans."""
+    texts = [span[3] for span in spans]
+    coords = np.array([span[:3] for span in spans], dtype=float).reshape(-1, 3)
+    x0, y, x1 = coords[:, 0], coords[:, 1], coords[:, 2]
+    date_end = columns['date_end']
+    field_names = columns['fields']
+    # Field index per column, -1 for columns that are not read
+    field_index = np.array([-1 if field is None else i for i, field in enumerate(field_names)])
+
+    # Spans are sorted by y, so the table is one slice
+    start = int(np.searchsorted(y, columns['y'] + LINE_TOLERANCE, side='right'))
+    try:
+        end = texts.index('Total:', start)
+        total_y = y[end]
+    except ValueError:
+        end = len(texts)
+        total_y = None
+
+    table_x0 = x0[start:end]
+    date_spans = start + np.flatnonzero(table_x0 < date_end)
+    dates = []
+    anchors = []
+    for i in date_spans.tolist():
+        date_match = DATE_PATTERN.match(texts[i])
+        if date_match:
+            dates.append(date_match.group(1))
+            anchors.append(y[i])
+
+    assignments = []
+    if anchors:
+        keep = table_x0 >= date_end
+        if total_y is not None:
+            keep &= y[start:end] < total_y - LINE_TOLERANCE
+        cell_spans = start + np.flatnonzero(keep)
+        fields = field_index[np.searchsorted(columns['lefts'], x1[cell_spans], side='right') - 1]
+        cell_spans = cell_spans[fields >= 0]
+        fields = fields[fields >= 0]
+
+        # Nearest date anchor vertically, ties going to the earlier row
+        anchor_y = np.array(anchors)
+        cell_y = y[cell_spans]
+        after = np.searchsorted(anchor_y, cell_y, side='left')
+        before = np.maximum(after - 1, 0)
+        next_y = anchor_y[np.minimum(after, len(anchor_y) - 1)]
+        use_before = (after == len(anchor_y)) | ((after > 0) & (cell_y - anchor_y[before] <= next_y - cell_y))
+        rows = np.where(use_before, after - 1, after)
+        assignments = [(row, field_names[field], texts[i])
+                       for row, field, i in zip(rows.tolist(), fields.tolist(), cell_spans.tolist())]
+
+    total_cells = None
+    if total_y is not None:
+        on_total = np.flatnonzero((np.abs(y - total_y) <= LINE_TOLERANCE) & (x0 >= date_end))
+        columns_hit = np.searchsorted(columns['lefts'], x1[on_total], side='right') - 1
+        total_cells = [(field_names[column], texts[i]) for column, i in zip(columns_hit.tolist(), on_total.tolist())]
+    return dates, assignments, total_cells
+
+
+def bucket_spans(spans, columns):
+    """
+    Assign a page's spans to rows and columns.
+
+    Pages with at least NUMPY_MIN_SPANS spans are bucketed with NumPy
+    (searchsorted on the span coordinates) when it is installed; smaller
+    pages, where building the arrays costs more than it saves, use the pure
+    Python bisect version. Both give the same result.
+
+    Args:
+        spans: Spans from page_spans
+        columns: Column layout from detect_columns
+
+    Returns:
+        Tuple of (dates, assignments, total_cells): the date of each row in
+        order, (row index, field, text) for every read span in the table,
+        and (field, text) for the spans on the Total: line (None if the page
+        has no Total: row)
+    """
+    if np is not None and len(spans) >= NUMPY_MIN_SPANS:
+        return _bucket_spans_numpy(spans, columns)
+    return _bucket_spans_python(spans, columns)
+
+
+def parse_page(spans, columns=None):
+    """
+    Read the rows of one statement page by column.
+
+    Args:
+        spans: Spans from page_spans
+        columns: Column layout from detect_columns (default: detected from
+            spans)
+
+    Returns:
+        Dict with 'rows' and 'totals', or None if the page has no table.
+        Rows are dicts with 'date', 'description_parts', 'deposit',
+        'withdrawal', 'balance' (Decimal, or None when the cell is empty)
+        and 'marker' (None for transactions, 'B/F' for the opening
+        balance). totals holds the Total: row's 'deposits', 'withdrawals'
+        and 'balance', or None if the page has no Total: row.
+    """
+    if columns is None:
+        columns = detect_columns(spans)
+        if columns is None:
+            return None
+
+    dates, assignments, total_cells = bucket_spans(spans, columns)
+
+    rows = [{'date': date, 'description_parts': [], 'deposit': None, 'withdrawal': None,
+             'balance': None, 'marker': None} for date in dates]
+    for index, field, text in assignments:
+        row = rows[index]
+        if field != 'description_parts':
+            if AMOUNT_PATTERN.fullmatch(text):
+                row[field] = parse_amount(text)
+        elif text == 'B/F':
+            row['marker'] = 'B/F'
+        elif text != '/':
+            row['description_parts'].append(text)
+
+    totals = None
+    if total_cells is not None:
+        totals = {'deposits': ZERO, 'withdrawals': ZERO, 'balance': None}
+        for field, text in total_cells:
+            key = TOTAL_KEYS.get(field)
+            if key and AMOUNT_PATTERN.fullmatch(text):
+                totals[key] = parse_amount(text)
+
+    return {'rows': rows, 'totals': totals}
+
+
+def iter_pdf_pages(pdf_path, password=None):
+    """
+    Yield the parsed pages of a statement PDF.
+
+    Yields:
+        (page number, parse_page result) for every page with a table
+    """
+    doc = open_pdf(pdf_path, password)
+    try:
+        for page_num in range(len(doc)):
+            page = parse_page(page_spans(doc[page_num]))
+            if page is not None:
+                yield page_num + 1, page
+    finally:
+        doc.close()
+
+
+def parse_statement_columns(pdf_path, password=None):
+    """
+    Parse a statement by column geometry.
+
+    Each page's transactions are checked against its Total: row, and the
+    summary is built from the B/F row and the last balance, so no LLM is
+    involved.
+
+    Returns:
+        Dictionary with 'transactions' (Transaction records), 'summary'
+        (the same keys as pdf_reader_ocr.process_bank_statement) and
+        'mismatched_pages' (page numbers whose rows don't add up to their
+        Total: row)
+    """
+    transactions = []
+    mismatched_pages = []
+    starting_balance = None
+    final_balance = ZERO
+
+    for page_num, page in iter_pdf_pages(pdf_path, password):
+        page_transactions = []
+        for row in page['rows']:
+            if row['marker'] == 'B/F':
+                if starting_balance is None:
+                    starting_balance = row['balance']
+                continue
+            if row['balance'] is None or (row['deposit'] is None and row['withdrawal'] is None):
+                continue
+            page_transactions.append(Transaction(
+                date=row['date'],
+                description=row_description(row['description_parts']),
+                deposit=row['deposit'] or ZERO,
+                withdrawal=row['withdrawal'] or ZERO,
+                balance=row['balance'],
+                page=page_num,
+                payee=normalize_payee(' '.join(row['description_parts']))
+            ))
+
+        totals = page['totals']
+        if totals is not None and (
+                sum(t.deposit for t in page_transactions) != totals['deposits']
+                or sum(t.withdrawal for t in page_transactions) != totals['withdrawals']):
+            mismatched_pages.append(page_num)
+            print(f"⚠️  Page {page_num}: rows don't add up to the Total: row")
+
+        transactions.extend(page_transactions)
+        if page_transactions:
+            final_balance = page_transactions[-1].balance
+
+    total_deposits = sum((t.deposit for t in transactions), ZERO)
+    total_withdrawals = sum((t.withdrawal for t in transactions), ZERO)
+    if starting_balance is None:
+        starting_balance = final_balance - total_deposits + total_withdrawals
+
+    print(f"✓ Read {len(transactions)} transactions by column")
+    return {
+        'transactions': transactions,
+        'summary': {
+            'starting_balance': starting_balance,
+            'total_deposits': total_deposits,
+            'total_withdrawals': total_withdrawals,
+            'final_balance': final_balance
+        },
+        'mismatched_pages': mismatched_pages
+    }
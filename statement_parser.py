@@ -0,0 +1,201 @@
+"""
+Single-pass line parser for ICICI statement page text.
+
+Each line of a page is classified exactly once (date, amounts, marker,
+blank or description text) and fed through a small state machine that
+emits one row per dated entry. Rows carry the raw description parts and
+amounts; callers decide how to turn them into deposits and withdrawals.
+
+Amounts are parsed straight into Decimal rupees, so balances can be added
+and subtracted exactly and handed to ActualBudget without any float
+round-trip. Parsed transactions are Transaction records, shared by the
+parser, the page total verifier and the importer.
+
+Statement format (one span per line in the extracted text):
+DATE | MODE | PARTICULARS | DEPOSITS | WITHDRAWALS | BALANCE
+"""
+
+import re
+from dataclasses import dataclass
+from decimal import Decimal
+
+DATE_PATTERN = re.compile(r'^(\d{2}-\d{2}-\d{4})')
+AMOUNT_PATTERN = re.compile(r'[\d,]+\.\d{2}')
+
+ZERO = Decimal('0.00')
+
+# Line kinds
+BLANK = 0
+DATE = 1
+AMOUNTS = 2
+MARKER = 3
+TEXT = 4
+
+# Lines after a date that may hold its description and amounts
+MAX_ROW_LINES = 9
+
+# Parser states
+_IDLE = 0
+_DATE_SEEN = 1
+_IN_ROW = 2
+_AFTER_BF = 3
+
+
+@dataclass(slots=True)
+class Transaction:
+    """
+    One parsed statement transaction.
+
+    Slotted, so multi-year histories held in memory cost a fixed few
+    attributes per row instead of a dict each.
+
+    Attributes:
+        date: Date as printed (DD-MM-YYYY)
+        description: Cleaned-up particulars
+        deposit: Amount credited, ZERO for withdrawals
+        withdrawal: Amount debited, ZERO for deposits
+        balance: Running balance after the transaction
+        page: Statement page number, if known
+        payee: Normalized payee name (see payees.normalize_payee), if known
+    """
+    date: str
+    description: str
+    deposit: Decimal = ZERO
+    withdrawal: Decimal = ZERO
+    balance: Decimal = ZERO
+    page: int = None
+    payee: str = None
+
+    @property
+    def amount(self):
+        """Signed amount, positive for deposits."""
+        return self.deposit - self.withdrawal
+
+
+def parse_amount(text):
+    """Parse a statement amount such as '6,49,739.05' into a Decimal."""
+    return Decimal(text.replace(',', ''))
+
+
+def to_amount(value):
+    """Convert a Decimal, int, float or numeric string into a Decimal amount."""
+    if isinstance(value, Decimal):
+        return value
+    return Decimal(str(value))
+
+
+def row_description(description_parts):
+    """
+    Build a transaction description from a row's particulars lines.
+
+    Keeps the first three lines with slashes turned into spaces, capped at
+    100 characters; 'Transaction' when the row has no particulars.
+    """
+    description = ' '.join(description_parts[:3]).replace('/', ' ')[:100]
+    return description or 'Transaction'
+
+
+def classify_line(line):
+    """
+    Classify one stripped line of page text.
+
+    Returns:
+        Tuple of (kind, value): the date string for DATE, the list of
+        amounts for AMOUNTS, the marker text for MARKER and the line itself
+        otherwise
+    """
+    if not line:
+        return BLANK, line
+    if line in ('B/F', 'C/F') or 'Total:' in line:
+        return MARKER, line
+    if line[0].isdigit():
+        date_match = DATE_PATTERN.match(line)
+        if date_match:
+            return DATE, date_match.group(1)
+    # Every amount has a decimal point, so most description lines skip the regex
+    if '.' in line:
+        amounts = AMOUNT_PATTERN.findall(line)
+        if amounts:
+            return AMOUNTS, [Decimal(amt.replace(',', '')) for amt in amounts]
+    return TEXT, line
+
+
+def parse_rows(page_text):
+    """
+    Parse the dated rows of a page in one linear pass.
+
+    A row starts at a date line and collects description lines until two
+    amounts (transaction amount and balance) have been seen, another date or
+    a B/F, C/F or Total: marker is reached, or MAX_ROW_LINES lines have gone
+    by. A date followed directly by a marker is not a transaction; for B/F
+    the brought-forward balance is emitted as a marker row instead.
+
+    Args:
+        page_text: Extracted text from PDF page
+
+    Yields:
+        Row dictionaries with 'date', 'description_parts', 'amounts' and
+        'marker' (None for transactions, 'B/F' for the opening balance).
+        Rows without any amounts are dropped.
+    """
+    state = _IDLE
+    date_str = None
+    description_parts = []
+    amounts = []
+    row_lines = 0
+
+    for raw_line in page_text.split('\n'):
+        kind, value = classify_line(raw_line.strip())
+
+        if state == _DATE_SEEN:
+            if kind == MARKER:
+                state = _AFTER_BF if value == 'B/F' else _IDLE
+                continue
+            state = _IN_ROW
+
+        if state == _IN_ROW:
+            if kind == AMOUNTS:
+                amounts.extend(value)
+            elif kind == TEXT and value != '/':
+                description_parts.append(value)
+
+            row_lines += 1
+            row_done = kind in (DATE, MARKER) or len(amounts) >= 2 or row_lines >= MAX_ROW_LINES
+            if not row_done:
+                continue
+
+            if amounts:
+                yield {
+                    'date': date_str,
+                    'description_parts': description_parts,
+                    'amounts': amounts,
+                    'marker': None
+                }
+            state = _IDLE
+            if kind != DATE:
+                continue
+
+        elif state == _AFTER_BF and kind == AMOUNTS:
+            yield {
+                'date': date_str,
+                'description_parts': [],
+                'amounts': value,
+                'marker': 'B/F'
+            }
+            state = _IDLE
+            continue
+
+        if kind == DATE:
+            state = _DATE_SEEN
+            date_str = value
+            description_parts = []
+            amounts = []
+            row_lines = 0
+
+    if state == _IN_ROW and amounts:
+        yield {
+            'date': date_str,
+            'description_parts': description_parts,
+            'amounts': amounts,
+            'marker': None
+        }
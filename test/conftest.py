@@ -0,0 +1,12 @@
+import pytest
+from sqlmodel import Session, SQLModel, create_engine
+
+from actual.database import strong_reference_session
+
+
+@pytest.fixture
+def session():
+    """Session on an empty in-memory budget database."""
+    engine = create_engine("sqlite://")
+    SQLModel.metadata.create_all(engine)
+    return strong_reference_session(Session(engine))
@@ -7,6 +7,7 @@ import os
 from pathlib import Path
 from import_detailed import parse_individual_transactions
 from pdf_reader_ocr import extract_text_from_pdf, process_bank_statement
+import llm_cache
 
 PDF_PASSWORD = "guru2111"
 PDFS_DIR = "pdfs"
@@ -31,16 +32,18 @@ def test_all_pdfs():
         print('='*100)
         
         try:
+            # Extract page text once for both steps
+            pages_text = extract_text_from_pdf(str(pdf_path), PDF_PASSWORD)
+            
             # Get verified summary
-            summary = process_bank_statement(str(pdf_path), PDF_PASSWORD)
+            summary = process_bank_statement(str(pdf_path), PDF_PASSWORD, pages_text=pages_text)
             
             # Parse individual transactions
-            pages_text = extract_text_from_pdf(str(pdf_path), PDF_PASSWORD)
             transactions = parse_individual_transactions(pages_text, summary['starting_balance'])
             
             # Calculate totals
-            calc_deposits = sum(t['deposit'] for t in transactions)
-            calc_withdrawals = sum(t['withdrawal'] for t in transactions)
+            calc_deposits = sum(t.deposit for t in transactions)
+            calc_withdrawals = sum(t.withdrawal for t in transactions)
             calc_final = summary['starting_balance'] + calc_deposits - calc_withdrawals
             
             # Verify
@@ -104,6 +107,10 @@ def test_all_pdfs():
     print("-" * 100)
     print(f"\nTotal: {passed_count}/{len(results)} PDFs passed verification")
     
+    cache_stats = llm_cache.get_stats()
+    print(f"LLM cache: {cache_stats['hits']} hits, {cache_stats['misses']} misses "
+          f"({cache_stats['hit_rate']:.0%} hit rate)")
+    
     if passed_count == len(results):
         print("\n🎉 ALL TESTS PASSED! The detailed extraction method is working correctly.")
     else:
@@ -0,0 +1,89 @@
+import datetime
+import decimal
+
+from actual.queries import create_account, create_category, create_transaction
+
+from budget_queries import (
+    count_account_transactions, get_account_transactions, get_name_ids, lookup_id, tombstone_account_transactions
+)
+
+
+def test_account_scoped_filters(session):
+    icici = create_account(session, "icici")
+    other = create_account(session, "other")
+    category = create_category(session, "General", "Usual Expenses")
+    session.flush()
+
+    def add(account, notes, day, categorized=False):
+        txn = create_transaction(session, datetime.date(2025, 8, day), account, "Shop",
+                                 notes=notes, amount=decimal.Decimal("-10"))
+        if categorized:
+            txn.category_id = category.id
+        return txn
+
+    add(icici, "Imported from bank statement | Row 1", 1)
+    add(icici, "Imported from bank statement | Row 2", 2, categorized=True)
+    add(icici, "manual 100%_off", 3)
+    add(other, "Imported from bank statement | Row 3", 4)
+    add(icici, "Imported from bank statement | Row 4", 5).delete()
+    session.flush()
+
+    assert count_account_transactions(session, icici.id) == 3
+    assert count_account_transactions(session) == 4
+    assert len(get_account_transactions(session, icici.id, uncategorized=True)) == 2
+
+    imported = get_account_transactions(session, uncategorized=True, notes_contains="imported FROM bank")
+    assert sorted(t.notes for t in imported) == [
+        "Imported from bank statement | Row 1",
+        "Imported from bank statement | Row 3"
+    ]
+
+    # LIKE wildcards in the search text are matched literally
+    assert [t.notes for t in get_account_transactions(session, notes_contains="%_off")] == ["manual 100%_off"]
+    assert count_account_transactions(session, notes_contains="0_o") == 0
+
+    in_range = get_account_transactions(session, icici.id, start_date=datetime.date(2025, 8, 2),
+                                        end_date=datetime.date(2025, 8, 3))
+    assert [t.notes for t in in_range] == ["Imported from bank statement | Row 2"]
+
+
+def test_tombstone_account_transactions(session):
+    icici = create_account(session, "icici")
+    other = create_account(session, "other")
+    session.flush()
+
+    kept = create_transaction(session, datetime.date(2025, 7, 31), icici, "Shop", amount=decimal.Decimal("-1"))
+    for day in range(1, 6):
+        create_transaction(session, datetime.date(2025, 8, day), icici, "Shop", amount=decimal.Decimal("-1"))
+    create_transaction(session, datetime.date(2025, 8, 2), other, "Shop", amount=decimal.Decimal("-1"))
+    session.commit()
+
+    deleted = tombstone_account_transactions(session, icici.id, start_date=datetime.date(2025, 8, 1), batch_size=2)
+    assert deleted == 5
+    assert count_account_transactions(session, icici.id) == 1
+    assert count_account_transactions(session, other.id) == 1
+    assert kept.tombstone == 0
+
+    # One tombstone sync message per deleted row
+    messages = session.info["messages"]
+    assert len(messages) == 5
+    assert {(m.dataset, m.column, m.value) for m in messages} == {("transactions", "tombstone", "N:1")}
+
+
+def test_name_ids_cached_until_commit(session):
+    account = create_account(session, "icici")
+    category = create_category(session, "General", "Usual Expenses")
+    session.flush()
+
+    assert lookup_id(session, 'accounts', "icici") == account.id
+    category_ids = get_name_ids(session, 'categories')
+    assert category_ids["General"] == category.id
+    assert get_name_ids(session, 'categories') is category_ids
+
+    # Rows added later are not seen until the cache is dropped by a commit
+    food = create_category(session, "Food", "Usual Expenses")
+    session.flush()
+    assert lookup_id(session, 'categories', "Food") is None
+    session.commit()
+    assert lookup_id(session, 'categories', "Food") == food.id
+    assert lookup_id(session, 'payees', "Nobody") is None
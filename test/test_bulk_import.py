@@ -0,0 +1,173 @@
+import dataclasses
+import datetime
+import decimal
+import types
+
+import pytest
+from sqlmodel import select
+
+from actual.database import Payees, Transactions
+from actual.queries import create_account, create_category
+
+import import_detailed
+from budget_queries import load_name_ids
+from bulk_import import bulk_create_transactions, get_account_checkpoint
+from categorizer import compile_rules
+from import_detailed import post_transactions, transaction_fingerprint, transactions_after_checkpoint
+from statement_parser import Transaction
+
+
+def test_bulk_create_transactions(session):
+    account = create_account(session, "icici")
+    category = create_category(session, "General", "Usual Expenses")
+    session.flush()
+
+    rows = [
+        {
+            'date': datetime.date(2025, 8, 1),
+            'payee': f"Merchant {i % 3}",
+            'notes': f"Page 1 | Row {i}",
+            'amount': decimal.Decimal("-12.50"),
+            'category_id': category.id
+        }
+        for i in range(7)
+    ]
+    payee_ids = load_name_ids(session, 'payees')
+    assert bulk_create_transactions(session, account.id, rows, batch_size=2, payee_ids=payee_ids) == 7
+
+    transactions = session.exec(select(Transactions).where(Transactions.acct == account.id)).all()
+    assert len(transactions) == 7
+    assert all(t.category_id == category.id and t.amount == -1250 for t in transactions)
+
+    # Each distinct payee is created once and remembered for later calls
+    names = [p.name for p in session.exec(select(Payees)).all()]
+    assert sorted(n for n in names if n and n.startswith("Merchant")) == ["Merchant 0", "Merchant 1", "Merchant 2"]
+    assert {"Merchant 0", "Merchant 1", "Merchant 2"} <= set(payee_ids)
+
+
+def test_reimport_skips_existing_imported_ids(session):
+    account = create_account(session, "icici")
+    session.flush()
+
+    rows = [
+        {
+            'date': datetime.date(2025, 8, 1),
+            'payee': "Opening Balance",
+            'notes': "",
+            'amount': decimal.Decimal("100.00"),
+            'imported_id': f"pdf:{i}"
+        }
+        for i in range(3)
+    ]
+    assert bulk_create_transactions(session, account.id, rows) == 3
+    assert bulk_create_transactions(session, account.id, rows + [dict(rows[0], imported_id="pdf:new")]) == 1
+
+    # A fresh index loaded from the database sees the same ids
+    session.info.pop("imported_ids")
+    assert bulk_create_transactions(session, account.id, rows) == 0
+
+
+def test_rollback_forgets_uncommitted_imported_ids(session):
+    account = create_account(session, "icici")
+    session.commit()
+    account_id = account.id
+
+    rows = [
+        {
+            'date': datetime.date(2025, 8, 1),
+            'payee': "Opening Balance",
+            'notes': "",
+            'amount': decimal.Decimal("100.00"),
+            'imported_id': f"pdf:{i}"
+        }
+        for i in range(3)
+    ]
+    assert bulk_create_transactions(session, account_id, rows[:1]) == 1
+    session.commit()
+    assert bulk_create_transactions(session, account_id, rows[1:]) == 2
+    session.rollback()
+
+    # Only the committed row is still skipped
+    assert bulk_create_transactions(session, account_id, rows) == 2
+
+
+def test_transaction_fingerprint_ignores_description_formatting():
+    txn = Transaction(date='01-08-2025', description='UPI  Saravanan breakfast', deposit=decimal.Decimal("0.00"),
+                      withdrawal=decimal.Decimal("45.00"), balance=decimal.Decimal("645694.05"))
+    same = dataclasses.replace(txn, description='upi saravanan BREAKFAST')
+    assert transaction_fingerprint(txn, "abc") == transaction_fingerprint(same, "abc")
+    assert transaction_fingerprint(txn, "abc") != transaction_fingerprint(
+        dataclasses.replace(txn, balance=decimal.Decimal("1.00")), "abc")
+    assert transaction_fingerprint(txn, "abc") != transaction_fingerprint(txn, "def")
+
+
+def test_account_checkpoint_and_tail(session):
+    account = create_account(session, "icici")
+    session.flush()
+    assert get_account_checkpoint(session, account.id) is None
+
+    rows = [
+        {'date': datetime.date(2025, 8, 1), 'payee': "Opening Balance", 'notes': "",
+         'amount': decimal.Decimal("1000.00")},
+        {'date': datetime.date(2025, 8, 2), 'payee': "Shop", 'notes': "",
+         'amount': decimal.Decimal("-45.00")},
+    ]
+    bulk_create_transactions(session, account.id, rows)
+    last_date, balance = get_account_checkpoint(session, account.id)
+    assert last_date == datetime.date(2025, 8, 2)
+    assert balance == decimal.Decimal("955.00")
+
+    parsed = [
+        Transaction(date='02-08-2025', description='Shop', withdrawal=decimal.Decimal("45.00"),
+                    balance=decimal.Decimal("955.00")),
+        Transaction(date='03-08-2025', description='Shop', withdrawal=decimal.Decimal("5.00"),
+                    balance=decimal.Decimal("950.00")),
+    ]
+    assert transactions_after_checkpoint(parsed, last_date, balance) == parsed[1:]
+    assert transactions_after_checkpoint(parsed, last_date, decimal.Decimal("1.00")) is None
+    # Next statement starting at the account balance is imported whole
+    assert transactions_after_checkpoint(parsed[1:], last_date, balance, starting_balance=decimal.Decimal("955.00")) == parsed[1:]
+
+
+def test_failed_statement_is_rolled_back_in_shared_session(session, monkeypatch):
+    account = create_account(session, "icici")
+    session.commit()
+    account_id = account.id
+    row = {'date': datetime.date(2025, 8, 1), 'payee': "Shop", 'notes': "", 'amount': decimal.Decimal("-45.00"),
+           'imported_id': "pdf:1"}
+
+    def post_then_fail(actual, *args, **kwargs):
+        bulk_create_transactions(actual.session, account_id, [row])
+        raise RuntimeError("sync failed")
+
+    monkeypatch.setattr(import_detailed, "post_transactions", post_then_fail)
+    actual = types.SimpleNamespace(session=session)
+    parsed = {'summary': {'starting_balance': decimal.Decimal("1000.00"), 'final_balance': decimal.Decimal("955.00")},
+              'transactions': [Transaction(date='01-08-2025', description='Shop', withdrawal=decimal.Decimal("45.00"),
+                                           balance=decimal.Decimal("955.00"))]}
+
+    assert import_detailed.import_detailed_transactions("aug.pdf", parsed=parsed, actual=actual) is False
+    assert session.exec(select(Transactions).where(Transactions.acct == account_id)).all() == []
+    assert not session.info.get("messages")
+    # The row was never saved, so the next statement imports it
+    assert bulk_create_transactions(session, account_id, [row]) == 1
+
+
+def test_incremental_import_refuses_unmatched_checkpoint(session):
+    account = create_account(session, "icici")
+    create_category(session, "Income", "Income")
+    create_category(session, "General", "Usual Expenses")
+    session.flush()
+    bulk_create_transactions(session, account.id, [
+        {'date': datetime.date(2025, 8, 1), 'payee': "Opening Balance", 'notes': "",
+         'amount': decimal.Decimal("1000.00")},
+    ])
+    session.commit()
+
+    actual = types.SimpleNamespace(session=session, commit=session.commit)
+    summary = {'starting_balance': decimal.Decimal("5000.00")}
+    statement = [Transaction(date='05-10-2025', description='Shop', withdrawal=decimal.Decimal("45.00"),
+                             balance=decimal.Decimal("4955.00"))]
+    with pytest.raises(RuntimeError, match="No transaction matches"):
+        post_transactions(actual, summary, statement, incremental=True, rules=compile_rules([]))
+    assert len(session.exec(select(Transactions).where(Transactions.acct == account.id)).all()) == 1
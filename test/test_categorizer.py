@@ -0,0 +1,93 @@
+import random
+from decimal import Decimal
+from pathlib import Path
+
+import pytest
+
+from categorizer import categorize_all, compile_rules, load_rules, match_rule, transaction_mode
+
+EXAMPLE_RULES = Path(__file__).resolve().parent.parent / "categorization_rules.example.json"
+# Descriptions as parsed from the sample statements
+NEFT_DEPOSIT = "NEFT-HDFCN52025110885797277-INDSTOCKS PVT LTD DSCNB A C-0001-575000014"
+IMPS_DEPOSIT = "MMT IMPS 523213661112 dad VELUSAMY K BARB0SENJER"
+
+RULES = [
+    {"category": "Food", "contains": ["breakfast", "lunch", "briyani"]},
+    {"category": "Transport", "regex": r"\bauto\b", "max_amount": 500},
+    {"category": "Rent", "contains": "rent", "direction": "withdrawal", "min_amount": 1000},
+    {"category": "Shopping", "contains": "Amazon"},
+    {"category": "Bills", "mode": ["ACH", "BIL"], "direction": "withdrawal"},
+    {"category": "Income", "mode": "NEFT", "direction": "deposit"},
+]
+
+
+def test_match_rule():
+    matcher = compile_rules(RULES)
+    assert match_rule(matcher, "UPI Saravanan paytmqr6b1nv5@ breakfast YES BANK L", -45) == "Food"
+    assert match_rule(matcher, "UPI Mr KARTHIC 6381038431@axl auto CITY UNION", Decimal("-15")) == "Transport"
+    # Amount range and direction
+    assert match_rule(matcher, "UPI Mr KARTHIC 6381038431@axl auto CITY UNION", -900) is None
+    assert match_rule(matcher, "UPI adimuthani rent ac an ICICI Bank", -1409) == "Rent"
+    assert match_rule(matcher, "UPI adimuthani rent ac an ICICI Bank", -140) is None
+    assert match_rule(matcher, "UPI adimuthani rent ac an ICICI Bank", 1409) is None
+    # Substrings are case-insensitive, modes come from the first word
+    assert match_rule(matcher, "UPI AMAZON IND amazonupi@apl", -153) == "Shopping"
+    assert match_rule(matcher, "ACH TP ACH INDIANESIGN ICIC7030808246000361", -4000) == "Bills"
+    assert match_rule(matcher, "NEFT ACME PAYROLL", 50000) == "Income"
+    assert match_rule(matcher, "", 10) is None
+
+
+def test_mode_of_statement_descriptions():
+    assert transaction_mode(NEFT_DEPOSIT) == "NEFT"
+    assert transaction_mode(IMPS_DEPOSIT) == "IMPS"
+    assert transaction_mode("MMT/IMPS/523213661112/dad/VELUSAMY K/BARB0SENJER") == "IMPS"
+    assert transaction_mode("UPI/Saravanan/paytmqr6b1nv5@/breakfast/YES BANK") == "UPI"
+    assert transaction_mode("BIL INFT EFE1480349  ATHISH T") == "BIL"
+
+    matcher = compile_rules(load_rules(EXAMPLE_RULES))
+    assert match_rule(matcher, NEFT_DEPOSIT, Decimal("25000.00")) == "Income"
+    assert match_rule(matcher, IMPS_DEPOSIT, Decimal("5000.00")) == "Income"
+
+
+def test_first_matching_rule_wins():
+    matcher = compile_rules([
+        {"category": "Rent", "contains": "rent", "min_amount": 1000},
+        {"category": "Food", "contains": "parent"},
+        {"category": "Other", "mode": "UPI"},
+    ])
+    assert match_rule(matcher, "UPI parent", -5000) == "Rent"
+    assert match_rule(matcher, "UPI parent", -50) == "Food"
+    assert match_rule(matcher, "UPI shop", -50) == "Other"
+
+
+def test_compiled_matcher_agrees_with_rule_by_rule():
+    rng = random.Random(7)
+    rules = [
+        {"category": str(i), "contains": [''.join(rng.choice("abc") for _ in range(rng.randint(1, 4)))],
+         "max_amount": rng.choice([None, 50])}
+        for i in range(40)
+    ]
+    transactions = [
+        (''.join(rng.choice("abc ") for _ in range(20)), Decimal(-rng.randint(1, 100)))
+        for _ in range(300)
+    ]
+
+    def rule_by_rule(description, amount):
+        for rule in rules:
+            if rule['contains'][0] in description and (rule['max_amount'] is None or abs(amount) <= 50):
+                return rule['category']
+        return None
+
+    expected = [rule_by_rule(description, amount) for description, amount in transactions]
+    assert categorize_all(compile_rules(rules), transactions) == expected
+
+
+@pytest.mark.parametrize("rule", [
+    {"contains": "x"},
+    {"category": "Food", "keyword": "x"},
+    {"category": "Food", "direction": "in"},
+    {"category": "Food", "regex": "("},
+])
+def test_invalid_rules(rule):
+    with pytest.raises(ValueError):
+        compile_rules([rule])
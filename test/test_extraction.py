@@ -1,15 +1,17 @@
 #!/usr/bin/env python3
 """Quick test of transaction extraction"""
 
-from pdf_reader_ocr import extract_text_from_pdf
+from pdf_reader_ocr import StatementDocument
 
 pdf_path = "pdfs/aug_2025.pdf"
 password = "guru2111"
 
-pages_text = extract_text_from_pdf(pdf_path, password)
+# Only the first page is decoded
+with StatementDocument(pdf_path, password) as pages_text:
+    first_page = pages_text[0]
 
 # Print first page to see the structure
 print("=== FIRST PAGE TEXT (first 100 lines) ===\n")
-lines = pages_text[0].split('\n')
+lines = first_page.split('\n')
 for i, line in enumerate(lines[:100], 1):
     print(f"{i:3d}: {line}")
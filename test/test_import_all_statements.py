@@ -0,0 +1,46 @@
+from concurrent.futures import Future
+
+import pytest
+
+import import_all_statements
+
+
+def test_worker_output_is_returned_with_the_parse(monkeypatch):
+    def parse_statement(pdf_path, password):
+        print("Page 3: ⚠️  Total: mismatch")
+        return {'transactions': []}
+
+    monkeypatch.setattr(import_all_statements, "parse_statement", parse_statement)
+
+    parsed, output = import_all_statements.parse_statement_captured("aug.pdf", "secret")
+    assert parsed == {'transactions': []}
+    assert output == "Page 3: ⚠️  Total: mismatch\n"
+
+
+def test_pool_is_shut_down_when_the_budget_cannot_be_opened(tmp_path, monkeypatch):
+    pools = []
+
+    class Pool:
+        def __init__(self, max_workers):
+            self.cancelled = None
+            pools.append(self)
+
+        def submit(self, func, *args):
+            return Future()
+
+        def shutdown(self, cancel_futures=False):
+            self.cancelled = cancel_futures
+
+    def open_actual():
+        raise ConnectionError("server down")
+
+    for filename in import_all_statements.PDF_ORDER:
+        (tmp_path / filename).write_bytes(b"%PDF-1.4")
+    monkeypatch.setattr(import_all_statements, "PDFS_DIR", str(tmp_path))
+    monkeypatch.setattr(import_all_statements, "ProcessPoolExecutor", Pool)
+    monkeypatch.setattr(import_all_statements, "open_actual", open_actual)
+    monkeypatch.setattr("builtins.input", lambda prompt: "yes")
+
+    with pytest.raises(ConnectionError):
+        import_all_statements.import_all_pdfs(jobs=2)
+    assert pools[0].cancelled is True
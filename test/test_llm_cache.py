@@ -0,0 +1,59 @@
+import sqlite3
+from decimal import Decimal
+
+import llm_cache
+import pdf_reader_ocr
+
+
+def test_put_get_and_counters(tmp_path):
+    db = tmp_path / "llm.sqlite"
+    llm_cache.reset_stats()
+    key = llm_cache.make_key("qwen2.5:7b", 1, "Total:\n0.00\n75,491.00\n38,574.80")
+
+    assert llm_cache.get(key, path=db) is None
+    llm_cache.put(key, {"deposits": 0.0, "withdrawals": 75491.0, "balance": 38574.8}, path=db)
+    assert llm_cache.get(key, path=db)["withdrawals"] == 75491.0
+
+    assert llm_cache.get_stats()["hits"] == 1
+    assert llm_cache.get_stats()["misses"] == 1
+
+
+def test_key_depends_on_model_prompt_and_text():
+    base = llm_cache.make_key("qwen2.5:7b", 1, "page")
+    assert llm_cache.make_key("llama3", 1, "page") != base
+    assert llm_cache.make_key("qwen2.5:7b", 2, "page") != base
+    assert llm_cache.make_key("qwen2.5:7b", 1, "other page") != base
+
+
+def test_ttl_and_lru_eviction(tmp_path):
+    db = tmp_path / "llm.sqlite"
+    llm_cache.put("a", 1, path=db)
+    assert llm_cache.get("a", path=db, ttl=-1) is None
+
+    for key in ["a", "b", "c"]:
+        llm_cache.put(key, key, path=db, max_entries=2)
+    assert llm_cache.get("a", path=db) is None
+    assert llm_cache.get("c", path=db) == "c"
+
+
+def test_cache_errors_do_not_change_llm_results(monkeypatch):
+    def locked(*args, **kwargs):
+        raise sqlite3.OperationalError("database is locked")
+
+    class Response:
+        status_code = 200
+
+        def json(self):
+            return {"response": '{"deposits": 6104.00, "withdrawals": 5367.00, "balance": 650476.05}'}
+
+    class Session:
+        def post(self, *args, **kwargs):
+            return Response()
+
+    monkeypatch.setattr(llm_cache, "get", locked)
+    monkeypatch.setattr(llm_cache, "put", locked)
+    monkeypatch.setattr(pdf_reader_ocr, "get_http_session", Session)
+
+    totals = pdf_reader_ocr.extract_transactions_with_llm("Total:", 1)
+    assert totals == {"deposits": Decimal("6104.0"), "withdrawals": Decimal("5367.0"),
+                      "balance": Decimal("650476.05")}
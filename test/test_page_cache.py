@@ -0,0 +1,46 @@
+import os
+
+import page_cache
+
+
+def test_round_trip(tmp_path):
+    pdf = tmp_path / "statement.pdf"
+    pdf.write_bytes(b"%PDF-1.4 fake statement")
+    cache_dir = tmp_path / "cache"
+
+    key = page_cache.cache_key(pdf, "secret", version=1)
+    assert page_cache.load_pages(key, cache_dir) is None
+
+    pages = ["page one ₹1,000.00", "page two"]
+    page_cache.store_pages(key, pages, cache_dir)
+    assert page_cache.load_pages(key, cache_dir) == pages
+
+
+def test_entries_are_private(tmp_path):
+    cache_dir = tmp_path / "cache"
+    cache_dir.mkdir(mode=0o755)
+
+    page_cache.store_pages("key", ["decrypted statement text"], cache_dir)
+
+    assert cache_dir.stat().st_mode & 0o777 == 0o700
+    entry = cache_dir / f"key{page_cache.CACHE_SUFFIX}"
+    assert entry.stat().st_mode & 0o777 == 0o600
+
+
+def test_key_changes_with_password_and_version(tmp_path):
+    pdf = tmp_path / "statement.pdf"
+    pdf.write_bytes(b"%PDF-1.4 fake statement")
+
+    base = page_cache.cache_key(pdf, "secret", version=1)
+    assert page_cache.cache_key(pdf, "other", version=1) != base
+    assert page_cache.cache_key(pdf, "secret", version=2) != base
+
+
+def test_eviction_keeps_cache_bounded(tmp_path):
+    cache_dir = tmp_path / "cache"
+    for i in range(5):
+        page_cache.store_pages(f"key{i}", [os.urandom(1000).hex()], cache_dir, max_bytes=2500)
+
+    remaining = list(cache_dir.glob(f"*{page_cache.CACHE_SUFFIX}"))
+    assert len(remaining) < 5
+    assert page_cache.load_pages("key4", cache_dir) is not None
@@ -0,0 +1,105 @@
+from decimal import Decimal
+
+from pdf_reader_ocr import extract_page_totals, parse_page_totals
+
+PAGE_TEXT = """01-08-2025 
+UPI/AL TAJ RES/paytmqr6ieh4q@/dinner/YES BANK 
+60.00
+6,50,476.05
+Total:
+6,104.00
+5,367.00
+6,50,476.05
+Page 1 of 7 M-65382453-14580
+"""
+
+
+def test_parse_total_row():
+    assert parse_page_totals(PAGE_TEXT) == {
+        "deposits": Decimal("6104.00"),
+        "withdrawals": Decimal("5367.00"),
+        "balance": Decimal("650476.05")
+    }
+
+
+def test_parse_total_row_on_one_line():
+    totals = parse_page_totals("Total: 0.00 75,491.00 38,574.80\n")
+    assert totals == {"deposits": Decimal("0"), "withdrawals": Decimal("75491"), "balance": Decimal("38574.80")}
+
+
+def test_incomplete_total_row():
+    assert parse_page_totals("Total:\n6,104.00\n\nPage 1 of 7\n") is None
+    assert parse_page_totals("no totals here") is None
+
+
+def test_fast_path_skips_llm(monkeypatch):
+    import pdf_reader_ocr
+
+    def fail(*args, **kwargs):
+        raise AssertionError("LLM should not be called")
+
+    monkeypatch.setattr(pdf_reader_ocr, "extract_transactions_with_llm", fail)
+    assert extract_page_totals(PAGE_TEXT, 1, prev_balance=Decimal("649739.05"))["balance"] == Decimal("650476.05")
+    assert extract_page_totals("no totals here", 2)["balance"] == 0
+
+
+def test_balance_mismatch_falls_back_to_llm(monkeypatch):
+    import pdf_reader_ocr
+
+    calls = []
+    monkeypatch.setattr(
+        pdf_reader_ocr, "extract_transactions_with_llm",
+        lambda text, page_num: calls.append(page_num) or {"deposits": 1.0, "withdrawals": 0.0, "balance": 2.0}
+    )
+    assert extract_page_totals(PAGE_TEXT, 3, prev_balance=Decimal("100.00"))["balance"] == 2.0
+    assert calls == [3]
+
+
+def test_concurrent_llm_fallbacks_keep_page_order(monkeypatch):
+    import time
+    import pdf_reader_ocr
+
+    def fake_llm(text, page_num):
+        time.sleep(0.01 * (5 - page_num))
+        return {"deposits": float(page_num), "withdrawals": 0.0, "balance": 0.0}
+
+    monkeypatch.setattr(pdf_reader_ocr, "extract_transactions_with_llm", fake_llm)
+    pages = ["Total:\nbroken"] * 4 + [PAGE_TEXT]
+    results = pdf_reader_ocr.extract_all_page_totals(pages, max_workers=4)
+
+    assert [r["deposits"] for r in results] == [1.0, 2.0, 3.0, 4.0, 6104.0]
+
+
+def test_verify_page_sums_flags_mismatches(monkeypatch):
+    import pdf_reader_ocr
+
+    def fail(*args, **kwargs):
+        raise AssertionError("LLM should not be called")
+
+    monkeypatch.setattr(pdf_reader_ocr, "extract_transactions_with_llm", fail)
+    pages = [PAGE_TEXT, "Total:\n100.00\n0.00\n6,50,576.05\n", "Page 3 of 3"]
+    sums = [(Decimal("6104.00"), Decimal("5367.00")), (Decimal("90.00"), 0), (0, 0)]
+    assert pdf_reader_ocr.verify_page_sums(pages, sums) == [2]
+
+
+def test_http_session_is_created_once_across_threads(monkeypatch):
+    import time
+    from concurrent.futures import ThreadPoolExecutor
+
+    import pdf_reader_ocr
+
+    created = []
+
+    class SlowSession(pdf_reader_ocr.requests.Session):
+        def __init__(self):
+            created.append(self)
+            time.sleep(0.05)
+            super().__init__()
+
+    monkeypatch.setattr(pdf_reader_ocr, "_http_session", None)
+    monkeypatch.setattr(pdf_reader_ocr.requests, "Session", SlowSession)
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        sessions = list(pool.map(lambda _: pdf_reader_ocr.get_http_session(), range(4)))
+
+    assert len(created) == 1
+    assert all(session is created[0] for session in sessions)
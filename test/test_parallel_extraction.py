@@ -0,0 +1,45 @@
+import pymupdf
+import pytest
+
+import pdf_reader_ocr
+
+
+def make_pdf(path, page_count, password=None):
+    doc = pymupdf.open()
+    for i in range(page_count):
+        page = doc.new_page()
+        page.insert_text((72, 72), f"Page {i + 1}\n01-08-2025\nUPI/Shop {i}\n{i + 1},000.00")
+    if password:
+        doc.save(path, encryption=pymupdf.PDF_ENCRYPT_AES_256, user_pw=password, owner_pw=password)
+    else:
+        doc.save(path)
+    doc.close()
+
+
+def test_page_ranges(monkeypatch):
+    monkeypatch.setattr(pdf_reader_ocr, "MIN_PAGES_PER_WORKER", 4)
+
+    assert pdf_reader_ocr.page_ranges(10, 3) == [(0, 5), (5, 10)]
+    assert pdf_reader_ocr.page_ranges(13, 3) == [(0, 5), (5, 9), (9, 13)]
+    assert pdf_reader_ocr.page_ranges(3, 4) == [(0, 3)]
+    assert pdf_reader_ocr.page_ranges(0, 4) == [(0, 0)]
+
+
+def test_parallel_matches_sequential(tmp_path, monkeypatch):
+    monkeypatch.setattr(pdf_reader_ocr, "MIN_PAGES_PER_WORKER", 2)
+    pdf = tmp_path / "statement.pdf"
+    make_pdf(pdf, 9, password="secret")
+
+    sequential = pdf_reader_ocr.extract_text_from_pdf(pdf, "secret", use_cache=False)
+    parallel = pdf_reader_ocr.extract_text_from_pdf(pdf, "secret", use_cache=False, workers=3)
+
+    assert parallel == sequential
+    assert [text.split('\n')[0] for text in parallel] == [f"Page {i}" for i in range(1, 10)]
+
+
+def test_parallel_requires_password(tmp_path):
+    pdf = tmp_path / "statement.pdf"
+    make_pdf(pdf, 2, password="secret")
+
+    with pytest.raises(RuntimeError):
+        pdf_reader_ocr.extract_text_parallel(pdf, "wrong", workers=2)
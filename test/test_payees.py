@@ -0,0 +1,41 @@
+from payees import build_payee_index, canonical_payee, is_reference, normalize_payee
+
+
+def test_normalize_upi_payees():
+    # Named merchant: reference number, transaction id and VPA are dropped
+    assert normalize_payee(
+        "UPI/Saravanan/paytmqr6b1nv5@/breakfast/YES BANK L/557990293283/ICI78ebc618100f42d198d26322370c26e2/"
+    ) == "Saravanan"
+    # Bare VPA payments keep the VPA without its @bank handle, however it was truncated
+    assert normalize_payee("UPI/q491322409@ybl/tea/YES BANK LIMITE/513980860213/ICI728f51c8e1d745e4a/") == "q491322409"
+    assert normalize_payee("UPI/paytmqr6b1nv5@p/Doda breakfast/YES BANK LIMITE/513930511607/ICIfc79/") == \
+        normalize_payee("UPI/paytmqr6b1nv5@/lunch/YES BANK LIMITE/513930511608/ICIfc80/")
+    assert normalize_payee("UPI/adimuthanikatt-/lunch/ICICI Bank/514017287331/ICI15e39374f1bc4515bd/") == \
+        "adimuthanikatt"
+
+
+def test_normalize_other_modes():
+    assert normalize_payee("ACH/TP ACH INDIANESIGN/ICIC7030808246000361/1894349061") == "TP ACH INDIANESIGN"
+    assert normalize_payee(
+        "NEFT-SBINN52025102182321259-MUTHOOT CAPITAL SERVICES LIMITED-/ATTN//INB-00000032061104604-"
+    ) == "MUTHOOT CAPITAL SERVICES LIMITED"
+    assert normalize_payee("INF/INFT/042460380281/Salary/RAPYUTA ROBOTIC") == "RAPYUTA ROBOTIC"
+    assert normalize_payee("MMT/IMPS/523213661112/dad/VELUSAMY K/BARB0SENJER") == "VELUSAMY K"
+    assert normalize_payee("803301500189:Int.Pd:29-03-2025 to 29-06-2025") == "Interest"
+    # Slashes already replaced by spaces
+    assert normalize_payee("UPI MADURA CAF maduracafeandj 521450760299 ICI870c905f625849edb4") == "MADURA CAF maduracafeandj"
+    assert normalize_payee("") == "Transaction"
+
+
+def test_is_reference():
+    for field in ["paytmqr6b1nv5@", "557990293283", "gpay-112505162", "ICIC7030808246000361", "29-06-2025"]:
+        assert is_reference(field)
+    for field in ["Saravanan", "AL TAJ RES", "breakfast", "Mr KARTHIC"]:
+        assert not is_reference(field)
+
+
+def test_payee_index_keeps_first_spelling():
+    index = build_payee_index(["Madura Caf"])
+    assert canonical_payee(index, "MADURA  CAF") == "Madura Caf"
+    assert canonical_payee(index, "Saravanan") == "Saravanan"
+    assert canonical_payee(index, "SARAVANAN") == "Saravanan"
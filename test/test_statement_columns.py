@@ -0,0 +1,178 @@
+from decimal import Decimal
+
+import pymupdf
+import pytest
+
+import import_detailed
+import statement_columns
+from statement_columns import detect_columns, find_header, page_spans, parse_page, parse_statement_columns
+
+FONT_SIZE = 7
+HEADERS = [("DATE", 37), ("MODE", 77), ("PARTICULARS", 144), ("DEPOSITS", 373), ("WITHDRAWALS", 432), ("BALANCE", 527)]
+# Amounts are right-aligned under their header
+RIGHT_EDGES = {"deposit": 407, "withdrawal": 486, "balance": 559}
+
+
+def put(page, x, y, text):
+    page.insert_text((x, y), text, fontsize=FONT_SIZE)
+
+
+def put_amount(page, column, y, text):
+    put(page, RIGHT_EDGES[column] - pymupdf.get_text_length(text, fontsize=FONT_SIZE), y, text)
+
+
+@pytest.fixture(autouse=True)
+def fresh_layouts(monkeypatch):
+    # Layouts calibrated by one test must not be reused by the next
+    monkeypatch.setattr(statement_columns, "_layouts", {})
+
+
+def make_statement(path, shift=0, headers=HEADERS):
+    doc = pymupdf.open()
+    page = doc.new_page()
+    put(page, 37, 80, "ACCOUNT BALANCE")
+    put_amount(page, "deposit", 90, "9,99,999.00")
+    for name, x in headers:
+        put(page, x + shift, 120, name)
+
+    put(page, 35, 135, "01-08-2025")
+    put(page, 144, 135, "B/F")
+    put_amount(page, "balance", 135, "6,49,739.05")
+
+    # Particulars wrap above and below the date line
+    put(page, 144, 146, "UPI/Saravanan/paytmqr6b1nv5@/breakfast/YES BANK")
+    put(page, 35, 150, "01-08-2025")
+    put_amount(page, "withdrawal", 150, "45.00")
+    put_amount(page, "balance", 150, "6,49,694.05")
+    put(page, 144, 155, "L/521620223991/ICIa541aaa73fed4dd4994e13")
+
+    # Date and mode printed in one span
+    put(page, 35, 172, "02-08-2025 NET BANKING")
+    put(page, 144, 172, "NEFT-HDFCN52025101743471716-ACME PAYROLL")
+    put_amount(page, "deposit", 172, "1,00,000.00")
+    put_amount(page, "balance", 172, "7,49,694.05")
+
+    put(page, 141, 190, "Total:")
+    put_amount(page, "deposit", 190, "1,00,000.00")
+    put_amount(page, "withdrawal", 190, "45.00")
+    put_amount(page, "balance", 190, "7,49,694.05")
+
+    doc.new_page()  # terms and conditions page without a table
+    doc.save(path)
+    doc.close()
+
+
+def test_detect_columns(tmp_path):
+    make_statement(tmp_path / "statement.pdf")
+    doc = pymupdf.open(tmp_path / "statement.pdf")
+
+    columns = detect_columns(page_spans(doc[0]))
+    assert columns['names'] == [name for name, _ in HEADERS]
+    assert columns['fields'] == [None, None, 'description_parts', 'deposit', 'withdrawal', 'balance']
+    assert detect_columns(page_spans(doc[1])) is None
+    doc.close()
+
+
+def test_parse_page_reads_columns(tmp_path):
+    make_statement(tmp_path / "statement.pdf")
+    doc = pymupdf.open(tmp_path / "statement.pdf")
+    page = parse_page(page_spans(doc[0]))
+    doc.close()
+
+    bf, breakfast, salary = page['rows']
+    assert bf['marker'] == 'B/F' and bf['balance'] == Decimal("649739.05")
+    assert breakfast['withdrawal'] == Decimal("45.00") and breakfast['deposit'] is None
+    assert breakfast['description_parts'] == ["UPI/Saravanan/paytmqr6b1nv5@/breakfast/YES BANK",
+                                              "L/521620223991/ICIa541aaa73fed4dd4994e13"]
+    assert salary['date'] == "02-08-2025"
+    assert salary['deposit'] == Decimal("100000.00")
+    assert page['totals'] == {'deposits': Decimal("100000.00"), 'withdrawals': Decimal("45.00"),
+                              'balance': Decimal("749694.05")}
+
+
+def test_parse_statement_columns(tmp_path):
+    make_statement(tmp_path / "statement.pdf")
+
+    parsed = parse_statement_columns(tmp_path / "statement.pdf")
+
+    assert parsed['mismatched_pages'] == []
+    assert [t.amount for t in parsed['transactions']] == [Decimal("-45.00"), Decimal("100000.00")]
+    assert parsed['transactions'][0].payee == "Saravanan"
+    assert parsed['summary'] == {
+        'starting_balance': Decimal("649739.05"),
+        'total_deposits': Decimal("100000.00"),
+        'total_withdrawals': Decimal("45.00"),
+        'final_balance': Decimal("749694.05")
+    }
+
+
+def test_layouts_are_calibrated_once_per_template(tmp_path):
+    make_statement(tmp_path / "statement.pdf")
+    make_statement(tmp_path / "shifted.pdf", shift=10)
+    doc = pymupdf.open(tmp_path / "statement.pdf")
+    shifted = pymupdf.open(tmp_path / "shifted.pdf")
+
+    columns = detect_columns(page_spans(doc[0]))
+    assert list(statement_columns._layouts) == [columns['fingerprint']]
+    # A known template is found at its calibrated position
+    assert find_header(page_spans(doc[0]), columns) == columns['y']
+    assert detect_columns(page_spans(doc[0]))['fingerprint'] == columns['fingerprint']
+    assert len(statement_columns._layouts) == 1
+
+    # A different template is calibrated and cached separately
+    assert find_header(page_spans(shifted[0]), columns) is None
+    other = detect_columns(page_spans(shifted[0]))
+    assert other['fingerprint'] != columns['fingerprint']
+    assert other['lefts'][0] == columns['lefts'][0] + 10
+    assert len(statement_columns._layouts) == 2
+    doc.close()
+    shifted.close()
+
+
+def test_reordered_middle_columns_are_a_new_template(tmp_path):
+    swapped = HEADERS[:3] + [("WITHDRAWALS", 373), ("DEPOSITS", 432)] + HEADERS[5:]
+    make_statement(tmp_path / "statement.pdf")
+    make_statement(tmp_path / "swapped.pdf", headers=swapped)
+
+    parse_statement_columns(tmp_path / "statement.pdf")
+    doc = pymupdf.open(tmp_path / "swapped.pdf")
+    columns = detect_columns(page_spans(doc[0]))
+    doc.close()
+
+    # DATE and BALANCE sit where the standard template has them
+    assert columns['names'] == [name for name, _ in swapped]
+    salary = parse_statement_columns(tmp_path / "swapped.pdf")['transactions'][1]
+    assert salary.withdrawal == Decimal("100000.00") and salary.deposit == 0
+
+
+def test_numpy_bucketing_matches_python(tmp_path, monkeypatch):
+    pytest.importorskip("numpy")
+    make_statement(tmp_path / "statement.pdf")
+    doc = pymupdf.open(tmp_path / "statement.pdf")
+    spans = page_spans(doc[0])
+    doc.close()
+    columns = detect_columns(spans)
+
+    assert statement_columns._bucket_spans_numpy(spans, columns) == \
+        statement_columns._bucket_spans_python(spans, columns)
+    expected = parse_page(spans, columns)
+    monkeypatch.setattr(statement_columns, "NUMPY_MIN_SPANS", 0)
+    assert parse_page(spans, columns) == expected
+
+
+def test_column_import_falls_back_to_text_on_mismatched_pages(tmp_path, monkeypatch):
+    make_statement(tmp_path / "statement.pdf")
+    pdf_path = str(tmp_path / "statement.pdf")
+    assert import_detailed.parse_statement(pdf_path, columns=True)['transactions'][0].page == 1
+
+    columns_result = parse_statement_columns(pdf_path)
+    monkeypatch.setattr(import_detailed, "parse_statement_columns", lambda *args: dict(columns_result,
+                                                                                       mismatched_pages=[1]))
+    monkeypatch.setattr(import_detailed, "extract_text_from_pdf", lambda *args, **kwargs: ["page text"])
+    monkeypatch.setattr(import_detailed, "process_bank_statement",
+                        lambda *args, **kwargs: {'starting_balance': Decimal("1.00")})
+    monkeypatch.setattr(import_detailed, "parse_individual_transactions", lambda pages_text, balance: ["text row"])
+
+    parsed = import_detailed.parse_statement(pdf_path, columns=True)
+    assert parsed['transactions'] == ["text row"]
+    assert parsed['summary'] == {'starting_balance': Decimal("1.00")}
@@ -0,0 +1,77 @@
+from decimal import Decimal
+
+import pymupdf
+import pytest
+
+import page_cache
+import pdf_reader_ocr
+from pdf_reader_ocr import StatementDocument, find_starting_balance, probe_starting_balance
+
+
+def make_pdf(path, page_count):
+    doc = pymupdf.open()
+    for i in range(page_count):
+        page = doc.new_page()
+        text = "DATE\n01-08-2025\nB/F\n6,49,739.05" if i == 0 else f"Page {i + 1}"
+        page.insert_text((72, 72), text)
+    doc.save(path)
+    doc.close()
+
+
+def test_probe_decodes_first_page_only(tmp_path):
+    pdf = tmp_path / "statement.pdf"
+    make_pdf(pdf, 12)
+
+    with StatementDocument(pdf, use_cache=False) as document:
+        assert len(document) == 12
+        assert find_starting_balance(document[0]) == Decimal("649739.05")
+        assert document.pages_decoded == 1
+
+    assert probe_starting_balance(pdf, min_balance=100000) == Decimal("649739.05")
+    assert probe_starting_balance(pdf, min_balance=1000000) == Decimal("0.00")
+
+
+def test_pages_match_eager_extraction(tmp_path):
+    pdf = tmp_path / "statement.pdf"
+    make_pdf(pdf, 5)
+    pages_text = pdf_reader_ocr.extract_text_from_pdf(pdf, use_cache=False)
+
+    document = StatementDocument(pdf, use_cache=False)
+    assert list(document) == pages_text
+    assert document[-1] == pages_text[-1]
+    assert document[1:3] == pages_text[1:3]
+    with pytest.raises(IndexError):
+        document[5]
+    document.close()
+
+
+def test_lru_keeps_recent_pages(tmp_path):
+    pdf = tmp_path / "statement.pdf"
+    make_pdf(pdf, 6)
+
+    with StatementDocument(pdf, use_cache=False, cache_size=2) as document:
+        document[0]
+        document[1]
+        document[0]
+        assert document.pages_decoded == 2
+        # Page 1 is the least recently used, so page 2 evicts it
+        document[2]
+        document[0]
+        assert document.pages_decoded == 3
+        document[1]
+        assert document.pages_decoded == 4
+
+
+def test_full_pass_fills_page_cache(tmp_path, monkeypatch):
+    pdf = tmp_path / "statement.pdf"
+    make_pdf(pdf, 3)
+    stored = {}
+    monkeypatch.setattr(page_cache, "load_pages", lambda key: stored.get(key))
+    monkeypatch.setattr(page_cache, "store_pages", lambda key, pages_text: stored.update({key: pages_text}))
+
+    pages_text = list(StatementDocument(pdf))
+    assert list(stored.values()) == [pages_text]
+
+    document = StatementDocument(pdf)
+    assert list(document) == pages_text
+    assert document.pages_decoded == 0
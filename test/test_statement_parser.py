@@ -0,0 +1,102 @@
+from decimal import Decimal
+from itertools import chain
+
+from import_detailed import iter_transactions
+from statement_parser import AMOUNTS, BLANK, DATE, MARKER, TEXT, ZERO, Transaction, classify_line, parse_rows
+
+PAGE_TEXT = """DATE
+BALANCE
+01-08-2025 
+B/F
+ 
+6,49,739.05
+01-08-2025 
+ACH/TP ACH 
+INDIANESIGN/ICIC7030808246000361/1894349061
+4,000.00
+6,45,739.05
+01-08-2025 
+UPI/YANAMALA A/aravindy1605-1/UPI/ICICI 
+Bank/557915589818/ICIdb35baf18e3841ef95ce8e14f86434bf
+6,104.00
+ 
+6,51,798.05
+01-08-2025 
+Total:
+6,104.00
+4,000.00
+6,51,798.05
+"""
+
+
+def test_classify_line():
+    assert classify_line("") == (BLANK, "")
+    assert classify_line("B/F") == (MARKER, "B/F")
+    assert classify_line("Total:") == (MARKER, "Total:")
+    assert classify_line("01-08-2025") == (DATE, "01-08-2025")
+    assert classify_line("6,49,739.05") == (AMOUNTS, [Decimal("649739.05")])
+    assert classify_line("UPI/vyapar.1727294/biscuit") == (TEXT, "UPI/vyapar.1727294/biscuit")
+
+
+def test_parse_rows():
+    rows = list(parse_rows(PAGE_TEXT))
+
+    assert [row['marker'] for row in rows] == ['B/F', None, None]
+    assert rows[0]['amounts'] == [Decimal("649739.05")]
+    assert rows[1]['amounts'] == [Decimal("4000.00"), Decimal("645739.05")]
+    assert rows[1]['description_parts'] == ["ACH/TP ACH", "INDIANESIGN/ICIC7030808246000361/1894349061"]
+    # Blank lines between the amount and the balance do not end the row
+    assert rows[2]['amounts'] == [Decimal("6104.00"), Decimal("651798.05")]
+
+
+def test_iter_transactions_streams_pages():
+    def pages():
+        yield PAGE_TEXT
+        raise AssertionError("second page should not be decoded yet")
+
+    transactions = iter_transactions(pages())
+    first = next(transactions)
+    # Opening balance comes from the B/F row when none is given
+    assert first.withdrawal == Decimal("4000.00")
+    # Balance arithmetic is exact
+    assert next(transactions).deposit == Decimal("6059.00")
+
+
+NEXT_STATEMENT_TEXT = """01-10-2025 
+B/F
+ 
+5,00,000.00
+01-10-2025 
+UPI/Saravanan/paytmqr6b1nv5@/breakfast/YES BANK 
+100.00
+4,99,900.00
+"""
+
+
+def test_statements_stream_from_their_own_brought_forward_balance():
+    decoded = []
+
+    def pages(name, text):
+        decoded.append(name)
+        yield text
+
+    # September is missing, so October's B/F differs from August's closing balance
+    statements = [pages("aug", PAGE_TEXT), pages("oct", NEXT_STATEMENT_TEXT)]
+    transactions = chain.from_iterable(iter_transactions(statement) for statement in statements)
+
+    assert [txn.date for txn in [next(transactions), next(transactions)]] == ["01-08-2025", "01-08-2025"]
+    assert decoded == ["aug"]
+    october = next(transactions)
+    assert decoded == ["aug", "oct"]
+    assert october.withdrawal == Decimal("100.00") and october.deposit == ZERO
+    assert october.balance == Decimal("499900.00")
+
+
+def test_transaction_record():
+    txn = Transaction(date="01-08-2025", description="UPI Saravanan", withdrawal=Decimal("45.00"),
+                      balance=Decimal("645694.05"))
+
+    assert txn.amount == Decimal("-45.00")
+    assert txn.deposit == ZERO
+    # Slotted: no per-row __dict__
+    assert not hasattr(txn, '__dict__')
@@ -5,8 +5,15 @@ This script will assign all uncategorized transactions with "Imported from bank
 in their notes to the "General" category.
 """
 
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
 from actual import Actual
-from actual.queries import get_transactions, get_categories
+from actual.queries import get_categories
+
+from budget_queries import get_account_transactions, get_name_ids  # noqa: E402
 
 # Configuration
 ACTUAL_SERVER_URL = "http://localhost:5006"
@@ -26,44 +33,36 @@ def categorize_imported_transactions():
         password=ACTUAL_PASSWORD,
         file=ACTUAL_FILE
     ) as actual:
-        # Get all transactions
-        transactions = get_transactions(actual.session)
-        
-        # Get categories
-        categories = get_categories(actual.session)
-        
         # Find "General" category or first available category
-        target_category = None
-        for cat in categories:
-            if cat.name in ['General', 'general', 'Usual Expenses']:
-                target_category = cat
-                break
+        category_ids = get_name_ids(actual.session, 'categories')
+        target_name = next((name for name in ['General', 'general', 'Usual Expenses'] if name in category_ids), None)
+        target_category_id = category_ids.get(target_name)
         
-        if not target_category and categories:
+        if not target_category_id:
             # Use first available expense category
-            for cat in categories:
+            for cat in get_categories(actual.session):
                 if not cat.is_income:
-                    target_category = cat
+                    target_name, target_category_id = cat.name, cat.id
                     break
         
-        if not target_category:
+        if not target_category_id:
             print("❌ No suitable category found!")
             print("   Please create a 'General' category in ActualBudget first.")
             return
         
-        print(f"✓ Using category: {target_category.name}")
+        print(f"✓ Using category: {target_name}")
         
         # Find imported transactions (those with our note and no category)
+        transactions = get_account_transactions(
+            actual.session, uncategorized=True, notes_contains="Imported from bank statement"
+        )
         imported_count = 0
         updated_count = 0
         
         for txn in transactions:
-            # Check if it's an imported transaction without category
-            if (txn.notes and "Imported from bank statement" in txn.notes 
-                and txn.category_id is None):
-                imported_count += 1
-                txn.category_id = target_category.id
-                updated_count += 1
+            imported_count += 1
+            txn.category_id = target_category_id
+            updated_count += 1
         
         if updated_count > 0:
             print(f"\n📝 Categorizing {updated_count} transactions...")
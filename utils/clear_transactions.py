@@ -1,21 +1,50 @@
 #!/usr/bin/env python3
 """
-Clear all transactions from ActualBudget account.
+Clear transactions from the ActualBudget account, all of them or a date range.
+
+Usage:
+    python utils/clear_transactions.py [--from YYYY-MM-DD] [--to YYYY-MM-DD]
 """
 
+import argparse
+import sys
+from datetime import datetime
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
 from actual import Actual
-from actual.queries import get_transactions, get_account
+from actual.queries import get_account
+
+from budget_queries import count_account_transactions, tombstone_account_transactions  # noqa: E402
 
 ACTUAL_SERVER_URL = "http://localhost:5006"
 ACTUAL_PASSWORD = "guru123"
 ACTUAL_FILE = "My Finances"
 ACTUAL_ACCOUNT_NAME = "icici"
 
-def clear_all_transactions():
-    """Delete all transactions from the account."""
+def describe_range(start_date=None, end_date=None):
+    """Describe the transactions a date range selects, e.g. for the confirmation prompt."""
+    if start_date and end_date:
+        return f"transactions from {start_date} to before {end_date}"
+    if start_date:
+        return f"transactions from {start_date} onwards"
+    if end_date:
+        return f"transactions before {end_date}"
+    return "ALL transactions"
+
+def clear_all_transactions(start_date=None, end_date=None):
+    """
+    Delete the account's transactions, all of them or those in a date range.
+    
+    Args:
+        start_date: Only delete transactions on or after this date
+        end_date: Only delete transactions before this date
+    """
+    scope = describe_range(start_date, end_date)
     
     print("=" * 60)
-    print("   CLEARING ALL TRANSACTIONS")
+    print(f"   CLEARING {scope.upper()}")
     print("=" * 60)
     
     try:
@@ -32,44 +61,32 @@ def clear_all_transactions():
             
             print(f"✓ Found account: {ACTUAL_ACCOUNT_NAME} (ID: {account.id})")
             
-            # Get all transactions for this account
-            all_transactions = get_transactions(actual.session)
-            print(f"✓ Total transactions in database: {len(all_transactions)}")
-            
-            # Debug: check first transaction attributes
-            if all_transactions:
-                sample = all_transactions[0]
-                print(f"✓ Sample transaction attributes: {dir(sample)}")
-                print(f"✓ Sample transaction account field: {getattr(sample, 'acct', 'N/A')}")
+            # Count the transactions in range for this account
+            total = count_account_transactions(
+                actual.session, account.id, start_date=start_date, end_date=end_date, include_parents=True
+            )
             
-            # Filter by account - try both 'account' and 'acct'
-            account_transactions = []
-            for t in all_transactions:
-                if hasattr(t, 'acct') and t.acct == account.id:
-                    account_transactions.append(t)
-                elif hasattr(t, 'account') and t.account == account.id:
-                    account_transactions.append(t)
-            
-            if not account_transactions:
+            if not total:
                 print(f"✓ No transactions to delete for account {ACTUAL_ACCOUNT_NAME}")
                 return
             
-            print(f"\n⚠️  Found {len(account_transactions)} transaction(s) to delete for {ACTUAL_ACCOUNT_NAME}")
+            print(f"\n⚠️  Found {total} transaction(s) to delete for {ACTUAL_ACCOUNT_NAME}")
             
-            # Confirm deletion
-            response = input("\nAre you sure you want to delete ALL transactions? (yes/no): ")
+            # Confirm deletion, naming the range that will actually be affected
+            response = input(f"\nAre you sure you want to delete {scope} ({total})? (yes/no): ")
             if response.lower() != 'yes':
                 print("❌ Cancelled")
                 return
             
-            # Delete each transaction
+            # Tombstone them in batches
             print(f"\n🗑️  Deleting transactions...")
-            for txn in account_transactions:
-                actual.session.delete(txn)
+            deleted = tombstone_account_transactions(
+                actual.session, account.id, start_date=start_date, end_date=end_date
+            )
             
             # Commit changes
             actual.commit()
-            print(f"✅ Successfully deleted {len(account_transactions)} transaction(s)")
+            print(f"✅ Successfully deleted {deleted} transaction(s)")
             print("=" * 60)
             
     except Exception as e:
@@ -77,5 +94,15 @@ def clear_all_transactions():
         import traceback
         traceback.print_exc()
 
+def parse_date_arg(value):
+    """Parse a YYYY-MM-DD command line date."""
+    return datetime.strptime(value, '%Y-%m-%d').date()
+
 if __name__ == "__main__":
-    clear_all_transactions()
+    parser = argparse.ArgumentParser(description='Clear transactions from the ActualBudget account')
+    parser.add_argument('--from', dest='start_date', type=parse_date_arg,
+                        help='Only delete transactions on or after this date (YYYY-MM-DD)')
+    parser.add_argument('--to', dest='end_date', type=parse_date_arg,
+                        help='Only delete transactions before this date (YYYY-MM-DD)')
+    args = parser.parse_args()
+    clear_all_transactions(args.start_date, args.end_date)
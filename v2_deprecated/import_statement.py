@@ -33,7 +33,7 @@ def parse_date(date_str: str) -> datetime.date:
         return datetime.date.today()
 
 
-def import_to_actualbudget(pdf_path: str, password: str = None, dry_run: bool = False):
+def import_to_actualbudget(pdf_path: str, password: str = None, dry_run: bool = False, verify: bool = False):
     """Import individual transactions from PDF to ActualBudget."""
     
     print("=" * 80)
@@ -41,7 +41,7 @@ def import_to_actualbudget(pdf_path: str, password: str = None, dry_run: bool =
     print("=" * 80)
     
     # Extract all individual transactions using LLM
-    result = extract_all_transactions_from_pdf(pdf_path, password)
+    result = extract_all_transactions_from_pdf(pdf_path, password, verify=verify)
     
     transactions = result['transactions']
     
@@ -56,8 +56,7 @@ def import_to_actualbudget(pdf_path: str, password: str = None, dry_run: bool =
         print("\n🔍 DRY RUN - Not posting to ActualBudget")
         print("\nFirst 5 transactions:")
         for i, txn in enumerate(transactions[:5], 1):
-            amount = txn['deposit'] if txn['deposit'] > 0 else -txn['withdrawal']
-            print(f"  {i}. {txn['date']} | {txn['description'][:40]} | ₹{amount:,.2f}")
+            print(f"  {i}. {txn.date} | {txn.description[:40]} | ₹{txn.amount:,.2f}")
         return
     
     # Import to ActualBudget
@@ -79,7 +78,7 @@ def import_to_actualbudget(pdf_path: str, password: str = None, dry_run: bool =
             
             # Create opening balance transaction
             if result['starting_balance'] > 0:
-                first_date = parse_date(transactions[0]['date']) if transactions else datetime.date.today()
+                first_date = parse_date(transactions[0].date) if transactions else datetime.date.today()
                 
                 txn = create_transaction(
                     actual.session,
@@ -95,15 +94,12 @@ def import_to_actualbudget(pdf_path: str, password: str = None, dry_run: bool =
             # Create individual transactions
             print(f"\n   Importing {len(transactions)} transactions...")
             for txn_data in transactions:
-                txn_date = parse_date(txn_data['date'])
-                description = txn_data['description'][:100] or "Transaction"
+                txn_date = parse_date(txn_data.date)
+                description = txn_data.description[:100] or "Transaction"
                 
-                # Determine amount (positive for deposits, negative for withdrawals)
-                if txn_data['deposit'] > 0:
-                    amount = decimal.Decimal(str(txn_data['deposit']))
-                elif txn_data['withdrawal'] > 0:
-                    amount = decimal.Decimal(str(-txn_data['withdrawal']))
-                else:
+                # Amount is positive for deposits, negative for withdrawals
+                amount = txn_data.amount
+                if not amount:
                     continue  # Skip zero-amount transactions
                 
                 txn = create_transaction(
@@ -111,7 +107,7 @@ def import_to_actualbudget(pdf_path: str, password: str = None, dry_run: bool =
                     txn_date,
                     account,
                     description,
-                    notes=f"Page {txn_data['page']} | Balance: ₹{txn_data['balance']:,.2f}",
+                    notes=f"Page {txn_data.page} | Balance: ₹{txn_data.balance:,.2f}",
                     amount=amount
                 )
                 transactions_created += 1
@@ -132,6 +128,7 @@ def main():
     parser.add_argument('pdf_file', help='Path to PDF bank statement')
     parser.add_argument('--password', '-p', default=PDF_PASSWORD, help='PDF password')
     parser.add_argument('--dry-run', '-d', action='store_true', help="Don't post to ActualBudget")
+    parser.add_argument('--verify', action='store_true', help="Cross-check parsed transactions against page totals")
     
     args = parser.parse_args()
     
@@ -139,7 +136,7 @@ def main():
         print(f"❌ File not found: {args.pdf_file}")
         sys.exit(1)
     
-    import_to_actualbudget(args.pdf_file, password=args.password, dry_run=args.dry_run)
+    import_to_actualbudget(args.pdf_file, password=args.password, dry_run=args.dry_run, verify=args.verify)
 
 
 if __name__ == "__main__":